@@ -0,0 +1,103 @@
+<?php
+
+namespace App\Http\Controllers;
+
+use Illuminate\Contracts\Debug\ExceptionHandler;
+use Illuminate\Http\JsonResponse;
+use Illuminate\Http\Request;
+use Illuminate\Routing\Router;
+use Illuminate\Support\Facades\Facade;
+use Symfony\Component\HttpFoundation\BinaryFileResponse;
+use Symfony\Component\HttpFoundation\Response;
+use Symfony\Component\HttpFoundation\StreamedResponse;
+
+class BatchController extends Controller
+{
+    private const MAX_REQUISICOES = 20;
+
+    /**
+     * Runs several read-only API requests inside this one, so a page that
+     * needs teams, matches and standings pays for one HTTP round trip and
+     * one framework boot instead of one per resource.
+     *
+     * Takes `{"requisicoes": {"<chave>": "/api/..."}}` and answers with
+     * `{"respostas": {"<chave>": {"status": ..., "body": ...}}}`. Each
+     * sub-request goes through its route and middleware like a normal GET,
+     * and a failing one only affects its own entry.
+     */
+    public function __invoke(Request $request, Router $router, ExceptionHandler $handler): JsonResponse
+    {
+        $request->validate([
+            'requisicoes' => 'required|array|min:1|max:' . self::MAX_REQUISICOES,
+            'requisicoes.*' => ['required', 'string', 'starts_with:/api/', 'not_regex:#^/api/batch([/?]|$)#']
+        ]);
+
+        $respostas = [];
+
+        try {
+            foreach ($request->input('requisicoes') as $chave => $url) {
+                $subRequest = Request::create($url, 'GET');
+                $subRequest->headers->set('Accept', 'application/json');
+                $this->usarRequest($subRequest);
+
+                try {
+                    $resposta = $router->dispatch($subRequest);
+                } catch (\Throwable $e) {
+                    // Route matching happens outside the route pipeline, so 404s land here
+                    $resposta = $handler->render($subRequest, $e);
+                }
+
+                $respostas[$chave] = $this->resposta($resposta);
+            }
+        } finally {
+            $this->usarRequest($request);
+        }
+
+        return response()->json(['respostas' => (object) $respostas]);
+    }
+
+    /**
+     * Entry of one sub-response. Bodies are decoded to objects, not arrays, so
+     * `{}` stays an object when the batch is encoded again. Only JSON can be
+     * embedded: streamed, file or other non-JSON responses become a 406 entry
+     * telling the client to request that path on its own.
+     *
+     * @return array{status: int, body: mixed}
+     */
+    private function resposta(Response $resposta): array
+    {
+        $conteudo = $resposta instanceof StreamedResponse || $resposta instanceof BinaryFileResponse
+            ? false
+            : $resposta->getContent();
+
+        if ($conteudo === '') {
+            return ['status' => $resposta->getStatusCode(), 'body' => null];
+        }
+
+        if ($conteudo !== false && str_contains((string) $resposta->headers->get('Content-Type'), 'json')) {
+            try {
+                return [
+                    'status' => $resposta->getStatusCode(),
+                    'body' => json_decode($conteudo, false, 512, JSON_THROW_ON_ERROR)
+                ];
+            } catch (\JsonException) {
+                // Falls through to the rejection below
+            }
+        }
+
+        return [
+            'status' => 406,
+            'body' => ['message' => 'Only JSON responses can be batched; request this path on its own.']
+        ];
+    }
+
+    /**
+     * Controllers resolve `Request` from the container, so the sub-request has
+     * to be the bound instance while it runs.
+     */
+    private function usarRequest(Request $request): void
+    {
+        app()->instance('request', $request);
+        Facade::clearResolvedInstance('request');
+    }
+}
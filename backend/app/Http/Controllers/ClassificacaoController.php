@@ -5,13 +5,45 @@
 use App\Models\Classificacao;
 use App\Models\Partida;
 use Carbon\Carbon;
+use Illuminate\Support\Facades\Cache;
 use Illuminate\Support\Facades\Log;
 use Illuminate\Http\JsonResponse;
 use Illuminate\Http\Request;
 use Illuminate\Support\Facades\DB;
+use Illuminate\Support\Str;
+use Symfony\Component\HttpFoundation\StreamedResponse;
 
 class ClassificacaoController extends Controller
 {
+    private const COMPACT_FIELDS = [
+        'id',
+        'jogos',
+        'pontos',
+        'vitorias',
+        'empates',
+        'derrotas',
+        'gols_pro',
+        'gols_contra',
+        'saldo_gols'
+    ];
+
+    private const EXPORT_FIELDS = [
+        'ano',
+        'data_atualizacao',
+        'time_id',
+        'time',
+        'jogos',
+        'pontos',
+        'vitorias',
+        'empates',
+        'derrotas',
+        'gols_pro',
+        'gols_contra',
+        'saldo_gols'
+    ];
+
+    private const EXPORT_CHUNK = 2000;
+
     public function index(Request $request): JsonResponse
     {
         $request->validate([
@@ -19,85 +51,23 @@ public function index(Request $request): JsonResponse
             'ano' => 'nullable|integer'
         ]);
 
-        $ano = $request->input('ano', Carbon::now()->year);
+        $ano = (int) $request->input('ano', Carbon::now()->year);
         $data = $request->input('data')
             ? Carbon::parse($request->input('data'))
             : Carbon::now();
 
-        $classificacao = DB::table('times')
-            ->select([
-                'times.id',
-                'times.nome',
-                DB::raw('COUNT(DISTINCT p.id) as jogos'),
-                DB::raw('SUM(
-                    CASE
-                        WHEN (p.id_time_casa = times.id AND p.gols_time_casa > p.gols_time_visitante) OR
-                             (p.id_time_visitante = times.id AND p.gols_time_visitante > p.gols_time_casa)
-                        THEN 3
-                        WHEN p.gols_time_casa = p.gols_time_visitante
-                        THEN 1
-                        ELSE 0
-                    END
-                ) as pontos'),
-                DB::raw('SUM(
-                    CASE
-                        WHEN (p.id_time_casa = times.id AND p.gols_time_casa > p.gols_time_visitante) OR
-                             (p.id_time_visitante = times.id AND p.gols_time_visitante > p.gols_time_casa)
-                        THEN 1
-                        ELSE 0
-                    END
-                ) as vitorias'),
-                DB::raw('SUM(
-                    CASE
-                        WHEN p.gols_time_casa = p.gols_time_visitante
-                        THEN 1
-                        ELSE 0
-                    END
-                ) as empates'),
-                DB::raw('SUM(
-                    CASE
-                        WHEN (p.id_time_casa = times.id AND p.gols_time_casa < p.gols_time_visitante) OR
-                             (p.id_time_visitante = times.id AND p.gols_time_visitante < p.gols_time_casa)
-                        THEN 1
-                        ELSE 0
-                    END
-                ) as derrotas'),
-                DB::raw('SUM(
-                    CASE
-                        WHEN p.id_time_casa = times.id
-                        THEN p.gols_time_casa
-                        ELSE p.gols_time_visitante
-                    END
-                ) as gols_pro'),
-                DB::raw('SUM(
-                    CASE
-                        WHEN p.id_time_casa = times.id
-                        THEN p.gols_time_visitante
-                        ELSE p.gols_time_casa
-                    END
-                ) as gols_contra'),
-                DB::raw('SUM(
-                    CASE
-                        WHEN p.id_time_casa = times.id
-                        THEN p.gols_time_casa - p.gols_time_visitante
-                        ELSE p.gols_time_visitante - p.gols_time_casa
-                    END
-                ) as saldo_gols')
-            ])
-            ->leftJoin('partidas as p', function ($join) use ($ano, $data) {
-                $join->on(function ($query): void {
-                    $query->on('times.id', '=', 'p.id_time_casa')
-                        ->orOn('times.id', '=', 'p.id_time_visitante');
-                })
-                    ->whereYear('p.data', $ano)
-                    ->where('p.data', '<=', $data);
-            })
-            ->groupBy('times.id', 'times.nome')
-            ->orderByDesc('pontos')
-            ->orderByDesc('vitorias')
-            ->orderByDesc('saldo_gols')
-            ->orderByDesc('gols_pro')
-            ->get();
+        $classificacao = Classificacao::calcular($ano, $data)->get();
+
+        if ($this->wantsCompact($request)) {
+            return response()->json([
+                'formato' => 'compacto',
+                'times' => (object) $classificacao->pluck('nome', 'id')->all(),
+                'data' => $this->columnar($classificacao, self::COMPACT_FIELDS),
+                'ano' => $ano,
+                'data_referencia' => $data,
+                'atualizado_em' => now()
+            ]);
+        }
 
         return response()->json([
             'data' => $classificacao,
@@ -112,8 +82,8 @@ public function store(Partida $partida): JsonResponse
         try {
             DB::beginTransaction();
 
-            $classificacao = $this->getClassificacao(data: $partida->data);
             $ano = Carbon::parse($partida->data)->year;
+            $classificacao = Classificacao::calcular($ano, $partida->data)->get();
             $dataAtualizacao = $partida->data;
 
             // First, let's check existing records
@@ -164,6 +134,11 @@ public function store(Partida $partida): JsonResponse
                 }
             }
 
+            // Invalidates every cached view of this season's snapshots. Deferred
+            // to the outermost commit (PartidaController calls this inside its own
+            // transaction) so no reader caches uncommitted rows under the new version.
+            DB::afterCommit(fn () => Cache::forever(self::versaoKey($ano), (string) Str::uuid()));
+
             DB::commit();
             return response()->json($classificacao);
 
@@ -194,6 +169,7 @@ public function getHistorico(Request $request): JsonResponse
                     'data' => $classificacao->data_atualizacao,
                     'posicao' => $this->getPosicaoNaData(
                         timeId: $classificacao->time_id,
+                        ano: $classificacao->ano,
                         data: $classificacao->data_atualizacao
                     ),
                     'pontos' => $classificacao->pontos,
@@ -208,131 +184,136 @@ public function getHistorico(Request $request): JsonResponse
         return response()->json($historico);
     }
 
-    private function getPosicaoNaData($timeId, $data): int
+    /**
+     * The standings snapshots of seasons `ano_inicio` to `ano_fim` as CSV,
+     * one row per team and snapshot date, read in keyset pages so memory
+     * stays flat however many seasons are exported.
+     */
+    public function export(Request $request): StreamedResponse
     {
-        $classificacao = $this->getClassificacao(data: $data);
+        $request->validate([
+            'ano_inicio' => 'required|integer|min:1900|max:2100',
+            'ano_fim' => 'nullable|integer|gte:ano_inicio|max:2100'
+        ]);
 
-        foreach ($classificacao as $index => $time) {
-            if ($time->id === $timeId) {
-                return $index + 1;
-            }
-        }
+        $inicio = (int) $request->ano_inicio;
+        $fim = (int) $request->input('ano_fim', $inicio);
 
-        return 0;
+        $snapshots = DB::table('classificacoes as c')
+            ->join('times', 'times.id', '=', 'c.time_id')
+            ->whereBetween('c.ano', [$inicio, $fim])
+            ->select([
+                'c.id',
+                'c.ano',
+                'c.data_atualizacao',
+                'c.time_id',
+                'times.nome as time',
+                'c.jogos',
+                'c.pontos',
+                'c.vitorias',
+                'c.empates',
+                'c.derrotas',
+                'c.gols_pro',
+                'c.gols_contra',
+                'c.saldo_gols'
+            ])
+            ->lazyById(self::EXPORT_CHUNK, 'c.id', 'id');
+
+        return $this->streamCsv("classificacoes_{$inicio}_{$fim}.csv", self::EXPORT_FIELDS, $snapshots);
     }
 
-    private function getClassificacao($data)
+    /**
+     * Position and points of every team on every snapshot date of a season,
+     * as team x date matrices. Positions are ranked by a window function
+     * over the snapshot table, so the whole season is a single query.
+     */
+    public function getEvolucao(Request $request): JsonResponse
     {
-        return DB::table('times')
+        $request->validate([
+            'ano' => 'required|integer'
+        ]);
+
+        $ano = (int) $request->ano;
+        $versao = Cache::get(self::versaoKey($ano), 'inicial');
+
+        $evolucao = Cache::remember(
+            "classificacao:evolucao:{$ano}:{$versao}",
+            now()->addHour(),
+            fn (): array => $this->buildEvolucao($ano)
+        );
+
+        return response()->json(['ano' => $ano, ...$evolucao]);
+    }
+
+    private function buildEvolucao(int $ano): array
+    {
+        $linhas = DB::table('classificacoes as c')
+            ->join('times', 'times.id', '=', 'c.time_id')
+            ->where('c.ano', $ano)
             ->select([
-                'times.id',
+                'c.time_id',
                 'times.nome',
-                DB::raw('COUNT(DISTINCT p.id) as jogos'),
-                DB::raw('SUM(
-                CASE
-                    WHEN (p.id_time_casa = times.id AND p.gols_time_casa > p.gols_time_visitante) OR
-                         (p.id_time_visitante = times.id AND p.gols_time_visitante > p.gols_time_casa)
-                    THEN 3
-                    WHEN p.gols_time_casa = p.gols_time_visitante
-                    THEN 1
-                    ELSE 0
-                END
-            ) as pontos'),
-                DB::raw('SUM(
-                CASE
-                    WHEN (p.id_time_casa = times.id AND p.gols_time_casa > p.gols_time_visitante) OR
-                         (p.id_time_visitante = times.id AND p.gols_time_visitante > p.gols_time_casa)
-                    THEN 1
-                    ELSE 0
-                END
-            ) as vitorias'),
-                DB::raw('SUM(
-                CASE
-                    WHEN p.gols_time_casa = p.gols_time_visitante
-                    THEN 1
-                    ELSE 0
-                END
-            ) as empates'),
-                DB::raw('SUM(
-                CASE
-                    WHEN (p.id_time_casa = times.id AND p.gols_time_casa < p.gols_time_visitante) OR
-                         (p.id_time_visitante = times.id AND p.gols_time_visitante < p.gols_time_casa)
-                    THEN 1
-                    ELSE 0
-                END
-            ) as derrotas'),
-                DB::raw('COALESCE(SUM(
-                CASE
-                    WHEN p.id_time_casa = times.id
-                    THEN p.gols_time_casa
-                    WHEN p.id_time_visitante = times.id
-                    THEN p.gols_time_visitante
-                    ELSE 0
-                END
-            ), 0) as gols_pro'),
-                DB::raw('COALESCE(SUM(
-                CASE
-                    WHEN p.id_time_casa = times.id
-                    THEN p.gols_time_visitante
-                    WHEN p.id_time_visitante = times.id
-                    THEN p.gols_time_casa
-                    ELSE 0
-                END
-            ), 0) as gols_contra'),
-                DB::raw('COALESCE(SUM(
-                CASE
-                    WHEN p.id_time_casa = times.id
-                    THEN p.gols_time_casa - p.gols_time_visitante
-                    WHEN p.id_time_visitante = times.id
-                    THEN p.gols_time_visitante - p.gols_time_casa
-                    ELSE 0
-                END
-            ), 0) as saldo_gols')
+                'c.data_atualizacao',
+                'c.pontos',
+                DB::raw('ROW_NUMBER() OVER (
+                    PARTITION BY c.data_atualizacao
+                    ORDER BY c.pontos DESC, c.vitorias DESC, c.saldo_gols DESC, c.gols_pro DESC, c.time_id
+                ) as posicao')
             ])
-            ->leftJoin('partidas as p', function ($join) use ($data) {
-                $join->on(function ($query) {
-                    $query->on('times.id', '=', 'p.id_time_casa')
-                        ->orOn('times.id', '=', 'p.id_time_visitante');
-                })
-                    ->where('p.data', '<=', $data);
-            })
-            ->groupBy('times.id', 'times.nome')
-            ->orderBy(DB::raw('SUM(
-            CASE
-                WHEN (p.id_time_casa = times.id AND p.gols_time_casa > p.gols_time_visitante) OR
-                     (p.id_time_visitante = times.id AND p.gols_time_visitante > p.gols_time_casa)
-                THEN 3
-                WHEN p.gols_time_casa = p.gols_time_visitante
-                THEN 1
-                ELSE 0
-            END
-        )'), 'desc')
-            ->orderBy(DB::raw('SUM(
-            CASE
-                WHEN (p.id_time_casa = times.id AND p.gols_time_casa > p.gols_time_visitante) OR
-                     (p.id_time_visitante = times.id AND p.gols_time_visitante > p.gols_time_casa)
-                THEN 1
-                ELSE 0
-            END
-        )'), 'desc')
-            ->orderBy(DB::raw('COALESCE(SUM(
-            CASE
-                WHEN p.id_time_casa = times.id
-                THEN p.gols_time_casa - p.gols_time_visitante
-                WHEN p.id_time_visitante = times.id
-                THEN p.gols_time_visitante - p.gols_time_casa
-                ELSE 0
-            END
-        ), 0)'), 'desc')
-            ->orderBy(DB::raw('COALESCE(SUM(
-            CASE
-                WHEN p.id_time_casa = times.id
-                THEN p.gols_time_casa
-                WHEN p.id_time_visitante = times.id
-                THEN p.gols_time_visitante
-                ELSE 0
-            END
-        ), 0)'), 'desc')
+            ->orderBy('c.data_atualizacao')
+            ->orderBy('posicao')
             ->get();
+
+        $times = [];
+        $datas = [];
+        $posicoes = [];
+        $pontos = [];
+
+        foreach ($linhas as $linha) {
+            if (! isset($datas[$linha->data_atualizacao])) {
+                $datas[$linha->data_atualizacao] = count($datas);
+            }
+            $coluna = $datas[$linha->data_atualizacao];
+
+            $times[$linha->time_id] ??= ['id' => $linha->time_id, 'nome' => $linha->nome];
+            $posicoes[$linha->time_id][$coluna] = (int) $linha->posicao;
+            $pontos[$linha->time_id][$coluna] = (int) $linha->pontos;
+        }
+
+        // Rows follow the standings on the last date
+        $ultima = count($datas) - 1;
+        uasort($times, fn (array $a, array $b): int => ($posicoes[$a['id']][$ultima] ?? PHP_INT_MAX)
+            <=> ($posicoes[$b['id']][$ultima] ?? PHP_INT_MAX));
+
+        // Dense rows, with null where a team has no snapshot for a date
+        $densa = fn (array $valores): array => array_map(
+            fn (int $coluna): ?int => $valores[$coluna] ?? null,
+            range(0, max($ultima, 0))
+        );
+
+        return [
+            'times' => array_values($times),
+            'datas' => array_keys($datas),
+            'posicoes' => array_map(fn (array $time): array => $densa($posicoes[$time['id']]), array_values($times)),
+            'pontos' => array_map(fn (array $time): array => $densa($pontos[$time['id']]), array_values($times))
+        ];
+    }
+
+    private static function versaoKey(int $ano): string
+    {
+        return "classificacao:versao:{$ano}";
+    }
+
+    private function getPosicaoNaData($timeId, int $ano, $data): int
+    {
+        $classificacao = Classificacao::calcular($ano, $data)->get();
+
+        foreach ($classificacao as $index => $time) {
+            if ($time->id === $timeId) {
+                return $index + 1;
+            }
+        }
+
+        return 0;
     }
 }
@@ -2,7 +2,76 @@
 
 namespace App\Http\Controllers;
 
+use Illuminate\Http\Request;
+use Illuminate\Support\Collection;
+use Symfony\Component\HttpFoundation\StreamedResponse;
+
 abstract class Controller
 {
-    //
+    public const COMPACT_MEDIA_TYPE = 'application/vnd.brasileirao.compacto+json';
+
+    /**
+     * Whether the client opted into the columnar wire format, either with
+     * `?formato=compacto` or with the compact media type in `Accept`.
+     */
+    protected function wantsCompact(Request $request): bool
+    {
+        return $request->query('formato') === 'compacto'
+            || str_contains((string) $request->header('Accept'), self::COMPACT_MEDIA_TYPE);
+    }
+
+    /**
+     * Turns a list of rows into one array per field, so keys are sent once
+     * instead of once per row.
+     *
+     * @param  array<int, string>  $fields
+     * @return array<string, array<int, mixed>>
+     */
+    protected function columnar(Collection $rows, array $fields): array
+    {
+        $columns = [];
+
+        foreach ($fields as $field) {
+            $columns[$field] = $rows->pluck($field)->all();
+        }
+
+        return $columns;
+    }
+
+    /**
+     * Streams rows as a CSV download while they are read, flushing every
+     * `$flushEvery` rows. There is no Content-Length, so the body goes out
+     * with chunked transfer encoding and neither PHP nor nginx holds the
+     * whole file.
+     *
+     * @param  array<int, string>  $fields
+     * @param  iterable<object>  $rows
+     */
+    protected function streamCsv(string $filename, array $fields, iterable $rows, int $flushEvery = 1000): StreamedResponse
+    {
+        return response()->stream(function () use ($fields, $rows, $flushEvery): void {
+            $out = fopen('php://output', 'w');
+            fputcsv($out, $fields);
+
+            $count = 0;
+            foreach ($rows as $row) {
+                fputcsv($out, array_map(fn (string $field): mixed => $row->{$field}, $fields));
+
+                if (++$count % $flushEvery === 0) {
+                    // PHP-FPM keeps its own output buffer in front of the SAPI one
+                    if (ob_get_level() > 0) {
+                        ob_flush();
+                    }
+                    flush();
+                }
+            }
+
+            fclose($out);
+        }, 200, [
+            'Content-Type' => 'text/csv; charset=UTF-8',
+            'Content-Disposition' => "attachment; filename=\"{$filename}\"",
+            // Lets nginx pass chunks through instead of buffering the response
+            'X-Accel-Buffering' => 'no'
+        ]);
+    }
 }
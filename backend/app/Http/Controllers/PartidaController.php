@@ -4,11 +4,38 @@
 
 use Illuminate\Support\Facades\DB;
 use App\Models\Partida;
+use App\Models\Time;
+use Illuminate\Database\Eloquent\Builder;
 use Illuminate\Http\Request;
 use Illuminate\Http\JsonResponse;
+use Symfony\Component\HttpFoundation\StreamedResponse;
 
 class PartidaController extends Controller
 {
+    private const EXPORT_FIELDS = [
+        'id',
+        'data',
+        'id_time_casa',
+        'time_casa',
+        'gols_time_casa',
+        'id_time_visitante',
+        'time_visitante',
+        'gols_time_visitante',
+        'estadio'
+    ];
+
+    private const COMPACT_FIELDS = [
+        'id',
+        'data',
+        'id_time_casa',
+        'gols_time_casa',
+        'id_time_visitante',
+        'gols_time_visitante',
+        'estadio'
+    ];
+
+    private const EXPORT_CHUNK = 2000;
+
     protected $classificacaoController;
 
     public function __construct(ClassificacaoController $classificacaoController)
@@ -16,12 +43,12 @@ public function __construct(ClassificacaoController $classificacaoController)
         $this->classificacaoController = $classificacaoController;
     }
 
-    public function index(): JsonResponse
+    public function index(Request $request): JsonResponse
     {
-        $partidas = Partida::with(['timeCasa', 'timeVisitante'])
-            ->orderBy('data', 'desc')
-            ->get();
-        return response()->json($partidas);
+        return $this->partidasResponse(
+            $request,
+            Partida::query()->orderBy('data', 'desc')
+        );
     }
 
     public function store(Request $request): JsonResponse
@@ -133,12 +160,12 @@ public function getByDate(Request $request): JsonResponse
             'data_fim' => 'required|date|after_or_equal:data_inicio'
         ]);
 
-        $partidas = Partida::with(['timeCasa', 'timeVisitante'])
-            ->whereBetween('data', [$request->data_inicio, $request->data_fim])
-            ->orderBy('data')
-            ->get();
-
-        return response()->json($partidas);
+        return $this->partidasResponse(
+            $request,
+            Partida::query()
+                ->whereBetween('data', [$request->data_inicio, $request->data_fim])
+                ->orderBy('data')
+        );
     }
 
     public function getByTeam(Request $request): JsonResponse
@@ -147,12 +174,159 @@ public function getByTeam(Request $request): JsonResponse
             'time_id' => 'required|exists:times,id'
         ]);
 
-        $partidas = Partida::with(['timeCasa', 'timeVisitante'])
-            ->where('id_time_casa', $request->time_id)
-            ->orWhere('id_time_visitante', $request->time_id)
+        return $this->partidasResponse(
+            $request,
+            Partida::query()
+                ->where('id_time_casa', $request->time_id)
+                ->orWhere('id_time_visitante', $request->time_id)
+                ->orderBy('data', 'desc')
+        );
+    }
+
+    public function getConfronto(Request $request): JsonResponse
+    {
+        $request->validate([
+            'time_a' => 'required|exists:times,id',
+            'time_b' => 'required|exists:times,id|different:time_a',
+            'limite' => 'nullable|integer|min:1|max:50'
+        ]);
+
+        $timeA = (int) $request->time_a;
+        $timeB = (int) $request->time_b;
+
+        // Each branch is served by the (time, data) indexes on partidas
+        $confronto = Partida::query()
+            ->where(function ($query) use ($timeA, $timeB): void {
+                $query->where('id_time_casa', $timeA)->where('id_time_visitante', $timeB);
+            })
+            ->orWhere(function ($query) use ($timeA, $timeB): void {
+                $query->where('id_time_casa', $timeB)->where('id_time_visitante', $timeA);
+            });
+
+        $resumo = (clone $confronto)->toBase()
+            ->selectRaw('
+                COUNT(*) as jogos,
+                COALESCE(SUM(CASE
+                    WHEN id_time_casa = ? THEN CASE WHEN gols_time_casa > gols_time_visitante THEN 1 ELSE 0 END
+                    ELSE CASE WHEN gols_time_visitante > gols_time_casa THEN 1 ELSE 0 END
+                END), 0) as vitorias_a,
+                COALESCE(SUM(CASE WHEN gols_time_casa = gols_time_visitante THEN 1 ELSE 0 END), 0) as empates,
+                COALESCE(SUM(CASE
+                    WHEN id_time_casa = ? THEN CASE WHEN gols_time_casa < gols_time_visitante THEN 1 ELSE 0 END
+                    ELSE CASE WHEN gols_time_visitante < gols_time_casa THEN 1 ELSE 0 END
+                END), 0) as vitorias_b,
+                COALESCE(SUM(CASE WHEN id_time_casa = ? THEN gols_time_casa ELSE gols_time_visitante END), 0) as gols_a,
+                COALESCE(SUM(CASE WHEN id_time_casa = ? THEN gols_time_visitante ELSE gols_time_casa END), 0) as gols_b
+            ', [$timeA, $timeA, $timeA, $timeA])
+            ->first();
+
+        $partidas = $confronto
+            ->with(['timeCasa', 'timeVisitante'])
             ->orderBy('data', 'desc')
+            ->limit($request->input('limite', 10))
             ->get();
 
-        return response()->json($partidas);
+        return response()->json([
+            'time_a' => Time::find($timeA, ['id', 'nome']),
+            'time_b' => Time::find($timeB, ['id', 'nome']),
+            'jogos' => (int) $resumo->jogos,
+            'vitorias_a' => (int) $resumo->vitorias_a,
+            'empates' => (int) $resumo->empates,
+            'vitorias_b' => (int) $resumo->vitorias_b,
+            'gols_a' => (int) $resumo->gols_a,
+            'gols_b' => (int) $resumo->gols_b,
+            'partidas' => $partidas
+        ]);
+    }
+
+    public function getDatas(Request $request): JsonResponse
+    {
+        $request->validate([
+            'ano' => 'required|integer|min:1900|max:2100'
+        ]);
+
+        $ano = (int) $request->ano;
+
+        // A range on data rather than EXTRACT(YEAR ...) keeps this an index-only scan
+        $datas = Partida::query()->toBase()
+            ->whereBetween('data', ["{$ano}-01-01", "{$ano}-12-31"])
+            ->distinct()
+            ->orderBy('data')
+            ->pluck('data');
+
+        return response()->json([
+            'ano' => $ano,
+            'datas' => $datas
+        ]);
+    }
+
+    /**
+     * Every match of seasons `ano_inicio` to `ano_fim` as CSV, with both team
+     * names. Rows are read in keyset pages of `lazyById`, so memory does not
+     * grow with the number of seasons.
+     */
+    public function export(Request $request): StreamedResponse
+    {
+        $request->validate([
+            'ano_inicio' => 'required|integer|min:1900|max:2100',
+            'ano_fim' => 'nullable|integer|gte:ano_inicio|max:2100'
+        ]);
+
+        $inicio = (int) $request->ano_inicio;
+        $fim = (int) $request->input('ano_fim', $inicio);
+
+        $partidas = DB::table('partidas')
+            ->join('times as casa', 'casa.id', '=', 'partidas.id_time_casa')
+            ->join('times as visitante', 'visitante.id', '=', 'partidas.id_time_visitante')
+            ->whereBetween('partidas.data', ["{$inicio}-01-01", "{$fim}-12-31"])
+            ->select([
+                'partidas.id',
+                'partidas.data',
+                'partidas.id_time_casa',
+                'casa.nome as time_casa',
+                'partidas.gols_time_casa',
+                'partidas.id_time_visitante',
+                'visitante.nome as time_visitante',
+                'partidas.gols_time_visitante',
+                'partidas.estadio'
+            ])
+            ->lazyById(self::EXPORT_CHUNK, 'partidas.id', 'id');
+
+        return $this->streamCsv("partidas_{$inicio}_{$fim}.csv", self::EXPORT_FIELDS, $partidas);
+    }
+
+    /**
+     * Runs a match list query, either as full objects with both teams
+     * embedded or, when the client asks for it, as columns plus a team
+     * dictionary.
+     */
+    private function partidasResponse(Request $request, Builder $query): JsonResponse
+    {
+        if (! $this->wantsCompact($request)) {
+            return response()->json(
+                $query->with(['timeCasa', 'timeVisitante'])->get()
+            );
+        }
+
+        $partidas = $query->get(self::COMPACT_FIELDS)
+            ->map(fn (Partida $partida): array => [
+                ...$partida->only(self::COMPACT_FIELDS),
+                'data' => $partida->data->toDateString()
+            ]);
+
+        $times = Time::whereIn(
+            'id',
+            $partidas->pluck('id_time_casa')->merge($partidas->pluck('id_time_visitante'))->unique()
+        )->get(['id', 'nome', 'estadio', 'cidade']);
+
+        return response()->json([
+            'formato' => 'compacto',
+            'times' => (object) $times
+                ->mapWithKeys(fn (Time $time): array => [
+                    $time->id => $time->only(['nome', 'estadio', 'cidade'])
+                ])
+                ->all(),
+            'data' => $this->columnar($partidas, self::COMPACT_FIELDS)
+        ]);
     }
 }
@@ -2,9 +2,11 @@
 
 namespace App\Http\Controllers;
 
+use App\Models\Partida;
 use App\Models\Time;
 use Illuminate\Http\Request;
 use Illuminate\Http\JsonResponse;
+use Illuminate\Support\Facades\DB;
 
 class TimeController extends Controller
 {
@@ -48,4 +50,96 @@ public function destroy(Time $time): JsonResponse
         $time->delete();
         return response()->json(null, 204);
     }
+
+    /**
+     * Teams whose name contains `q`, or resembles it closely enough to catch
+     * a typo, for type-ahead inputs. Names starting with `q` come first, then
+     * the closest matches. Accents are ignored on both sides, and both
+     * conditions are served by the trigram index on `f_unaccent(nome)`.
+     * Without Postgres (no pg_trgm or unaccent) it falls back to a plain
+     * substring match.
+     */
+    public function search(Request $request): JsonResponse
+    {
+        $request->validate([
+            'q' => 'required|string|max:128',
+            'limite' => 'nullable|integer|min:1|max:50'
+        ]);
+
+        $termo = $request->q;
+        // % and _ typed by the user are matched literally
+        $literal = addcslashes($termo, '\\%_');
+
+        $query = Time::query();
+        if (DB::getDriverName() === 'pgsql') {
+            $query
+                ->where(function ($query) use ($termo, $literal): void {
+                    $query->whereRaw('f_unaccent(nome) ILIKE f_unaccent(?)', ["%{$literal}%"])
+                        ->orWhereRaw('f_unaccent(nome) % f_unaccent(?)', [$termo]);
+                })
+                ->orderByRaw('f_unaccent(nome) ILIKE f_unaccent(?) DESC', ["{$literal}%"])
+                ->orderByRaw('similarity(f_unaccent(nome), f_unaccent(?)) DESC', [$termo]);
+        } else {
+            $query->where('nome', 'like', "%{$termo}%");
+        }
+
+        $times = $query
+            ->orderBy('nome')
+            ->limit((int) $request->input('limite', 10))
+            ->get(['id', 'nome', 'estadio', 'cidade']);
+
+        return response()->json($times);
+    }
+
+    public function getForma(Request $request, Time $time): JsonResponse
+    {
+        $request->validate([
+            'limite' => 'nullable|integer|min:1|max:20'
+        ]);
+
+        $limite = (int) $request->input('limite', 5);
+
+        // Two index-ordered scans of at most $limite rows each, instead of
+        // sorting every match the team ever played
+        $partidas = Partida::with(['timeCasa', 'timeVisitante'])
+            ->where('id_time_casa', $time->id)
+            ->orderBy('data', 'desc')
+            ->limit($limite)
+            ->unionAll(
+                Partida::query()
+                    ->where('id_time_visitante', $time->id)
+                    ->orderBy('data', 'desc')
+                    ->limit($limite)
+            )
+            ->orderBy('data', 'desc')
+            ->limit($limite)
+            ->get();
+
+        $forma = $partidas->map(function (Partida $partida) use ($time): array {
+            [$pro, $contra] = (int) $partida->id_time_casa === $time->id
+                ? [$partida->gols_time_casa, $partida->gols_time_visitante]
+                : [$partida->gols_time_visitante, $partida->gols_time_casa];
+
+            return [
+                ...$partida->toArray(),
+                'resultado' => $pro > $contra ? 'V' : ($pro === $contra ? 'E' : 'D')
+            ];
+        });
+
+        $pontos = $forma->sum(fn (array $partida): int => match ($partida['resultado']) {
+            'V' => 3,
+            'E' => 1,
+            default => 0
+        });
+
+        return response()->json([
+            'time' => $time->only(['id', 'nome']),
+            'sequencia' => $forma->pluck('resultado')->implode(''),
+            'pontos' => $pontos,
+            'aproveitamento' => $forma->isEmpty()
+                ? 0
+                : round(num: ($pontos / ($forma->count() * 3)) * 100, precision: 2),
+            'partidas' => $forma
+        ]);
+    }
 }
@@ -0,0 +1,40 @@
+<?php
+
+namespace App\Http\Middleware;
+
+use Closure;
+use Illuminate\Http\Request;
+use Symfony\Component\HttpFoundation\Cookie;
+use Symfony\Component\HttpFoundation\Response;
+
+class BypassApiCacheAfterWrite
+{
+    /**
+     * Cookie that makes nginx skip its API micro-cache (see nginx/conf.d/app.conf).
+     */
+    public const COOKIE = 'api_escrita';
+
+    /**
+     * How long the cookie lasts. Longer than the 5 seconds an entry stays fresh
+     * in nginx, so once it expires no cached entry predates the write.
+     */
+    public const SEGUNDOS = 10;
+
+    /**
+     * Gives the client of a successful write a short-lived cookie, so its
+     * next reads go to PHP instead of the micro-cache and see that write.
+     */
+    public function handle(Request $request, Closure $next): Response
+    {
+        $response = $next($request);
+
+        // The batch endpoint is a POST but only reads
+        if (! $request->isMethodCacheable() && ! $request->is('api/batch') && $response->isSuccessful()) {
+            $response->headers->setCookie(
+                Cookie::create(self::COOKIE, '1', time() + self::SEGUNDOS, '/', null, null, true, false, Cookie::SAMESITE_LAX)
+            );
+        }
+
+        return $response;
+    }
+}
@@ -2,8 +2,11 @@
 
 namespace App\Models;
 
+use Carbon\Carbon;
 use Illuminate\Database\Eloquent\Model;
 use Illuminate\Database\Eloquent\Relations\BelongsTo;
+use Illuminate\Database\Query\Builder;
+use Illuminate\Support\Facades\DB;
 
 class Classificacao extends Model
 {
@@ -31,4 +34,60 @@ public function time(): BelongsTo
     {
         return $this->belongsTo(Time::class);
     }
+
+    /**
+     * Standings of season `$ano` counting the matches played up to and
+     * including `$data`, with every team listed.
+     *
+     * Each match is split into one row per side, so the totals of a team are
+     * aggregated once in a derived table and the outer query only combines
+     * them. Rows are ordered by points, wins, goal difference and goals for,
+     * then by team id so ties always come out the same way.
+     */
+    public static function calcular(int $ano, $data): Builder
+    {
+        $inicio = Carbon::create($ano, 1, 1)->toDateString();
+        $fim = Carbon::parse($data)->min(Carbon::create($ano, 12, 31))->toDateString();
+
+        $casa = DB::table('partidas')
+            ->whereBetween('data', [$inicio, $fim])
+            ->select(['id_time_casa as time_id', 'gols_time_casa as pro', 'gols_time_visitante as contra']);
+
+        $visitante = DB::table('partidas')
+            ->whereBetween('data', [$inicio, $fim])
+            ->select(['id_time_visitante as time_id', 'gols_time_visitante as pro', 'gols_time_casa as contra']);
+
+        $totais = DB::query()
+            ->fromSub($casa->unionAll($visitante), 'jogos')
+            ->select([
+                'time_id',
+                DB::raw('COUNT(*) as jogos'),
+                DB::raw('SUM(CASE WHEN pro > contra THEN 1 ELSE 0 END) as vitorias'),
+                DB::raw('SUM(CASE WHEN pro = contra THEN 1 ELSE 0 END) as empates'),
+                DB::raw('SUM(CASE WHEN pro < contra THEN 1 ELSE 0 END) as derrotas'),
+                DB::raw('SUM(pro) as gols_pro'),
+                DB::raw('SUM(contra) as gols_contra')
+            ])
+            ->groupBy('time_id');
+
+        return DB::table('times')
+            ->leftJoinSub($totais, 't', 't.time_id', '=', 'times.id')
+            ->select([
+                'times.id',
+                'times.nome',
+                DB::raw('COALESCE(t.jogos, 0) as jogos'),
+                DB::raw('COALESCE(3 * t.vitorias + t.empates, 0) as pontos'),
+                DB::raw('COALESCE(t.vitorias, 0) as vitorias'),
+                DB::raw('COALESCE(t.empates, 0) as empates'),
+                DB::raw('COALESCE(t.derrotas, 0) as derrotas'),
+                DB::raw('COALESCE(t.gols_pro, 0) as gols_pro'),
+                DB::raw('COALESCE(t.gols_contra, 0) as gols_contra'),
+                DB::raw('COALESCE(t.gols_pro - t.gols_contra, 0) as saldo_gols')
+            ])
+            ->orderByDesc('pontos')
+            ->orderByDesc('vitorias')
+            ->orderByDesc('saldo_gols')
+            ->orderByDesc('gols_pro')
+            ->orderBy('times.id');
+    }
 }
@@ -0,0 +1,116 @@
+<?php
+
+namespace App\Support;
+
+use Illuminate\Support\Facades\DB;
+
+/**
+ * Season partitions of the tables split by season in Postgres. Each season
+ * is its own partition (`partidas_2025`, `classificacoes_2025`), and rows of
+ * seasons without one land in the `_default` partition until it is created.
+ */
+class ParticoesPorTemporada
+{
+    /**
+     * Partitioned tables and the column that holds their season.
+     */
+    public const TABELAS = [
+        'partidas' => 'data',
+        'classificacoes' => 'ano'
+    ];
+
+    /**
+     * Schema that archived seasons are moved to, out of the partitioned tables.
+     */
+    public const ESQUEMA_ARQUIVO = 'arquivo';
+
+    /**
+     * Creates the partition of season `$ano`, moving any rows of that season
+     * out of the default partition. Returns false when it already exists.
+     */
+    public static function criar(string $tabela, int $ano): bool
+    {
+        $particao = "{$tabela}_{$ano}";
+        if (self::existe($particao)) {
+            return false;
+        }
+
+        [$de, $ate] = self::limites($tabela, $ano);
+        $coluna = self::TABELAS[$tabela];
+
+        DB::transaction(function () use ($tabela, $particao, $coluna, $de, $ate): void {
+            // Postgres refuses a new partition while the default one holds rows it would own
+            DB::statement("ALTER TABLE {$tabela} DETACH PARTITION {$tabela}_default");
+            DB::statement("CREATE TABLE {$particao} PARTITION OF {$tabela} FOR VALUES FROM ({$de}) TO ({$ate})");
+            DB::statement(
+                "WITH movidas AS (
+                    DELETE FROM {$tabela}_default WHERE {$coluna} >= {$de} AND {$coluna} < {$ate} RETURNING *
+                )
+                INSERT INTO {$particao} SELECT * FROM movidas"
+            );
+            DB::statement("ALTER TABLE {$tabela} ATTACH PARTITION {$tabela}_default DEFAULT");
+        });
+
+        return true;
+    }
+
+    /**
+     * Detaches the partition of season `$ano` and moves it to the archive
+     * schema, so its rows stay queryable as `arquivo.<tabela>_<ano>` but no
+     * longer count for the API. Returns false when there is no such partition.
+     */
+    public static function arquivar(string $tabela, int $ano): bool
+    {
+        $particao = "{$tabela}_{$ano}";
+        if (! self::existe($particao)) {
+            return false;
+        }
+
+        DB::transaction(function () use ($tabela, $particao): void {
+            DB::statement('CREATE SCHEMA IF NOT EXISTS ' . self::ESQUEMA_ARQUIVO);
+            DB::statement("ALTER TABLE {$tabela} DETACH PARTITION {$particao}");
+            DB::statement("ALTER TABLE {$particao} SET SCHEMA " . self::ESQUEMA_ARQUIVO);
+        });
+
+        return true;
+    }
+
+    /**
+     * Seasons that have a partition attached to `$tabela`, in order.
+     *
+     * @return array<int, int>
+     */
+    public static function temporadas(string $tabela): array
+    {
+        return DB::table('pg_inherits')
+            ->join('pg_class as filha', 'filha.oid', '=', 'pg_inherits.inhrelid')
+            ->join('pg_class as mae', 'mae.oid', '=', 'pg_inherits.inhparent')
+            ->join('pg_namespace', 'pg_namespace.oid', '=', 'mae.relnamespace')
+            ->where('mae.relname', $tabela)
+            ->whereRaw('pg_namespace.nspname = current_schema()')
+            ->where('filha.relname', '~', "^{$tabela}_[0-9]{4}$")
+            ->orderBy('filha.relname')
+            ->pluck('filha.relname')
+            ->map(fn (string $particao): int => (int) substr($particao, -4))
+            ->all();
+    }
+
+    /**
+     * Bounds of season `$ano` as SQL literals, lower inclusive and upper exclusive.
+     *
+     * @return array{0: string, 1: string}
+     */
+    private static function limites(string $tabela, int $ano): array
+    {
+        $proximo = $ano + 1;
+
+        return self::TABELAS[$tabela] === 'data'
+            ? ["'{$ano}-01-01'", "'{$proximo}-01-01'"]
+            : [(string) $ano, (string) $proximo];
+    }
+
+    private static function existe(string $particao): bool
+    {
+        return DB::scalar('SELECT to_regclass(?) IS NOT NULL', [$particao]);
+    }
+}
@@ -94,7 +94,17 @@
             'prefix' => '',
             'prefix_indexes' => true,
             'search_path' => 'public',
-            'sslmode' => 'prefer',
+            'sslmode' => env('DB_SSLMODE', 'prefer'),
+            'options' => extension_loaded('pdo_pgsql') ? [
+                // Keep one connection per PHP-FPM worker instead of
+                // connecting on every request.
+                PDO::ATTR_PERSISTENT => env('DB_PERSISTENT', false),
+                // PgBouncer in transaction mode hands each transaction to
+                // any server connection, so server-side prepared statements
+                // cannot be reused across queries. Set when DB_HOST points
+                // at the pooler.
+                PDO::ATTR_EMULATE_PREPARES => env('DB_EMULATE_PREPARES', false),
+            ] : [],
         ],
 
         // 'sqlsrv' => [
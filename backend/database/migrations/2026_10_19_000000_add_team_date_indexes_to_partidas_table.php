@@ -0,0 +1,30 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration {
+    /**
+     * Run the migrations.
+     */
+    public function up(): void
+    {
+        Schema::table('partidas', function (Blueprint $table): void {
+            // Latest matches of a team (form) and of a pairing (head-to-head)
+            $table->index(['id_time_casa', 'data']);
+            $table->index(['id_time_visitante', 'data']);
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::table('partidas', function (Blueprint $table): void {
+            $table->dropIndex(['id_time_casa', 'data']);
+            $table->dropIndex(['id_time_visitante', 'data']);
+        });
+    }
+};
@@ -0,0 +1,28 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration {
+    /**
+     * Run the migrations.
+     */
+    public function up(): void
+    {
+        Schema::table('partidas', function (Blueprint $table): void {
+            // Distinct match dates of a season and standings cut-offs
+            $table->index('data');
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::table('partidas', function (Blueprint $table): void {
+            $table->dropIndex(['data']);
+        });
+    }
+};
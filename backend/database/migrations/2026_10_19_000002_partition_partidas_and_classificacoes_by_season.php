@@ -0,0 +1,108 @@
+<?php
+
+use App\Support\ParticoesPorTemporada;
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\DB;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration {
+    /**
+     * Run the migrations.
+     */
+    public function up(): void
+    {
+        if (DB::getDriverName() !== 'pgsql') {
+            return;
+        }
+
+        // From the oldest stored season through next year
+        $primeiro = min(
+            (int) (DB::table('partidas')->min(DB::raw('EXTRACT(YEAR FROM data)')) ?? now()->year),
+            (int) (DB::table('classificacoes')->min('ano') ?? now()->year),
+            now()->year
+        );
+
+        foreach (ParticoesPorTemporada::TABELAS as $tabela => $coluna) {
+            $this->recriar($tabela, "PARTITION BY RANGE ({$coluna})", function () use ($tabela, $primeiro): void {
+                DB::statement("CREATE TABLE {$tabela}_default PARTITION OF {$tabela} DEFAULT");
+                foreach (range($primeiro, now()->year + 1) as $ano) {
+                    ParticoesPorTemporada::criar($tabela, $ano);
+                }
+            });
+        }
+
+        // The partition key has to be part of every unique constraint
+        Schema::table('partidas', function (Blueprint $table): void {
+            $table->primary(['id', 'data']);
+            $this->partidasConstraints($table);
+        });
+
+        Schema::table('classificacoes', function (Blueprint $table): void {
+            $table->primary(['id', 'ano']);
+            $this->classificacoesConstraints($table);
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        if (DB::getDriverName() !== 'pgsql') {
+            return;
+        }
+
+        // Archived seasons are detached already and stay in their own schema
+        foreach (array_keys(ParticoesPorTemporada::TABELAS) as $tabela) {
+            $this->recriar($tabela, '', fn () => null);
+        }
+
+        Schema::table('partidas', function (Blueprint $table): void {
+            $table->primary('id');
+            $this->partidasConstraints($table);
+        });
+
+        Schema::table('classificacoes', function (Blueprint $table): void {
+            $table->primary('id');
+            $this->classificacoesConstraints($table);
+        });
+    }
+
+    /**
+     * Swaps `$tabela` for a new table with the same columns and `$particionamento`,
+     * copying its rows and keeping its id sequence. Keys and indexes are left
+     * to the caller, which adds them once the rows are in.
+     */
+    private function recriar(string $tabela, string $particionamento, callable $criarParticoes): void
+    {
+        DB::statement("ALTER TABLE {$tabela} RENAME TO {$tabela}_antiga");
+        // Index names are unique per schema, and the new table reuses them
+        foreach (DB::table('pg_indexes')->where('tablename', "{$tabela}_antiga")->pluck('indexname') as $indice) {
+            DB::statement("ALTER INDEX {$indice} RENAME TO {$indice}_antigo");
+        }
+        DB::statement("ALTER SEQUENCE {$tabela}_id_seq OWNED BY NONE");
+
+        DB::statement("CREATE TABLE {$tabela} (LIKE {$tabela}_antiga INCLUDING DEFAULTS) {$particionamento}");
+        $criarParticoes();
+
+        DB::statement("INSERT INTO {$tabela} SELECT * FROM {$tabela}_antiga");
+        DB::statement("DROP TABLE {$tabela}_antiga");
+        DB::statement("ALTER SEQUENCE {$tabela}_id_seq OWNED BY {$tabela}.id");
+    }
+
+    private function partidasConstraints(Blueprint $table): void
+    {
+        $table->foreign('id_time_casa')->references('id')->on('times')->onDelete('cascade');
+        $table->foreign('id_time_visitante')->references('id')->on('times')->onDelete('cascade');
+        $table->index(['id_time_casa', 'data']);
+        $table->index(['id_time_visitante', 'data']);
+        $table->index('data');
+    }
+
+    private function classificacoesConstraints(Blueprint $table): void
+    {
+        $table->foreign('time_id')->references('id')->on('times')->onDelete('cascade');
+        $table->unique(['time_id', 'ano', 'data_atualizacao']);
+    }
+};
@@ -0,0 +1,44 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Support\Facades\DB;
+
+return new class extends Migration {
+    /**
+     * Run the migrations.
+     */
+    public function up(): void
+    {
+        if (DB::getDriverName() !== 'pgsql') {
+            return;
+        }
+
+        DB::statement('CREATE EXTENSION IF NOT EXISTS pg_trgm');
+        DB::statement('CREATE EXTENSION IF NOT EXISTS unaccent SCHEMA public');
+
+        // unaccent() is only STABLE (its dictionary could change), so it cannot
+        // be indexed; pinning the dictionary makes a wrapper that can
+        DB::statement(
+            'CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+            LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+            AS $$ SELECT public.unaccent(\'public.unaccent\'::regdictionary, $1) $$'
+        );
+
+        // Serves the ILIKE '%termo%' and similarity (%) lookups of the team
+        // search, which compare f_unaccent(nome) so "sao" finds "São Paulo"
+        DB::statement('CREATE INDEX times_nome_trgm_index ON times USING gin (f_unaccent(nome) gin_trgm_ops)');
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        if (DB::getDriverName() !== 'pgsql') {
+            return;
+        }
+
+        DB::statement('DROP INDEX IF EXISTS times_nome_trgm_index');
+        DB::statement('DROP FUNCTION IF EXISTS f_unaccent(text)');
+    }
+};
@@ -5,14 +5,23 @@
 use App\Http\Controllers\TimeController;
 use App\Http\Controllers\PartidaController;
 use App\Http\Controllers\ClassificacaoController;
+use App\Http\Controllers\BatchController;
 
 Route::middleware(['auth:sanctum'])->get('/user', function (Request $request): mixed {
     return $request->user();
 });
 
+Route::get('partidas/confronto', [PartidaController::class, 'getConfronto']);
+Route::get('partidas/datas', [PartidaController::class, 'getDatas']);
+Route::get('partidas/export', [PartidaController::class, 'export']);
+Route::get('times/search', [TimeController::class, 'search']);
+Route::get('times/{time}/forma', [TimeController::class, 'getForma']);
 Route::apiResource('times', TimeController::class);
 Route::apiResource('partidas', PartidaController::class);
 Route::get('partidas-by-date', [PartidaController::class, 'getByDate']);
 Route::get('partidas-by-team', [PartidaController::class, 'getByTeam']);
 Route::get('classificacao', [ClassificacaoController::class, 'index']);
 Route::get('classificacao/historico', [ClassificacaoController::class, 'getHistorico']);
+Route::get('classificacao/evolucao', [ClassificacaoController::class, 'getEvolucao']);
+Route::get('classificacao/export', [ClassificacaoController::class, 'export']);
+Route::post('batch', BatchController::class);
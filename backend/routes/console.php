@@ -1,8 +1,87 @@
 <?php
 
+use App\Models\Classificacao;
+use App\Support\ParticoesPorTemporada;
 use Illuminate\Foundation\Inspiring;
 use Illuminate\Support\Facades\Artisan;
+use Illuminate\Support\Facades\DB;
 
 Artisan::command('inspire', function () {
     $this->comment(Inspiring::quote());
 })->purpose('Display an inspiring quote')->hourly();
+
+Artisan::command('classificacao:benchmark {ano} {--runs=5}', function (int $ano) {
+    // Every distinct match date of the season is one standings cut-off
+    $datas = DB::table('partidas')
+        ->whereBetween('data', ["{$ano}-01-01", "{$ano}-12-31"])
+        ->distinct()
+        ->orderBy('data')
+        ->pluck('data');
+
+    if ($datas->isEmpty()) {
+        $this->error("No matches in {$ano}");
+        return 1;
+    }
+
+    $tempos = [];
+    for ($run = 0; $run < (int) $this->option('runs'); $run++) {
+        foreach ($datas as $data) {
+            $inicio = hrtime(true);
+            Classificacao::calcular($ano, $data)->get();
+            $tempos[] = (hrtime(true) - $inicio) / 1e6;
+        }
+    }
+
+    sort($tempos);
+    $percentil = fn (float $p): float => $tempos[(int) floor($p * (count($tempos) - 1))];
+
+    $this->table(['queries', 'mean ms', 'p50 ms', 'p95 ms', 'max ms'], [[
+        count($tempos),
+        round(array_sum($tempos) / count($tempos), 2),
+        round($percentil(0.5), 2),
+        round($percentil(0.95), 2),
+        round(end($tempos), 2)
+    ]]);
+
+    $this->line('Plan for the last round:');
+    $plano = DB::select(
+        'EXPLAIN ANALYZE ' . Classificacao::calcular($ano, $datas->last())->toRawSql()
+    );
+    foreach ($plano as $linha) {
+        $this->line('  ' . current((array) $linha));
+    }
+
+    return 0;
+})->purpose('Time the standings query at every match date of a season');
+
+Artisan::command('temporadas:particionar {ano? : Season to create, next year by default} {--arquivar-ate= : Also archive every season up to this one}', function (?string $ano = null) {
+    if (DB::getDriverName() !== 'pgsql') {
+        $this->error('Season partitions need Postgres');
+        return 1;
+    }
+
+    $ano = (int) ($ano ?? now()->year + 1);
+    $arquivarAte = $this->option('arquivar-ate');
+    if ($arquivarAte !== null && (int) $arquivarAte >= now()->year) {
+        $this->error('Only past seasons can be archived');
+        return 1;
+    }
+
+    foreach (array_keys(ParticoesPorTemporada::TABELAS) as $tabela) {
+        ParticoesPorTemporada::criar($tabela, $ano)
+            ? $this->info("Created {$tabela}_{$ano}")
+            : $this->line("{$tabela}_{$ano} already exists");
+
+        if ($arquivarAte === null) {
+            continue;
+        }
+
+        foreach (ParticoesPorTemporada::temporadas($tabela) as $temporada) {
+            if ($temporada <= (int) $arquivarAte && ParticoesPorTemporada::arquivar($tabela, $temporada)) {
+                $this->info("Archived {$tabela}_{$temporada} to " . ParticoesPorTemporada::ESQUEMA_ARQUIVO);
+            }
+        }
+    }
+
+    return 0;
+})->purpose("Create next season's partitions of partidas and classificacoes, optionally archiving old ones")->monthlyOn(1);
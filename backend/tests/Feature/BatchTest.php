@@ -0,0 +1,108 @@
+<?php
+
+namespace Tests\Feature;
+
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Illuminate\Support\Facades\DB;
+use Illuminate\Testing\TestResponse;
+use Tests\TestCase;
+
+/**
+ * `/api/batch`: every sub-request answers as it would on its own, and only
+ * JSON GETs can be embedded.
+ */
+class BatchTest extends TestCase
+{
+    use RefreshDatabase;
+
+    protected function setUp(): void
+    {
+        parent::setUp();
+
+        $agora = now();
+        DB::table('times')->insert([
+            ['id' => 1, 'nome' => 'Santos', 'created_at' => $agora, 'updated_at' => $agora],
+            ['id' => 2, 'nome' => 'Palmeiras', 'created_at' => $agora, 'updated_at' => $agora],
+        ]);
+        DB::table('partidas')->insert(array_map(fn (string $data): array => [
+            'data' => $data,
+            'id_time_casa' => 1,
+            'gols_time_casa' => 1,
+            'id_time_visitante' => 2,
+            'gols_time_visitante' => 0,
+            'estadio' => 'Vila Belmiro',
+            'created_at' => $agora,
+            'updated_at' => $agora,
+        ], ['2024-04-10', '2024-04-17', '2024-04-17']));
+    }
+
+    public function test_sub_requests_answer_as_they_would_on_their_own(): void
+    {
+        $response = $this->batch([
+            'times' => '/api/times',
+            'datas' => '/api/partidas/datas?ano=2024',
+        ]);
+
+        $response->assertOk();
+        $this->assertSame(
+            ['status' => 200, 'body' => $this->getJson('/api/times')->json()],
+            $response->json('respostas.times')
+        );
+        $this->assertSame(200, $response->json('respostas.datas.status'));
+        $this->assertSame(2024, $response->json('respostas.datas.body.ano'));
+        $this->assertSame(['2024-04-10', '2024-04-17'], $response->json('respostas.datas.body.datas'));
+    }
+
+    public function test_a_failing_sub_request_only_affects_its_own_entry(): void
+    {
+        $response = $this->batch([
+            'times' => '/api/times',
+            'inexistente' => '/api/times/999',
+            'sem_ano' => '/api/partidas/datas',
+        ]);
+
+        $response->assertOk();
+        $this->assertSame(200, $response->json('respostas.times.status'));
+        $this->assertSame(404, $response->json('respostas.inexistente.status'));
+        $this->assertSame(422, $response->json('respostas.sem_ano.status'));
+        $this->assertArrayHasKey('ano', $response->json('respostas.sem_ano.body.errors'));
+    }
+
+    public function test_streamed_exports_come_back_as_406(): void
+    {
+        $response = $this->batch([
+            'export' => '/api/partidas/export?ano_inicio=2024',
+            'times' => '/api/times',
+        ]);
+
+        $response->assertOk();
+        $this->assertSame(406, $response->json('respostas.export.status'));
+        $this->assertSame(200, $response->json('respostas.times.status'));
+    }
+
+    public function test_empty_objects_stay_objects(): void
+    {
+        // No match in that range, so the compact response has no teams
+        $response = $this->batch([
+            'vazio' => '/api/partidas-by-date?data_inicio=1990-01-01&data_fim=1990-12-31&formato=compacto',
+        ]);
+
+        $response->assertOk();
+        $this->assertSame(200, $response->json('respostas.vazio.status'));
+        $this->assertStringContainsString('"times":{}', $response->getContent());
+    }
+
+    public function test_nested_batches_are_rejected(): void
+    {
+        foreach (['/api/batch', '/api/batch?requisicoes[a]=/api/times'] as $url) {
+            $this->batch(['dentro' => $url])
+                ->assertStatus(422)
+                ->assertJsonValidationErrors('requisicoes.dentro');
+        }
+    }
+
+    private function batch(array $requisicoes): TestResponse
+    {
+        return $this->postJson('/api/batch', ['requisicoes' => $requisicoes]);
+    }
+}
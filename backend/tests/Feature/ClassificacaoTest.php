@@ -0,0 +1,108 @@
+<?php
+
+namespace Tests\Feature;
+
+use App\Http\Controllers\ClassificacaoController;
+use App\Models\Classificacao;
+use App\Models\Partida;
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Illuminate\Support\Facades\DB;
+use Tests\TestCase;
+
+/**
+ * Parity between the standings query and the Python reference calculation
+ * (frontend/benchmarks/stub_api.py). The fixture is regenerated with
+ * `python -m benchmarks.standings_fixture` from the frontend directory.
+ */
+class ClassificacaoTest extends TestCase
+{
+    use RefreshDatabase;
+
+    private const CAMPOS = [
+        'id',
+        'nome',
+        'jogos',
+        'pontos',
+        'vitorias',
+        'empates',
+        'derrotas',
+        'gols_pro',
+        'gols_contra',
+        'saldo_gols'
+    ];
+
+    private array $fixture;
+
+    protected function setUp(): void
+    {
+        parent::setUp();
+
+        $this->fixture = json_decode(
+            file_get_contents(__DIR__ . '/../Fixtures/classificacao.json'),
+            true
+        );
+
+        $agora = now();
+        DB::table('times')->insert(array_map(
+            fn (array $time): array => [...$time, 'created_at' => $agora, 'updated_at' => $agora],
+            $this->fixture['times']
+        ));
+        DB::table('partidas')->insert(array_map(
+            fn (array $partida): array => [...$partida, 'created_at' => $agora, 'updated_at' => $agora],
+            $this->fixture['partidas']
+        ));
+    }
+
+    public function test_standings_match_the_reference_calculation(): void
+    {
+        foreach ($this->fixture['casos'] as $caso) {
+            $response = $this->getJson("/api/classificacao?ano={$caso['ano']}&data={$caso['data']}");
+
+            $response->assertOk();
+            $this->assertEquals(
+                $this->linhas($caso['classificacao']),
+                $this->linhas($response->json('data')),
+                "Standings of {$caso['ano']} up to {$caso['data']}"
+            );
+        }
+    }
+
+    public function test_snapshots_match_the_reference_calculation(): void
+    {
+        foreach ($this->fixture['casos'] as $caso) {
+            $partida = Partida::whereDate('data', $caso['data'])->first();
+            if ($partida === null) {
+                continue;
+            }
+
+            app(ClassificacaoController::class)->store($partida);
+
+            $snapshot = Classificacao::where('ano', $caso['ano'])
+                ->whereDate('data_atualizacao', $caso['data'])
+                ->get()
+                ->keyBy('time_id');
+
+            foreach ($caso['classificacao'] as $esperado) {
+                $linha = $snapshot[$esperado['id']];
+                foreach (array_slice(self::CAMPOS, 2) as $campo) {
+                    $this->assertEquals(
+                        $esperado[$campo],
+                        $linha->{$campo},
+                        "{$campo} of team {$esperado['id']} on {$caso['data']}"
+                    );
+                }
+            }
+        }
+    }
+
+    private function linhas(array $classificacao): array
+    {
+        return array_map(
+            fn (array $linha): array => array_map('intval', array_intersect_key(
+                $linha,
+                array_flip(array_diff(self::CAMPOS, ['nome']))
+            )),
+            $classificacao
+        );
+    }
+}
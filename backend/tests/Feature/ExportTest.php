@@ -0,0 +1,135 @@
+<?php
+
+namespace Tests\Feature;
+
+use Illuminate\Foundation\Testing\RefreshDatabase;
+use Illuminate\Support\Facades\DB;
+use Illuminate\Testing\TestResponse;
+use Tests\TestCase;
+
+/**
+ * CSV exports of matches and standings snapshots, read back from the
+ * streamed response.
+ */
+class ExportTest extends TestCase
+{
+    use RefreshDatabase;
+
+    private const NOME_COM_ASPAS = 'Atlético, "Galo" Mineiro';
+
+    protected function setUp(): void
+    {
+        parent::setUp();
+
+        $agora = now();
+        DB::table('times')->insert([
+            ['id' => 1, 'nome' => self::NOME_COM_ASPAS, 'created_at' => $agora, 'updated_at' => $agora],
+            ['id' => 2, 'nome' => 'Santos', 'created_at' => $agora, 'updated_at' => $agora],
+        ]);
+
+        $partidas = [];
+        $snapshots = [];
+        foreach ([2022, 2023, 2024] as $ano) {
+            foreach (["{$ano}-04-10", "{$ano}-11-20"] as $data) {
+                $partidas[] = [
+                    'data' => $data,
+                    'id_time_casa' => 1,
+                    'gols_time_casa' => 2,
+                    'id_time_visitante' => 2,
+                    'gols_time_visitante' => 1,
+                    'estadio' => 'Mineirão',
+                    'created_at' => $agora,
+                    'updated_at' => $agora,
+                ];
+                foreach ([1, 2] as $time) {
+                    $snapshots[] = [
+                        'time_id' => $time,
+                        'ano' => $ano,
+                        'data_atualizacao' => $data,
+                        'jogos' => 1,
+                        'pontos' => $time === 1 ? 3 : 0,
+                        'vitorias' => $time === 1 ? 1 : 0,
+                        'empates' => 0,
+                        'derrotas' => $time === 1 ? 0 : 1,
+                        'gols_pro' => $time === 1 ? 2 : 1,
+                        'gols_contra' => $time === 1 ? 1 : 2,
+                        'saldo_gols' => $time === 1 ? 1 : -1,
+                        'created_at' => $agora,
+                        'updated_at' => $agora,
+                    ];
+                }
+            }
+        }
+        DB::table('partidas')->insert($partidas);
+        DB::table('classificacoes')->insert($snapshots);
+    }
+
+    public function test_partidas_export_streams_every_match_of_the_seasons(): void
+    {
+        $response = $this->get('/api/partidas/export?ano_inicio=2022&ano_fim=2023');
+
+        $response->assertOk();
+        $response->assertHeader('Content-Type', 'text/csv; charset=UTF-8');
+        [$cabecalho, $linhas] = $this->csv($response);
+
+        $this->assertSame(
+            ['id', 'data', 'id_time_casa', 'time_casa', 'gols_time_casa', 'id_time_visitante', 'time_visitante', 'gols_time_visitante', 'estadio'],
+            $cabecalho
+        );
+        $this->assertCount(4, $linhas);
+        $this->assertSame(['2022', '2023'], array_values(array_unique(array_map(
+            fn (array $linha): string => substr($linha[1], 0, 4),
+            $linhas
+        ))));
+    }
+
+    public function test_classificacao_export_streams_every_snapshot_of_the_seasons(): void
+    {
+        $response = $this->get('/api/classificacao/export?ano_inicio=2023&ano_fim=2024');
+
+        $response->assertOk();
+        [$cabecalho, $linhas] = $this->csv($response);
+
+        $this->assertSame(
+            ['ano', 'data_atualizacao', 'time_id', 'time', 'jogos', 'pontos', 'vitorias', 'empates', 'derrotas', 'gols_pro', 'gols_contra', 'saldo_gols'],
+            $cabecalho
+        );
+        $this->assertCount(8, $linhas);
+        $this->assertEqualsCanonicalizing(['2023', '2024'], array_unique(array_column($linhas, 0)));
+    }
+
+    public function test_team_names_are_quoted(): void
+    {
+        $partidas = $this->get('/api/partidas/export?ano_inicio=2024');
+        $classificacao = $this->get('/api/classificacao/export?ano_inicio=2024');
+
+        $this->assertStringContainsString('"Atlético, ""Galo"" Mineiro"', $partidas->streamedContent());
+        $this->assertSame(self::NOME_COM_ASPAS, $this->csv($partidas)[1][0][3]);
+        $this->assertSame(
+            [self::NOME_COM_ASPAS, 'Santos'],
+            array_values(array_unique(array_column($this->csv($classificacao)[1], 3)))
+        );
+    }
+
+    public function test_a_range_that_ends_before_it_starts_is_rejected(): void
+    {
+        foreach (['/api/partidas/export', '/api/classificacao/export'] as $url) {
+            $this->getJson("{$url}?ano_inicio=2024&ano_fim=2023")
+                ->assertStatus(422)
+                ->assertJsonValidationErrors('ano_fim');
+        }
+    }
+
+    /**
+     * @return array{0: list<string>, 1: list<list<string>>}
+     */
+    private function csv(TestResponse $response): array
+    {
+        $linhas = array_map(
+            fn (string $linha): array => str_getcsv($linha, ',', '"', '\\'),
+            explode("\n", trim($response->streamedContent()))
+        );
+
+        return [array_shift($linhas), $linhas];
+    }
+}
@@ -0,0 +1,135 @@
+"""Fixed-concurrency GET load against the API, to compare nginx cache and gzip settings.
+
+Hammers each URL for a fixed duration and reports throughput, latency, bytes
+on the wire and the X-Cache-Status nginx returned. Each run can switch off
+one layer from the client side:
+
+    python -m benchmarks.http_load --base-url http://localhost
+    # Every request misses: a unique query parameter per request
+    python -m benchmarks.http_load --base-url http://localhost --bust-cache
+    # Every request goes to PHP the way a client that just wrote does
+    python -m benchmarks.http_load --base-url http://localhost --bypass-cache
+    # Uncompressed responses
+    python -m benchmarks.http_load --base-url http://localhost --no-gzip
+
+`--matrix` runs the four combinations of cache (on/bypassed) and gzip
+(on/off) one after the other and prints them side by side.
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import collections
+import itertools
+import statistics
+import time
+
+import httpx
+
+DEFAULT_PATHS = [
+    "/api/classificacao?ano=2022&data=2022-06-30",
+    "/api/times",
+]
+
+
+async def hammer(
+    client: httpx.AsyncClient, url: str, concurrency: int, duration: float, bust_cache: bool
+) -> tuple[list[float], collections.Counter, int]:
+    latencies: list[float] = []
+    statuses: collections.Counter = collections.Counter()
+    wire_bytes = 0
+    counter = itertools.count()
+    deadline = time.perf_counter() + duration
+
+    async def worker() -> None:
+        nonlocal wire_bytes
+        while time.perf_counter() < deadline:
+            params = {"nocache": next(counter)} if bust_cache else None
+            started = time.perf_counter()
+            try:
+                response = await client.get(url, params=params)
+            except httpx.HTTPError as e:
+                statuses[type(e).__name__] += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+            wire_bytes += response.num_bytes_downloaded
+            statuses[f"{response.status_code} {response.headers.get('X-Cache-Status', '-')}"] += 1
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, statuses, wire_bytes
+
+
+async def run(
+    base_url: str,
+    paths: list[str],
+    concurrency: int,
+    duration: float,
+    bust_cache: bool,
+    bypass_cache: bool,
+    gzip: bool,
+) -> dict[str, dict]:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    headers = {"Accept": "application/json", "Accept-Encoding": "gzip" if gzip else "identity"}
+    if bypass_cache:
+        # Same header the Python clients send after a write (nginx/conf.d/app.conf)
+        headers["X-Api-Escrita"] = "1"
+
+    results = {}
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=httpx.Timeout(30.0), headers=headers
+    ) as client:
+        for path in paths:
+            latencies, statuses, wire_bytes = await hammer(client, path, concurrency, duration, bust_cache)
+            if not latencies:
+                results[path] = {"statuses": dict(statuses)}
+                continue
+            quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+            results[path] = {
+                "rps": len(latencies) / duration,
+                "p50": quantiles[49] * 1000,
+                "p95": quantiles[94] * 1000,
+                "kb": wire_bytes / len(latencies) / 1024,
+                "statuses": dict(statuses),
+            }
+    return results
+
+
+def print_results(label: str, results: dict[str, dict]) -> None:
+    print(label)
+    for path, stats in results.items():
+        if "rps" not in stats:
+            print(f"  {path}: no successful requests ({stats['statuses']})")
+            continue
+        print(
+            f"  {path}\n"
+            f"    {stats['rps']:.1f} req/s  p50 {stats['p50']:.1f} ms  p95 {stats['p95']:.1f} ms  "
+            f"{stats['kb']:.1f} KB/response  {stats['statuses']}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--bust-cache", action="store_true", help="unique query string per request")
+    parser.add_argument("--bypass-cache", action="store_true", help="send X-Api-Escrita so nginx skips its cache")
+    parser.add_argument("--no-gzip", action="store_true", help="ask for uncompressed responses")
+    parser.add_argument("--matrix", action="store_true", help="run cache on/bypassed x gzip on/off")
+    parser.add_argument("paths", nargs="*", default=DEFAULT_PATHS)
+    args = parser.parse_args()
+
+    if args.matrix:
+        runs = [(cache, gzip) for cache in (True, False) for gzip in (True, False)]
+    else:
+        runs = [(not args.bypass_cache, not args.no_gzip)]
+
+    for cache, gzip in runs:
+        results = asyncio.run(
+            run(args.base_url, args.paths, args.concurrency, args.duration, args.bust_cache, not cache, gzip)
+        )
+        print_results(f"cache {'on' if cache else 'bypassed'}, gzip {'on' if gzip else 'off'}", results)
+
+
+if __name__ == "__main__":
+    main()
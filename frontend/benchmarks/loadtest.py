@@ -0,0 +1,234 @@
+"""Scenario load test that drives the API through the frontend's own clients.
+
+Virtual users loop over a weighted mix of scenarios for a fixed duration.
+Every call goes through TimeAPI, PartidaAPI or ClassificacaoAPI, so the
+numbers include the client-side cost the Rio pages pay (one connection per
+call, JSON decoding). Results are printed per scenario and can be saved and
+compared between runs:
+
+    python -m benchmarks.loadtest --base-url http://localhost --output before.json
+    python -m benchmarks.loadtest --base-url http://localhost --compare before.json
+
+Against the in-memory stub instead of the compose stack:
+
+    python -m benchmarks.stub_api --port 8001 &
+    python -m benchmarks.loadtest --base-url http://127.0.0.1:8001
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import Any, Awaitable, Callable
+
+from frontend.Models.Classificacao import ClassificacaoAPI
+from frontend.Models.Partida import Partida, PartidaAPI
+from frontend.Models.SharedCache import SharedCache
+from frontend.Models.Time import Time, TimeAPI
+
+
+@dataclass
+class ScenarioStats:
+    iterations: int = 0
+    errors: int = 0
+    latencies: list[float] = field(default_factory=list)
+
+    def summary(self, duration: float) -> dict[str, Any]:
+        latencies = sorted(self.latencies)
+        quantiles = statistics.quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else []
+
+        def percentile(p: int) -> float | None:
+            if quantiles:
+                return round(quantiles[p - 1] * 1000, 2)
+            return round(latencies[0] * 1000, 2) if latencies else None
+
+        return {
+            "iterations": self.iterations,
+            "requests": len(latencies),
+            "errors": self.errors,
+            "throughput_rps": round(len(latencies) / duration, 2),
+            "latency_ms": {"p50": percentile(50), "p95": percentile(95), "p99": percentile(99)},
+        }
+
+
+@dataclass
+class Context:
+    """Data discovered before the run that scenarios pick from"""
+
+    times: list[Time]
+    match_dates: list[date]
+    ano: int
+
+
+class Session:
+    """One virtual user; times every API call it makes into the scenario's stats"""
+
+    def __init__(self, context: Context, rng: random.Random) -> None:
+        self.context = context
+        self.rng = rng
+        self.stats: ScenarioStats | None = None
+
+    async def call(self, request: Awaitable[Any]) -> Any:
+        started = time.perf_counter()
+        result = await request
+        self.stats.latencies.append(time.perf_counter() - started)
+        # The clients swallow errors and return None or False. An empty list is
+        # a valid answer (a team without matches), so it is not counted.
+        if result is None or result is False:
+            self.stats.errors += 1
+        return result
+
+
+async def standings_browsing(session: Session) -> None:
+    """A fan opens the standings and steps through a few consecutive match days"""
+    dates = session.context.match_dates
+    start = session.rng.randrange(len(dates))
+    for dia in dates[start : start + 5]:
+        await session.call(ClassificacaoAPI.get_classificacao(session.context.ano, dia.isoformat()))
+
+
+async def match_entry(session: Session) -> None:
+    """An operator enters a result during a round, corrects the score, then removes it to keep data stable"""
+    casa, visitante = session.rng.sample(session.context.times, 2)
+    partida = Partida(
+        data=session.rng.choice(session.context.match_dates),
+        id_time_casa=casa.id,
+        gols_time_casa=session.rng.randint(0, 4),
+        id_time_visitante=visitante.id,
+        gols_time_visitante=session.rng.randint(0, 3),
+        estadio=casa.estadio or "Estádio",
+    )
+    created = await session.call(PartidaAPI.create(partida))
+    if not created:
+        return
+    created.gols_time_casa += 1
+    await session.call(PartidaAPI.update(created))
+    await session.call(PartidaAPI.delete(created.id))
+
+
+async def team_filtering(session: Session) -> None:
+    """A user opens the match list and filters it by a couple of teams"""
+    await session.call(TimeAPI.get_all())
+    for time_ in session.rng.sample(session.context.times, 2):
+        await session.call(PartidaAPI.get_all(time_))
+
+
+SCENARIOS: dict[str, Callable[[Session], Awaitable[None]]] = {
+    "standings_browsing": standings_browsing,
+    "match_entry": match_entry,
+    "team_filtering": team_filtering,
+}
+
+
+def configure_clients(base_url: str) -> None:
+    api = base_url.rstrip("/") + "/api"
+    TimeAPI.BASE_URL = f"{api}/times"
+    PartidaAPI.BASE_URL = f"{api}/partidas"
+    PartidaAPI.BY_TEAM_URL = f"{api}/partidas-by-team"
+    ClassificacaoAPI.BASE_URL = f"{api}/classificacao"
+
+
+async def discover() -> Context:
+    times = await TimeAPI.get_all()
+    partidas = await PartidaAPI.get_all()
+    if len(times) < 2 or not partidas:
+        raise SystemExit("The API needs at least two teams and one match to run the scenarios")
+
+    ano = max(partida.data.year for partida in partidas)
+    match_dates = sorted({partida.data for partida in partidas if partida.data.year == ano})
+    return Context(times=times, match_dates=match_dates, ano=ano)
+
+
+async def run(mix: dict[str, int], concurrency: int, duration: float, seed: int) -> dict[str, Any]:
+    context = await discover()
+    stats = {name: ScenarioStats() for name in mix}
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    deadline = time.perf_counter() + duration
+
+    async def virtual_user(index: int) -> None:
+        session = Session(context, random.Random(seed + index))
+        while time.perf_counter() < deadline:
+            name = session.rng.choices(names, weights)[0]
+            session.stats = stats[name]
+            await SCENARIOS[name](session)
+            stats[name].iterations += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(virtual_user(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "concurrency": concurrency,
+        "duration_s": round(elapsed, 2),
+        "mix": mix,
+        "scenarios": {name: stats[name].summary(elapsed) for name in names},
+    }
+
+
+def print_results(results: dict[str, Any], baseline: dict[str, Any] | None) -> None:
+    print(f"{results['concurrency']} users for {results['duration_s']}s")
+    print(f"{'scenario':20} {'iter':>6} {'req':>7} {'err':>5} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for name, summary in results["scenarios"].items():
+        latency = summary["latency_ms"]
+        print(
+            f"{name:20} {summary['iterations']:>6} {summary['requests']:>7} {summary['errors']:>5} "
+            f"{summary['throughput_rps']:>8.1f} {latency['p50'] or 0:>8.1f} {latency['p95'] or 0:>8.1f} "
+            f"{latency['p99'] or 0:>8.1f}"
+        )
+        previous = (baseline or {}).get("scenarios", {}).get(name)
+        if previous and previous["throughput_rps"] and previous["latency_ms"]["p95"]:
+            throughput = summary["throughput_rps"] / previous["throughput_rps"] - 1
+            p95 = (latency["p95"] or 0) / previous["latency_ms"]["p95"] - 1
+            print(f"{'':20} vs baseline: req/s {throughput:+.1%}, p95 {p95:+.1%}")
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"unknown scenario {name!r}, expected one of {', '.join(SCENARIOS)}")
+        mix[name] = int(weight or 1)
+    return mix
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--mix", type=parse_mix, default="standings_browsing=6,team_filtering=3,match_entry=1")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--client-cache", action="store_true", help="let the clients serve repeated reads from their response cache"
+    )
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="JSON results of a previous run to compare against")
+    args = parser.parse_args()
+
+    configure_clients(args.base_url)
+    if not args.client_cache:
+        SharedCache.TTL = 0
+    results = asyncio.run(run(args.mix, args.concurrency, args.duration, args.seed))
+    results["base_url"] = args.base_url
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
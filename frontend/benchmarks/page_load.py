@@ -0,0 +1,115 @@
+"""Load time of the Partidas and Classificação pages with and without request batching.
+
+Replays the API calls each page makes when it opens, through the same model
+classes, once with `BatchClient` coalescing concurrent reads into
+`/api/batch` and once with one HTTP request per read. The response caches
+are cleared before every load so each one goes to the API:
+
+    # In-memory stub that serves one request at a time, like `php artisan serve`.
+    # Every read costs its query time, batched or not; a batch saves the boot.
+    python -m benchmarks.stub_api --port 8001 --boot-ms 15 --delay-ms 5 --workers 1 &
+    python -m benchmarks.page_load --base-url http://127.0.0.1:8001 --ano 2024
+
+    # Through nginx in the compose stack
+    python -m benchmarks.page_load --base-url http://nginx --ano 2025
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import date
+from typing import Any, Awaitable, Callable
+
+from frontend.Models.BatchClient import BatchClient
+from frontend.Models.ClassificacaoCache import ClassificacaoCache
+from frontend.Models.Partida import PartidaAPI
+from frontend.Models.SharedCache import SharedCache
+
+from .loadtest import configure_clients
+
+
+async def partidas_page(ano: int) -> None:
+    # PartidasPage.on_populate; teams come from the matches and the type-ahead search
+    await PartidaAPI.get_all()
+
+
+async def classificacao_page(ano: int) -> None:
+    # DashClassificacaoPage.on_populate: round dates, the table, then its neighbours
+    cache = ClassificacaoCache()
+    datas = await PartidaAPI.get_datas(ano)
+    if not datas:
+        raise SystemExit(f"The API has no matches in {ano}")
+
+    indice = len(datas) // 2
+    await cache.fetch(ano, datas[indice].isoformat())
+    vizinhas = [datas[i].isoformat() for i in (indice + 1, indice - 1, indice + 2) if 0 <= i < len(datas)]
+    await cache.prefetch(ano, vizinhas)
+
+
+PAGES: dict[str, Callable[[int], Awaitable[None]]] = {
+    "partidas": partidas_page,
+    "classificacao": classificacao_page,
+}
+
+
+def summary(latencies: list[float]) -> dict[str, float]:
+    latencies = sorted(latencies)
+    quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "p50": round(quantiles[49] * 1000, 1),
+        "p95": round(quantiles[94] * 1000, 1),
+        "max": round(latencies[-1] * 1000, 1),
+    }
+
+
+async def measure(page: Callable[[int], Awaitable[None]], ano: int, loads: int) -> list[float]:
+    latencies = []
+    for _ in range(loads):
+        started = time.perf_counter()
+        await page(ano)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+async def run(pages: list[str], ano: int, loads: int) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    for name in pages:
+        for batched in (False, True):
+            BatchClient.enabled = batched
+            # Warm-up load, so connection setup and first-call imports do not count
+            await PAGES[name](ano)
+            results[f"{name} {'batched' if batched else 'unbatched'}"] = summary(
+                await measure(PAGES[name], ano, loads)
+            )
+    BatchClient.enabled = True
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost")
+    parser.add_argument("--ano", type=int, default=date.today().year, help="season the Classificação page shows")
+    parser.add_argument("--pages", nargs="+", choices=list(PAGES), default=list(PAGES))
+    parser.add_argument("--loads", type=int, default=50, help="page loads per mode")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    args = parser.parse_args()
+
+    configure_clients(args.base_url)
+    SharedCache.TTL = 0
+    results = asyncio.run(run(args.pages, args.ano, args.loads))
+
+    print(f"{args.loads} loads per page against {args.base_url}")
+    print(f"{'':26} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    for name, stats in results.items():
+        print(f"{name:26} {stats['p50']:>8.1f} {stats['p95']:>8.1f} {stats['max']:>8.1f}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Scenario load test of the compose stack with and without PgBouncer.
+
+Brings the stack up as `compose.yaml` (PHP-FPM opens a Postgres connection
+per request) and then as `compose.yaml` + `compose.pooled.yaml` (persistent
+connections through PgBouncer), runs the `loadtest` mix against nginx on
+each, and prints req/s and p50/p95/p99 per scenario with the pooled run
+compared to the direct one. Needs Docker and a seeded database; run it from
+this directory:
+
+    python -m benchmarks.pooling --duration 60 --output pooling.json
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import subprocess
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from benchmarks import loadtest
+from frontend.Models.SharedCache import SharedCache
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+CONFIGS = {
+    "direct": ["compose.yaml"],
+    "pooled": ["compose.yaml", "compose.pooled.yaml"],
+}
+
+
+def compose_up(files: list[str]) -> None:
+    command = ["docker", "compose"]
+    for file in files:
+        command += ["-f", str(ROOT / file)]
+    # --remove-orphans stops pgbouncer again when going back to the direct stack
+    subprocess.run([*command, "up", "-d", "--build", "--remove-orphans"], check=True, cwd=ROOT)
+
+
+def wait_for_api(base_url: str, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if httpx.get(f"{base_url}/api/times", timeout=5).is_success:
+                return
+        except httpx.HTTPError:
+            pass
+        if time.monotonic() > deadline:
+            raise SystemExit(f"{base_url}/api/times did not answer within {timeout:.0f}s")
+        time.sleep(1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost", help="nginx as published by compose.yaml")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--warmup", type=float, default=5.0, help="seconds of load discarded before each run")
+    parser.add_argument("--mix", type=loadtest.parse_mix, default="standings_browsing=6,team_filtering=3,match_entry=1")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--startup-timeout", type=float, default=180.0)
+    parser.add_argument("--output", help="write both runs as JSON to this file")
+    args = parser.parse_args()
+
+    loadtest.configure_clients(args.base_url)
+    # Every read has to reach nginx and PHP
+    SharedCache.TTL = 0
+
+    results: dict[str, Any] = {}
+    for name, files in CONFIGS.items():
+        print(f"== {name}: {' + '.join(files)}", flush=True)
+        compose_up(files)
+        wait_for_api(args.base_url, args.startup_timeout)
+        if args.warmup > 0:
+            asyncio.run(loadtest.run(args.mix, args.concurrency, args.warmup, args.seed))
+        results[name] = asyncio.run(loadtest.run(args.mix, args.concurrency, args.duration, args.seed))
+        results[name]["compose_files"] = files
+        loadtest.print_results(results[name], results.get("direct") if name != "direct" else None)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""Session capacity of the Rio frontend as the number of worker processes grows.
+
+Each simulated visitor loads a page, opens the Rio websocket with the session
+token embedded in the HTML and waits for the first render, then keeps the
+session open until the run ends. The time from the page request to the first
+render is what a user waits for; it climbs once the workers' event loops
+saturate. Sessions are opened at a steady rate and results are printed per
+worker count:
+
+    # Spawns `frontend.serve` and the in-memory stub API locally for each count
+    python -m benchmarks.rio_sessions --workers 1 2 4 --sessions 200 --rate 50
+
+    # Against a running deployment, through the nginx sticky proxy
+    python -m benchmarks.rio_sessions --url http://localhost:8000 --sessions 200
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+import websockets
+from rio.data_models import InitialClientMessage
+
+ROOT = Path(__file__).resolve().parent.parent
+SESSION_TOKEN = re.compile(r'SESSION_TOKEN = "([^"]+)"')
+# Rio serves crawlers a static render without a session, so look like a browser
+USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0 Safari/537.36"
+
+
+@dataclass
+class RunStats:
+    opened: int = 0
+    failures: int = 0
+    latencies: list[float] = field(default_factory=list)
+
+    def summary(self) -> dict[str, Any]:
+        latencies = sorted(self.latencies)
+        quantiles = statistics.quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else []
+
+        def percentile(p: int) -> float | None:
+            if quantiles:
+                return round(quantiles[p - 1] * 1000, 1)
+            return round(latencies[0] * 1000, 1) if latencies else None
+
+        return {
+            "sessions": self.opened,
+            "failures": self.failures,
+            "first_render_ms": {
+                "p50": percentile(50),
+                "p95": percentile(95),
+                "max": round(latencies[-1] * 1000, 1) if latencies else None,
+            },
+        }
+
+
+async def open_session(base_url: str, path: str, stats: RunStats, done: asyncio.Event) -> None:
+    started = time.perf_counter()
+    url = base_url.rstrip("/") + path
+    try:
+        # One client per visitor, so the sticky cookie set by the proxy stays with its session
+        async with httpx.AsyncClient(headers={"User-Agent": USER_AGENT}, timeout=60) as client:
+            response = await client.get(url)
+            response.raise_for_status()
+            token = SESSION_TOKEN.search(response.text).group(1)
+            cookies = "; ".join(f"{name}={value}" for name, value in client.cookies.items())
+
+        ws_url = re.sub(r"^http", "ws", base_url.rstrip("/")) + f"/rio/ws?sessionToken={token}"
+        headers = {"User-Agent": USER_AGENT} | ({"Cookie": cookies} if cookies else {})
+        async with websockets.connect(ws_url, additional_headers=headers, max_size=None, open_timeout=60) as ws:
+            await ws.send(json.dumps(InitialClientMessage.from_defaults(url=url).as_json()))
+            # The first server message carries the initial component tree
+            await asyncio.wait_for(ws.recv(), timeout=60)
+            stats.latencies.append(time.perf_counter() - started)
+            stats.opened += 1
+            await done.wait()
+    except Exception as e:
+        stats.failures += 1
+        if stats.failures <= 3:
+            print(f"session failed: {e!r}", file=sys.stderr)
+
+
+async def run(base_urls: list[str], path: str, sessions: int, rate: float, hold: float) -> dict[str, Any]:
+    stats = RunStats()
+    done = asyncio.Event()
+    tasks = []
+    for index in range(sessions):
+        # Without a proxy in front, spread sessions over the workers round robin
+        tasks.append(asyncio.create_task(open_session(base_urls[index % len(base_urls)], path, stats, done)))
+        await asyncio.sleep(1 / rate)
+
+    await asyncio.sleep(hold)
+    done.set()
+    await asyncio.gather(*tasks)
+    return stats.summary()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(url: str, timeout: float = 60) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(url, headers={"User-Agent": USER_AGENT}, timeout=2)
+            return
+        except httpx.TransportError:
+            time.sleep(0.2)
+    raise SystemExit(f"{url} did not come up within {timeout:.0f}s")
+
+
+def start(command: list[str], env: dict[str, str]) -> subprocess.Popen:
+    return subprocess.Popen(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL)
+
+
+def local_run(workers: int, args: argparse.Namespace, api_url: str) -> dict[str, Any]:
+    base_port = free_port()
+    env = os.environ | {
+        "API_URL": api_url,
+        "FRONTEND_CACHE_PATH": os.path.join(tempfile.mkdtemp(), "cache.sqlite3"),
+    }
+    server = start(
+        [sys.executable, "-m", "frontend.serve", "--workers", str(workers), "--base-port", str(base_port)], env
+    )
+    try:
+        base_urls = [f"http://127.0.0.1:{base_port + index}" for index in range(workers)]
+        for url in base_urls:
+            wait_for(url)
+        return asyncio.run(run(base_urls, args.path, args.sessions, args.rate, args.hold))
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="running frontend or proxy; without it workers are started locally")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="worker counts to start locally")
+    parser.add_argument("--api-url", help="API for the local workers; defaults to a local benchmarks.stub_api")
+    parser.add_argument("--path", default="/classificacao", help="page every session opens")
+    parser.add_argument("--sessions", type=int, default=100)
+    parser.add_argument("--rate", type=float, default=25.0, help="new sessions per second")
+    parser.add_argument("--hold", type=float, default=2.0, help="seconds to keep all sessions open at the end")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {}
+    if args.url:
+        results["proxy"] = asyncio.run(run([args.url], args.path, args.sessions, args.rate, args.hold))
+    else:
+        stub = None
+        api_url = args.api_url
+        if api_url is None:
+            port = free_port()
+            stub = start([sys.executable, "-m", "benchmarks.stub_api", "--port", str(port)], dict(os.environ))
+            api_url = f"http://127.0.0.1:{port}/api"
+            wait_for(f"{api_url}/times")
+        try:
+            for workers in args.workers:
+                results[f"{workers} workers"] = local_run(workers, args, api_url)
+        finally:
+            if stub is not None:
+                stub.terminate()
+
+    print(f"{args.sessions} sessions on {args.path} at {args.rate:g}/s")
+    print(f"{'':12} {'opened':>7} {'failed':>7} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    for name, summary in results.items():
+        render = summary["first_render_ms"]
+        print(
+            f"{name:12} {summary['sessions']:>7} {summary['failures']:>7} "
+            f"{render['p50'] or 0:>8.1f} {render['p95'] or 0:>8.1f} {render['max'] or 0:>8.1f}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
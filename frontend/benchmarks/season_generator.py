@@ -0,0 +1,269 @@
+"""Synthetic league seasons for benchmarks.
+
+Every season is a double round robin (circle method) over all teams, with
+rounds spread from April to December and scores drawn from Poisson
+distributions driven by per-team attack/defence strength and a home
+advantage. Leagues with more rounds than calendar days play several rounds
+on the same date. Rows are generated lazily, so memory stays O(teams) regardless of
+how many seasons are written.
+
+    # CSV or JSON lines files (times.* and partidas.*)
+    python -m benchmarks.season_generator --teams 20 --seasons 10 --format csv --output-dir data/
+
+    # Straight into Postgres with COPY
+    python -m benchmarks.season_generator --teams 1000 --seasons 5 --format copy \\
+        | psql -h localhost -p 5434 -U postgres laravel
+
+    # Through the API (also builds the classificacoes snapshots, but slowly)
+    python -m benchmarks.season_generator --teams 20 --format api --base-url http://localhost
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import csv
+import json
+import math
+import os
+import random
+import sys
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import IO, Iterator
+
+TIME_FIELDS = ["id", "nome", "estadio", "cidade"]
+PARTIDA_FIELDS = ["id", "data", "id_time_casa", "gols_time_casa", "id_time_visitante", "gols_time_visitante", "estadio"]
+
+CIDADES = [
+    "São Paulo",
+    "Rio de Janeiro",
+    "Belo Horizonte",
+    "Porto Alegre",
+    "Curitiba",
+    "Salvador",
+    "Recife",
+    "Fortaleza",
+    "Goiânia",
+    "Florianópolis",
+    "Cuiabá",
+    "Belém",
+    "Manaus",
+    "Natal",
+    "Campinas",
+    "Santos",
+    "Caxias do Sul",
+    "Juiz de Fora",
+    "Londrina",
+    "Maceió",
+]
+PREFIXOS = ["Esporte Clube", "Atlético", "Sport Club", "Grêmio", "América", "Botafogo", "Independente", "União"]
+
+# Average goals per side in the Brasileirão is about 1.4 at home and 1.0 away
+GOLS_BASE = 1.15
+VANTAGEM_CASA = 0.18
+
+
+@dataclass
+class SeasonGenerator:
+    teams: int = 20
+    seasons: int = 1
+    first_year: int = date.today().year
+    seed: int = 0
+    _strengths: list[tuple[float, float]] = field(default_factory=list, init=False, repr=False)
+
+    def times(self) -> Iterator[dict]:
+        for id in range(1, self.teams + 1):
+            nome = self._nome(id)
+            yield {"id": id, "nome": nome, "estadio": f"Estádio {nome}", "cidade": CIDADES[(id - 1) % len(CIDADES)]}
+
+    def partidas(self) -> Iterator[dict]:
+        rng = random.Random(self.seed)
+        # (attack, defence) per team; drifts a little from one season to the next
+        self._strengths = [(rng.gauss(0, 0.25), rng.gauss(0, 0.25)) for _ in range(self.teams)]
+        id = 0
+
+        for ano in range(self.first_year, self.first_year + self.seasons):
+            self._strengths = [(a * 0.8 + rng.gauss(0, 0.12), d * 0.8 + rng.gauss(0, 0.12)) for a, d in self._strengths]
+            for data, casa, visitante in self._schedule(ano, rng):
+                id += 1
+                yield {
+                    "id": id,
+                    "data": data.isoformat(),
+                    "id_time_casa": casa,
+                    "gols_time_casa": self._gols(casa, visitante, rng, VANTAGEM_CASA),
+                    "id_time_visitante": visitante,
+                    "gols_time_visitante": self._gols(visitante, casa, rng, -VANTAGEM_CASA),
+                    "estadio": f"Estádio {self._nome(casa)}",
+                }
+
+    def _nome(self, id: int) -> str:
+        cidade = CIDADES[(id - 1) % len(CIDADES)]
+        prefixo = PREFIXOS[(id - 1) // len(CIDADES) % len(PREFIXOS)]
+        geracao = (id - 1) // (len(CIDADES) * len(PREFIXOS))
+        return f"{prefixo} {cidade}" + (f" {geracao + 1}" if geracao else "")
+
+    def _schedule(self, ano: int, rng: random.Random) -> Iterator[tuple[date, int, int]]:
+        """Double round robin by the circle method; the second half mirrors the first with venues swapped"""
+        order: list[int | None] = list(range(1, self.teams + 1))
+        rng.shuffle(order)
+        if len(order) % 2:
+            order.append(None)
+
+        n = len(order)
+        rounds = n - 1
+        inicio = date(ano, 4, 10)
+        dias = (date(ano, 12, 8) - inicio).days
+        # Rounds are played over a weekend when the calendar leaves room for it
+        fim_de_semana = 2 if dias // (2 * rounds) >= 2 else 1
+
+        for turno in range(2):
+            rotation = list(order)
+            for rodada in range(rounds):
+                indice = turno * rounds + rodada
+                dia_rodada = inicio + timedelta(days=dias * indice // (2 * rounds))
+                # Yield in date order, so loading through the API builds consistent snapshots
+                for dia in range(fim_de_semana):
+                    for i in range(dia, n // 2, fim_de_semana):
+                        a, b = rotation[i], rotation[n - 1 - i]
+                        if a is None or b is None:
+                            continue
+                        # Alternate venues so nobody plays a long run of home games
+                        if (rodada + i) % 2:
+                            a, b = b, a
+                        if turno:
+                            a, b = b, a
+                        yield dia_rodada + timedelta(days=dia), a, b
+                rotation.insert(1, rotation.pop())
+
+    def _gols(self, time_id: int, adversario_id: int, rng: random.Random, mando: float) -> int:
+        ataque = self._strengths[time_id - 1][0]
+        defesa = self._strengths[adversario_id - 1][1]
+        return _poisson(rng, GOLS_BASE * math.exp(ataque - defesa + mando))
+
+
+def _poisson(rng: random.Random, lam: float) -> int:
+    limite = math.exp(-lam)
+    k, p = 0, rng.random()
+    while p > limite:
+        k += 1
+        p *= rng.random()
+    return k
+
+
+def write_csv(rows: Iterator[dict], fields: list[str], out: IO[str]) -> int:
+    writer = csv.DictWriter(out, fieldnames=fields, lineterminator="\n")
+    writer.writeheader()
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def write_jsonl(rows: Iterator[dict], out: IO[str]) -> int:
+    count = 0
+    for row in rows:
+        out.write(json.dumps(row, ensure_ascii=False))
+        out.write("\n")
+        count += 1
+    return count
+
+
+def write_copy(generator: SeasonGenerator, out: IO[str]) -> None:
+    """A psql script that bulk loads both tables and moves the id sequences past the generated ids"""
+    out.write("BEGIN;\n")
+    out.write(f"COPY times ({', '.join(TIME_FIELDS)}, created_at, updated_at) FROM STDIN WITH (FORMAT csv);\n")
+    _copy_rows(generator.times(), TIME_FIELDS, out)
+    out.write(f"COPY partidas ({', '.join(PARTIDA_FIELDS)}, created_at, updated_at) FROM STDIN WITH (FORMAT csv);\n")
+    _copy_rows(generator.partidas(), PARTIDA_FIELDS, out)
+    for table in ("times", "partidas"):
+        out.write(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT COALESCE(MAX(id), 1) FROM {table}));\n")
+    out.write("COMMIT;\n")
+
+
+def _copy_rows(rows: Iterator[dict], fields: list[str], out: IO[str]) -> None:
+    writer = csv.writer(out, lineterminator="\n")
+    for row in rows:
+        writer.writerow([row[field] for field in fields] + ["now", "now"])
+    out.write("\\.\n")
+
+
+async def load_api(generator: SeasonGenerator, base_url: str, concurrency: int) -> None:
+    """Creates teams and matches through the API clients, in date order so standings snapshots stay consistent"""
+    from frontend.Models.Partida import Partida, PartidaAPI
+    from frontend.Models.Time import Time, TimeAPI
+    from .loadtest import configure_clients
+
+    configure_clients(base_url)
+
+    ids: dict[int, int] = {}
+    for row in generator.times():
+        created = await TimeAPI.create(Time(nome=row["nome"], estadio=row["estadio"], cidade=row["cidade"]))
+        if created is None:
+            raise SystemExit(f"Could not create team {row['nome']!r}")
+        ids[row["id"]] = created.id
+
+    pending: set[asyncio.Task] = set()
+    falhas = 0
+    for row in generator.partidas():
+        partida = Partida(
+            data=date.fromisoformat(row["data"]),
+            id_time_casa=ids[row["id_time_casa"]],
+            gols_time_casa=row["gols_time_casa"],
+            id_time_visitante=ids[row["id_time_visitante"]],
+            gols_time_visitante=row["gols_time_visitante"],
+            estadio=row["estadio"],
+        )
+        pending.add(asyncio.create_task(PartidaAPI.create(partida)))
+        if len(pending) >= concurrency:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            falhas += sum(task.result() is None for task in done)
+
+    if pending:
+        done, _ = await asyncio.wait(pending)
+        falhas += sum(task.result() is None for task in done)
+
+    if falhas:
+        print(f"{falhas} partidas could not be created", file=sys.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--teams", type=int, default=20)
+    parser.add_argument("--seasons", type=int, default=1)
+    parser.add_argument("--first-year", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--format", choices=["csv", "jsonl", "copy", "api"], default="csv")
+    parser.add_argument("--output-dir", default=".", help="directory for the csv/jsonl files")
+    parser.add_argument("--base-url", default="http://localhost", help="API to load with --format api")
+    parser.add_argument("--concurrency", type=int, default=1, help="parallel API writes with --format api")
+    args = parser.parse_args()
+
+    if args.teams < 2:
+        parser.error("--teams must be at least 2")
+
+    generator = SeasonGenerator(
+        teams=args.teams,
+        seasons=args.seasons,
+        first_year=args.first_year or date.today().year - args.seasons + 1,
+        seed=args.seed,
+    )
+
+    if args.format == "copy":
+        write_copy(generator, sys.stdout)
+    elif args.format == "api":
+        asyncio.run(load_api(generator, args.base_url, args.concurrency))
+    else:
+        os.makedirs(args.output_dir, exist_ok=True)
+        for name, rows, fields in (
+            ("times", generator.times(), TIME_FIELDS),
+            ("partidas", generator.partidas(), PARTIDA_FIELDS),
+        ):
+            path = os.path.join(args.output_dir, f"{name}.{args.format}")
+            with open(path, "w", newline="", encoding="utf-8") as out:
+                count = write_csv(rows, fields, out) if args.format == "csv" else write_jsonl(rows, out)
+            print(f"{path}: {count} rows", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
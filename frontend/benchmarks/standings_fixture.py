@@ -0,0 +1,58 @@
+"""Expected standings from the Python reference, for the backend parity test.
+
+Generates a small league and writes its teams, matches and the standings
+`benchmarks.stub_api.classificacao` computes at several cut-off dates to a
+JSON file. `tests/Feature/ClassificacaoTest.php` in the backend loads the
+same rows into the database and checks that the SQL query returns exactly
+these tables:
+
+    python -m benchmarks.standings_fixture --output ../backend/tests/Fixtures/classificacao.json
+"""
+
+from __future__ import annotations
+import argparse
+import json
+from datetime import date, timedelta
+
+from .season_generator import SeasonGenerator
+from .stub_api import classificacao
+
+
+def build(teams: int, seasons: int, first_year: int, seed: int) -> dict:
+    generator = SeasonGenerator(teams=teams, seasons=seasons, first_year=first_year, seed=seed)
+    times = list(generator.times())
+    partidas = list(generator.partidas())
+
+    casos = []
+    for ano in range(first_year, first_year + seasons):
+        datas = sorted({date.fromisoformat(p["data"]) for p in partidas if p["data"].startswith(str(ano))})
+        # Before the first round, on and between rounds, the last round, and a date in the next season
+        cortes = [date(ano, 1, 1), datas[0], datas[len(datas) // 2] + timedelta(days=1), datas[-1], date(ano + 1, 6, 1)]
+        for corte in cortes:
+            casos.append(
+                {
+                    "ano": ano,
+                    "data": corte.isoformat(),
+                    "classificacao": classificacao(times, partidas, ano, corte),
+                }
+            )
+
+    return {"times": times, "partidas": partidas, "casos": casos}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--teams", type=int, default=6)
+    parser.add_argument("--seasons", type=int, default=2)
+    parser.add_argument("--first-year", type=int, default=2023)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", required=True)
+    args = parser.parse_args()
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(build(args.teams, args.seasons, args.first_year, args.seed), f, ensure_ascii=False, indent=1)
+        f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
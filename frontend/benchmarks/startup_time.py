@@ -0,0 +1,95 @@
+"""Cold import time of the app as Rio loads it at startup, for tracking in CI.
+
+Imports the app module and every page under `frontend/pages/` in a fresh
+interpreter with `python -X importtime`, then reports the cumulative time of
+the app and the heaviest modules. Exits non-zero when the total goes over
+`--max-ms` or when a module that is supposed to load lazily shows up:
+
+    python -m benchmarks.startup_time --max-ms 400 --output startup.json
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+# Modules only needed once a session does something; they must not load at startup
+LAZY_MODULES = ["httpx", "matplotlib.pyplot"]
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)")
+
+
+def startup_imports() -> list[str]:
+    pages = sorted(path.stem for path in (ROOT / "frontend" / "pages").glob("*.py") if path.stem != "__init__")
+    return ["frontend"] + [f"frontend.pages.{page}" for page in pages]
+
+
+def measure() -> tuple[dict[str, int], list[str]]:
+    """Cumulative import time in microseconds per top-level import, and the modules that were really loaded"""
+    modules = startup_imports()
+    script = "; ".join(f"import {module}" for module in modules) + (
+        # Lazily bound modules sit in sys.modules too, but stay _LazyModule until first used
+        "; import sys; print('\\n'.join(name for name, module in sys.modules.items()"
+        " if type(module).__name__ != '_LazyModule'))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    cumulative: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            cumulative[match.group(4)] = int(match.group(2))
+    return cumulative, result.stdout.split()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, help="fail when the median total exceeds this")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    args = parser.parse_args()
+
+    runs = [measure() for _ in range(args.runs)]
+    # Rio is imported by the app module, so the first entry covers rio and the app
+    totals = [sum(cumulative.get(module, 0) for module in startup_imports()) / 1000 for cumulative, _ in runs]
+    median = statistics.median(totals)
+    cumulative, loaded = runs[-1]
+    eager = [module for module in LAZY_MODULES if module in loaded]
+
+    print(f"startup imports: median {median:.1f} ms over {args.runs} runs (min {min(totals):.1f} ms)")
+    for module, micros in sorted(cumulative.items(), key=lambda item: item[1], reverse=True)[: args.top]:
+        print(f"  {micros / 1000:8.1f} ms  {module}")
+    if eager:
+        print(f"loaded eagerly but expected to be lazy: {', '.join(eager)}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "median_ms": round(median, 1),
+                    "runs_ms": [round(total, 1) for total in totals],
+                    "eager_lazy_modules": eager,
+                    "modules_ms": {module: micros / 1000 for module, micros in cumulative.items()},
+                },
+                f,
+                indent=2,
+            )
+
+    if eager or (args.max_ms is not None and median > args.max_ms):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
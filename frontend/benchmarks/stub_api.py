@@ -0,0 +1,347 @@
+"""In-memory stand-in for the Laravel API, for load tests without the compose stack.
+
+Serves the endpoints the Python clients use from one generated season and
+computes standings with the same ordering as ClassificacaoController. The
+CSV exports generate the requested seasons while they stream, so they can
+cover any number of seasons:
+
+    python -m benchmarks.stub_api --port 8001 --teams 20
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import contextlib
+import contextvars
+import csv
+import io
+import itertools
+from datetime import date
+from typing import Awaitable, Callable, Iterator
+
+import httpx
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from frontend.Models.Classificacao import ClassificacaoAPI
+from frontend.Models.Partida import PartidaAPI
+
+from .season_generator import SeasonGenerator
+from .wire_format import TIMESTAMP, build_season
+
+PARTIDA_FIELDS = ["id", "data", "id_time_casa", "gols_time_casa", "id_time_visitante", "gols_time_visitante", "estadio"]
+CLASSIFICACAO_FIELDS = [
+    "id",
+    "jogos",
+    "pontos",
+    "vitorias",
+    "empates",
+    "derrotas",
+    "gols_pro",
+    "gols_contra",
+    "saldo_gols",
+]
+
+
+def somar(row: dict, pro: int, contra: int) -> None:
+    """Adds one match of a team to its standings row"""
+    row["jogos"] += 1
+    row["gols_pro"] += pro
+    row["gols_contra"] += contra
+    row["saldo_gols"] += pro - contra
+    if pro > contra:
+        row["vitorias"] += 1
+        row["pontos"] += 3
+    elif pro == contra:
+        row["empates"] += 1
+        row["pontos"] += 1
+    else:
+        row["derrotas"] += 1
+
+
+def classificacao(times: list[dict], partidas: list[dict], ano: int, data: date) -> list[dict]:
+    """Reference standings: every team, matches of `ano` up to `data`, ordered like the API"""
+    rows = {
+        time["id"]: {"id": time["id"], "nome": time["nome"]} | dict.fromkeys(CLASSIFICACAO_FIELDS[1:], 0)
+        for time in times
+    }
+
+    for partida in partidas:
+        dia = date.fromisoformat(partida["data"])
+        if dia.year != ano or dia > data:
+            continue
+
+        for time_id, pro, contra in (
+            (partida["id_time_casa"], partida["gols_time_casa"], partida["gols_time_visitante"]),
+            (partida["id_time_visitante"], partida["gols_time_visitante"], partida["gols_time_casa"]),
+        ):
+            if time_id in rows:
+                somar(rows[time_id], pro, contra)
+
+    return sorted(
+        rows.values(),
+        key=lambda row: (row["pontos"], row["vitorias"], row["saldo_gols"], row["gols_pro"]),
+        reverse=True,
+    )
+
+
+def export_partidas(generator: SeasonGenerator) -> Iterator[list]:
+    nomes = {time["id"]: time["nome"] for time in generator.times()}
+    yield list(PartidaAPI.EXPORT_COLUNAS)
+    for p in generator.partidas():
+        yield [
+            p["id"],
+            p["data"],
+            p["id_time_casa"],
+            nomes[p["id_time_casa"]],
+            p["gols_time_casa"],
+            p["id_time_visitante"],
+            nomes[p["id_time_visitante"]],
+            p["gols_time_visitante"],
+            p["estadio"],
+        ]
+
+
+def export_classificacoes(generator: SeasonGenerator) -> Iterator[list]:
+    """Snapshot rows as `ClassificacaoController::store` leaves them: every team after each match date"""
+    times = list(generator.times())
+    yield list(ClassificacaoAPI.EXPORT_COLUNAS)
+
+    def snapshot(data: str, tabela: dict[int, dict]) -> Iterator[list]:
+        for time in times:
+            row = tabela[time["id"]]
+            yield [int(data[:4]), data, time["id"], time["nome"]] + [row[field] for field in CLASSIFICACAO_FIELDS[1:]]
+
+    tabela, dia = {}, None
+    for partida in generator.partidas():
+        if partida["data"] != dia:
+            if dia is not None:
+                yield from snapshot(dia, tabela)
+            if dia is None or partida["data"][:4] != dia[:4]:
+                tabela = {time["id"]: dict.fromkeys(CLASSIFICACAO_FIELDS[1:], 0) for time in times}
+            dia = partida["data"]
+        somar(tabela[partida["id_time_casa"]], partida["gols_time_casa"], partida["gols_time_visitante"])
+        somar(tabela[partida["id_time_visitante"]], partida["gols_time_visitante"], partida["gols_time_casa"])
+    if dia is not None:
+        yield from snapshot(dia, tabela)
+
+
+def csv_stream(rows: Iterator[list], chunk: int = 1000) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    for count, row in enumerate(rows, 1):
+        writer.writerow(row)
+        if count % chunk == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+# Set while the batch route runs its sub-requests, which share its worker and framework boot
+_em_lote = contextvars.ContextVar("em_lote", default=False)
+
+
+def build_app(teams: int, delay: float = 0.0, workers: int = 0, boot: float = 0.0) -> Starlette:
+    times, generated = build_season(teams)
+    times_by_id = {time["id"]: time for time in times}
+    partidas = {
+        partida["id"]: {field: partida[field] for field in PARTIDA_FIELDS} | {"data": partida["data"].split("T")[0]}
+        for partida in generated
+    }
+    ids = itertools.count(max(partidas, default=0) + 1)
+
+    def verbose(partida: dict) -> dict:
+        return partida | {
+            "created_at": TIMESTAMP,
+            "updated_at": TIMESTAMP,
+            "time_casa": times_by_id[partida["id_time_casa"]],
+            "time_visitante": times_by_id[partida["id_time_visitante"]],
+        }
+
+    def partidas_response(request: Request, rows: list[dict]) -> JSONResponse:
+        rows = sorted(rows, key=lambda partida: partida["data"], reverse=True)
+        if request.query_params.get("formato") != "compacto":
+            return JSONResponse([verbose(partida) for partida in rows])
+
+        time_ids = {partida["id_time_casa"] for partida in rows} | {partida["id_time_visitante"] for partida in rows}
+        return JSONResponse(
+            {
+                "formato": "compacto",
+                "times": {
+                    str(id): {key: times_by_id[id][key] for key in ("nome", "estadio", "cidade")} for id in time_ids
+                },
+                "data": {field: [partida[field] for partida in rows] for field in PARTIDA_FIELDS},
+            }
+        )
+
+    # `php artisan serve` handles one request at a time; `workers` caps concurrency the same way
+    vagas = asyncio.Semaphore(workers) if workers else contextlib.nullcontext()
+
+    async def simulate_work() -> None:
+        """Server time of one API call: framework `boot` plus its own `delay`.
+
+        A sub-request of a batch runs on the batch's worker, which has booted
+        already, so it only pays its `delay`.
+        """
+        if _em_lote.get():
+            if delay:
+                await asyncio.sleep(delay)
+            return
+        if delay or boot:
+            async with vagas:
+                await asyncio.sleep(boot + delay)
+
+    async def get_times(request: Request) -> Response:
+        await simulate_work()
+        return JSONResponse(times)
+
+    async def search_times(request: Request) -> Response:
+        await simulate_work()
+        # Substring match only; the API also ranks by trigram similarity
+        q = request.query_params["q"].casefold()
+        limite = int(request.query_params.get("limite", 10))
+        encontrados = sorted(
+            (time for time in times if q in time["nome"].casefold()),
+            key=lambda time: (not time["nome"].casefold().startswith(q), time["nome"]),
+        )
+        return JSONResponse(encontrados[:limite])
+
+    async def get_partidas(request: Request) -> Response:
+        await simulate_work()
+        return partidas_response(request, list(partidas.values()))
+
+    async def get_partidas_by_team(request: Request) -> Response:
+        await simulate_work()
+        time_id = int(request.query_params["time_id"])
+        return partidas_response(
+            request,
+            [p for p in partidas.values() if time_id in (p["id_time_casa"], p["id_time_visitante"])],
+        )
+
+    async def store_partida(request: Request) -> Response:
+        await simulate_work()
+        partida = {field: value for field, value in (await request.json()).items() if field in PARTIDA_FIELDS}
+        partida["id"] = next(ids)
+        partidas[partida["id"]] = partida
+        return JSONResponse(verbose(partida), status_code=201)
+
+    async def update_partida(request: Request) -> Response:
+        await simulate_work()
+        id = int(request.path_params["id"])
+        if id not in partidas:
+            return JSONResponse({"message": "Not found"}, status_code=404)
+        partidas[id] |= {field: value for field, value in (await request.json()).items() if field in PARTIDA_FIELDS}
+        return JSONResponse(verbose(partidas[id]))
+
+    async def destroy_partida(request: Request) -> Response:
+        await simulate_work()
+        if partidas.pop(int(request.path_params["id"]), None) is None:
+            return JSONResponse({"message": "Not found"}, status_code=404)
+        return Response(status_code=204)
+
+    async def get_datas(request: Request) -> Response:
+        await simulate_work()
+        ano = int(request.query_params["ano"])
+        datas = sorted({p["data"] for p in partidas.values() if date.fromisoformat(p["data"]).year == ano})
+        return JSONResponse({"ano": ano, "datas": datas})
+
+    async def get_classificacao(request: Request) -> Response:
+        await simulate_work()
+        ano = int(request.query_params.get("ano", date.today().year))
+        data = date.fromisoformat(request.query_params.get("data", date.today().isoformat()))
+        rows = classificacao(times, list(partidas.values()), ano, data)
+        if request.query_params.get("formato") != "compacto":
+            return JSONResponse({"data": rows, "ano": ano, "data_referencia": data.isoformat()})
+        return JSONResponse(
+            {
+                "formato": "compacto",
+                "times": {str(row["id"]): row["nome"] for row in rows},
+                "data": {field: [row[field] for row in rows] for field in CLASSIFICACAO_FIELDS},
+                "ano": ano,
+                "data_referencia": data.isoformat(),
+            }
+        )
+
+    def export(rows: Callable[[SeasonGenerator], Iterator[list]]) -> Callable[[Request], Awaitable[Response]]:
+        # Exports cover any range of seasons, generated while they stream instead of read from memory
+        async def endpoint(request: Request) -> Response:
+            await simulate_work()
+            inicio = int(request.query_params["ano_inicio"])
+            fim = int(request.query_params.get("ano_fim", inicio))
+            generator = SeasonGenerator(teams=teams, seasons=fim - inicio + 1, first_year=inicio)
+            return StreamingResponse(csv_stream(rows(generator)), media_type="text/csv")
+
+        return endpoint
+
+    async def batch(request: Request) -> Response:
+        requisicoes = (await request.json())["requisicoes"]
+        respostas = {}
+        token = _em_lote.set(True)
+        try:
+            # One worker boots once and runs every sub-request in turn
+            async with vagas:
+                await asyncio.sleep(boot)
+                async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://stub") as client:
+                    for chave, url in requisicoes.items():
+                        response = await client.get(url)
+                        if "json" in response.headers.get("content-type", ""):
+                            respostas[chave] = {"status": response.status_code, "body": response.json()}
+                        else:
+                            # Like the API, only JSON bodies are embedded
+                            respostas[chave] = {
+                                "status": 406,
+                                "body": {
+                                    "message": "Only JSON responses can be batched; request this path on its own."
+                                },
+                            }
+        finally:
+            _em_lote.reset(token)
+        return JSONResponse({"respostas": respostas})
+
+    app = Starlette(
+        routes=[
+            Route("/api/times", get_times),
+            Route("/api/times/search", search_times),
+            Route("/api/partidas", get_partidas),
+            Route("/api/partidas", store_partida, methods=["POST"]),
+            Route("/api/partidas/datas", get_datas),
+            Route("/api/partidas/export", export(export_partidas)),
+            Route("/api/partidas/{id:int}", update_partida, methods=["PUT"]),
+            Route("/api/partidas/{id:int}", destroy_partida, methods=["DELETE"]),
+            Route("/api/partidas-by-team", get_partidas_by_team),
+            Route("/api/classificacao", get_classificacao),
+            Route("/api/classificacao/export", export(export_classificacoes)),
+            Route("/api/batch", batch, methods=["POST"]),
+        ]
+    )
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--teams", type=int, default=20)
+    parser.add_argument(
+        "--delay-ms", type=float, default=0.0, help="artificial query time per API call, batched or not"
+    )
+    parser.add_argument(
+        "--boot-ms", type=float, default=0.0, help="artificial framework boot per HTTP request, once per batch"
+    )
+    parser.add_argument("--workers", type=int, default=0, help="requests served at once, 0 for no limit")
+    args = parser.parse_args()
+
+    uvicorn.run(
+        build_app(args.teams, args.delay_ms / 1000, args.workers, args.boot_ms / 1000),
+        host=args.host,
+        port=args.port,
+        log_level="warning",
+    )
+
+
+if __name__ == "__main__":
+    main()
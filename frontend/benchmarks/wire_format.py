@@ -0,0 +1,131 @@
+"""Payload size and decode time of the verbose and compact wire formats.
+
+Builds a full double round-robin season the way the Laravel API serializes it
+and times the Python decoders on both representations:
+
+    python -m benchmarks.wire_format --teams 20
+"""
+
+from __future__ import annotations
+import argparse
+import gzip
+import json
+import random
+import timeit
+
+from frontend.Models.Classificacao import ClassificacaoAPI, ClassificacaoTime
+from frontend.Models.Partida import Partida, PartidaAPI
+
+from .season_generator import SeasonGenerator
+
+TIMESTAMP = "2025-01-11T21:52:23.000000Z"
+# gzip_comp_level of nginx/conf.d/app.conf
+GZIP_LEVEL = 5
+
+
+def build_season(teams: int, seed: int = 0) -> tuple[list[dict], list[dict]]:
+    """Returns (times, partidas) of one generated season as the API serializes them"""
+    generator = SeasonGenerator(teams=teams, first_year=2024, seed=seed)
+    times = [time | {"created_at": TIMESTAMP, "updated_at": TIMESTAMP} for time in generator.times()]
+    partidas = [
+        partida
+        | {
+            "data": f"{partida['data']}T00:00:00.000000Z",
+            "created_at": TIMESTAMP,
+            "updated_at": TIMESTAMP,
+            "time_casa": times[partida["id_time_casa"] - 1],
+            "time_visitante": times[partida["id_time_visitante"] - 1],
+        }
+        for partida in generator.partidas()
+    ]
+    return times, partidas
+
+
+def compact_partidas(times: list[dict], partidas: list[dict]) -> dict:
+    fields = ["id", "data", "id_time_casa", "gols_time_casa", "id_time_visitante", "gols_time_visitante", "estadio"]
+    columns = {field: [partida[field] for partida in partidas] for field in fields}
+    columns["data"] = [value.split("T")[0] for value in columns["data"]]
+    return {
+        "formato": "compacto",
+        "times": {str(time["id"]): {k: time[k] for k in ("nome", "estadio", "cidade")} for time in times},
+        "data": columns,
+    }
+
+
+def build_standings(times: list[dict], seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "id": time["id"],
+            "nome": time["nome"],
+            "jogos": 38,
+            "pontos": rng.randint(20, 80),
+            "vitorias": rng.randint(5, 25),
+            "empates": rng.randint(5, 15),
+            "derrotas": rng.randint(5, 20),
+            "gols_pro": rng.randint(30, 70),
+            "gols_contra": rng.randint(30, 70),
+            "saldo_gols": rng.randint(-30, 30),
+        }
+        for time in times
+    ]
+
+
+def compact_standings(rows: list[dict]) -> dict:
+    fields = [field for field in rows[0] if field != "nome"]
+    return {
+        "formato": "compacto",
+        "times": {str(row["id"]): row["nome"] for row in rows},
+        "data": {field: [row[field] for row in rows] for field in fields},
+    }
+
+
+def decode_verbose_partidas(body: bytes) -> list[Partida]:
+    return [Partida(**PartidaAPI._transform_api_data(item)) for item in json.loads(body)]
+
+
+def decode_verbose_standings(body: bytes) -> list[ClassificacaoTime]:
+    return [ClassificacaoTime(**item) for item in json.loads(body)["data"]]
+
+
+def report(label: str, verbose: bytes, compact: bytes, decode_verbose, decode_compact, repeat: int) -> None:
+    print(f"{label}")
+    # nginx keeps the uncompressed body in its micro-cache, so it pays "gzip ms" on every response, hits included
+    print(f"  {'':8} {'bytes':>10} {'gzip':>10} {'gzip ms':>10} {'decode ms':>10}")
+    for name, body, decode in (("verbose", verbose, decode_verbose), ("compact", compact, decode_compact)):
+        compress_ms = min(timeit.repeat(lambda: gzip.compress(body, GZIP_LEVEL), number=1, repeat=repeat)) * 1000
+        decode_ms = min(timeit.repeat(lambda: decode(body), number=1, repeat=repeat)) * 1000
+        print(
+            f"  {name:8} {len(body):>10} {len(gzip.compress(body, GZIP_LEVEL)):>10} {compress_ms:>10.2f} {decode_ms:>10.2f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--teams", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    times, partidas = build_season(args.teams)
+    report(
+        f"/api/partidas ({len(partidas)} partidas)",
+        json.dumps(partidas).encode(),
+        json.dumps(compact_partidas(times, partidas)).encode(),
+        decode_verbose_partidas,
+        lambda body: PartidaAPI._decode_compact(json.loads(body)),
+        args.repeat,
+    )
+
+    standings = build_standings(times)
+    report(
+        f"/api/classificacao ({len(standings)} times)",
+        json.dumps({"data": standings}).encode(),
+        json.dumps(compact_standings(standings)).encode(),
+        decode_verbose_standings,
+        lambda body: ClassificacaoAPI._decode_compact(json.loads(body)),
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+from __future__ import annotations
+import asyncio
+import json
+from typing import Optional
+from ..lazy import lazy_import
+from .SharedCache import cache
+
+httpx = lazy_import("httpx")
+
+
+class BatchClient:
+    """Coalesces API GETs that are awaited together into one `/api/batch` call.
+
+    Each `get` waits `WINDOW` seconds for others to join it, which covers
+    calls started together with `asyncio.gather`. A lone request is sent as
+    a plain GET; two or more go to the batch endpoint of their API and every
+    caller gets back an `httpx.Response` for its own part, as if it had made
+    the request itself. When the batch endpoint is missing or fails, the
+    requests are sent one by one instead.
+
+    Batches are POSTs, so the nginx micro-cache (nginx/conf.d/app.conf)
+    never serves them; only lone reads can hit it. Batching trades those
+    cache hits for fewer round trips and framework boots, which wins when
+    several reads start together and each would likely miss a cache that
+    only lives a few seconds. Set `enabled` to False to go through nginx
+    for every read instead.
+    """
+
+    WINDOW = 0.002
+    MAX_BATCH = 20
+    TIMEOUT = 20.0
+    # Disable to measure or debug one request per call
+    enabled = True
+
+    def __init__(self) -> None:
+        self._pending: dict[str, list[tuple[str, asyncio.Future]]] = {}
+        self._flush_scheduled: set[str] = set()
+
+    @staticmethod
+    async def _headers() -> dict[str, str]:
+        headers = {"Accept": "application/json"}
+        # After a write by any worker, skip the nginx micro-cache so the write is seen
+        if await cache.written_recently():
+            headers["X-Api-Escrita"] = "1"
+        return headers
+
+    async def get(self, url: str, params: Optional[dict] = None, coalesce: bool = True) -> httpx.Response:
+        """GETs `url`, batched with concurrent calls unless `coalesce` is False.
+
+        Reads that nginx caches and that are repeated across users (e.g. the
+        team search) are better sent on their own, where the cache sees them.
+        """
+        url = str(httpx.URL(url, params=params)) if params else url
+        raiz, _, _ = url.partition("/api/")
+        if not (self.enabled and coalesce) or raiz == url:
+            resposta = await self._get_one(url)
+            if isinstance(resposta, Exception):
+                raise resposta
+            return resposta
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pendentes = self._pending.setdefault(raiz, [])
+        pendentes.append((url, future))
+
+        if len(pendentes) >= self.MAX_BATCH:
+            # Taken off right away, so later calls start a new batch instead of growing past the server's limit
+            del self._pending[raiz]
+            loop.create_task(self._send(raiz, pendentes))
+        elif raiz not in self._flush_scheduled:
+            self._flush_scheduled.add(raiz)
+            loop.call_later(self.WINDOW, lambda: loop.create_task(self._flush(raiz)))
+
+        return await future
+
+    async def _flush(self, raiz: str) -> None:
+        pendentes = self._pending.pop(raiz, [])
+        self._flush_scheduled.discard(raiz)
+        if pendentes:
+            await self._send(raiz, pendentes)
+
+    async def _send(self, raiz: str, pendentes: list[tuple[str, asyncio.Future]]) -> None:
+        if len(pendentes) == 1:
+            respostas = [await self._get_one(pendentes[0][0])]
+        else:
+            respostas = await self._get_batch(raiz, [url for url, _ in pendentes])
+
+        for (_, future), resposta in zip(pendentes, respostas):
+            if future.done():
+                continue
+            if isinstance(resposta, Exception):
+                future.set_exception(resposta)
+            else:
+                future.set_result(resposta)
+
+    async def _get_one(self, url: str) -> httpx.Response | Exception:
+        async with httpx.AsyncClient(timeout=httpx.Timeout(self.TIMEOUT), headers=await self._headers()) as client:
+            try:
+                return await client.get(url)
+            except Exception as e:
+                return e
+
+    async def _get_batch(self, raiz: str, urls: list[str]) -> list[httpx.Response | Exception]:
+        prefixo = len(raiz)
+        requisicoes = {str(i): url[prefixo:] for i, url in enumerate(urls)}
+
+        async with httpx.AsyncClient(
+            timeout=httpx.Timeout(self.TIMEOUT), headers={"Accept": "application/json"}
+        ) as client:
+            try:
+                response = await client.post(f"{raiz}/api/batch", json={"requisicoes": requisicoes})
+                if response.status_code == 200:
+                    respostas = response.json()["respostas"]
+                    resultados: list[httpx.Response | Exception] = [
+                        httpx.Response(
+                            respostas[chave]["status"],
+                            content=json.dumps(respostas[chave]["body"]).encode(),
+                            headers={"Content-Type": "application/json"},
+                            request=httpx.Request("GET", urls[int(chave)]),
+                        )
+                        for chave in requisicoes
+                    ]
+                    # The batch endpoint answers 406 for responses it cannot embed (streams, non-JSON)
+                    recusadas = [i for i, resultado in enumerate(resultados) if resultado.status_code == 406]
+                    avulsas = await asyncio.gather(*(self._get_one(urls[i]) for i in recusadas))
+                    for i, resultado in zip(recusadas, avulsas):
+                        resultados[i] = resultado
+                    return resultados
+                print(f"Batch returned status code: {response.status_code}")
+            except Exception as e:
+                print(f"Error sending batch: {e}")
+
+        return list(await asyncio.gather(*(self._get_one(url) for url in urls)))
+
+
+batch = BatchClient()
@@ -1,6 +1,16 @@
 from __future__ import annotations
 from dataclasses import dataclass
-import httpx
+import json
+from datetime import date
+from typing import AsyncIterator, Optional
+from ..lazy import lazy_import
+from ..settings import API_URL
+from .BatchClient import batch
+from .CsvStream import Colunas, stream_csv
+from .SharedCache import cache
+
+httpx = lazy_import("httpx")
+np = lazy_import("numpy")
 
 
 @dataclass
@@ -17,18 +27,126 @@ class ClassificacaoTime:
     saldo_gols: int
 
 
+@dataclass
+class EvolucaoClassificacao:
+    """Position and points of every team on every snapshot date of a season.
+
+    `posicoes` and `pontos` are (teams x dates) matrices; 0 marks a date on
+    which a team has no snapshot. Rows follow the final standings.
+    """
+
+    ano: int
+    time_ids: np.ndarray
+    nomes: list[str]
+    datas: list[date]
+    posicoes: np.ndarray
+    pontos: np.ndarray
+
+    def serie(self, time_id: int) -> np.ndarray:
+        """Positions of one team over the season"""
+        return self.posicoes[np.flatnonzero(self.time_ids == time_id)[0]]
+
+
 class ClassificacaoAPI:
-    BASE_URL = "http://host.docker.internal:80/api/classificacao"
+    BASE_URL = f"{API_URL}/classificacao"
     TIMEOUT = 20.0
+    EXPORT_COLUNAS: Colunas = {
+        "ano": int,
+        "data_atualizacao": date.fromisoformat,
+        "time_id": int,
+        "time": str,
+        "jogos": int,
+        "pontos": int,
+        "vitorias": int,
+        "empates": int,
+        "derrotas": int,
+        "gols_pro": int,
+        "gols_contra": int,
+        "saldo_gols": int,
+    }
+
+    @staticmethod
+    def _decode_compact(payload: dict) -> list[ClassificacaoTime]:
+        """Decode the columnar `formato=compacto` response, keeping its standings order"""
+        nomes = payload["times"]
+        columns = payload["data"]
+        return [
+            ClassificacaoTime(
+                id=id,
+                nome=nomes[str(id)],
+                jogos=int(jogos),
+                pontos=int(pontos or 0),
+                vitorias=int(vitorias or 0),
+                empates=int(empates or 0),
+                derrotas=int(derrotas or 0),
+                gols_pro=int(gols_pro or 0),
+                gols_contra=int(gols_contra or 0),
+                saldo_gols=int(saldo_gols or 0),
+            )
+            for id, jogos, pontos, vitorias, empates, derrotas, gols_pro, gols_contra, saldo_gols in zip(
+                columns["id"],
+                columns["jogos"],
+                columns["pontos"],
+                columns["vitorias"],
+                columns["empates"],
+                columns["derrotas"],
+                columns["gols_pro"],
+                columns["gols_contra"],
+                columns["saldo_gols"],
+            )
+        ]
 
     @staticmethod
     async def get_classificacao(ano: int, data: str) -> list[ClassificacaoTime]:
-        async with httpx.AsyncClient(timeout=httpx.Timeout(ClassificacaoAPI.TIMEOUT)) as client:
-            try:
-                response = await client.get(ClassificacaoAPI.BASE_URL, params={"ano": ano, "data": data})
-                if response.status_code == 200:
-                    data = response.json()["data"]
-                    return [ClassificacaoTime(**item) for item in data]
-            except Exception as e:
-                print(f"Error fetching classificacao: {e}")
-            return []
+        cache_key = f"classificacao:{ano}:{data}"
+        cached, geracao = await cache.get(cache_key)
+        if cached is not None:
+            return ClassificacaoAPI._decode_compact(json.loads(cached))
+
+        try:
+            response = await batch.get(
+                ClassificacaoAPI.BASE_URL, params={"ano": ano, "data": data, "formato": "compacto"}
+            )
+            if response.status_code == 200:
+                await cache.set(cache_key, response.text, geracao)
+                return ClassificacaoAPI._decode_compact(response.json())
+        except Exception as e:
+            print(f"Error fetching classificacao: {e}")
+        return []
+
+    @staticmethod
+    def _matriz(linhas: list[list[int | None]], forma: tuple[int, int], dtype: type) -> np.ndarray:
+        """Builds a dense matrix from JSON rows, turning null cells into 0"""
+        matriz = np.array(linhas, dtype=np.float64).reshape(forma)
+        return np.nan_to_num(matriz, nan=0).astype(dtype)
+
+    @staticmethod
+    async def get_evolucao(ano: int) -> Optional[EvolucaoClassificacao]:
+        try:
+            response = await batch.get(f"{ClassificacaoAPI.BASE_URL}/evolucao", params={"ano": ano})
+            if response.status_code == 200:
+                data = response.json()
+                forma = (len(data["times"]), len(data["datas"]))
+                return EvolucaoClassificacao(
+                    ano=data["ano"],
+                    time_ids=np.array([time["id"] for time in data["times"]], dtype=np.int64),
+                    nomes=[time["nome"] for time in data["times"]],
+                    datas=[date.fromisoformat(dia) for dia in data["datas"]],
+                    posicoes=ClassificacaoAPI._matriz(data["posicoes"], forma, np.int16),
+                    pontos=ClassificacaoAPI._matriz(data["pontos"], forma, np.int32),
+                )
+        except Exception as e:
+            print(f"Error fetching evolucao: {e}")
+        return None
+
+    @staticmethod
+    async def export(ano_inicio: int, ano_fim: Optional[int] = None) -> AsyncIterator[dict]:
+        """Every standings snapshot row of the seasons `ano_inicio` to `ano_fim`, as it streams in.
+
+        Raises on errors, so a partial export never looks like a complete one.
+        """
+        params = {"ano_inicio": ano_inicio, "ano_fim": ano_fim or ano_inicio}
+        async for linha in stream_csv(
+            f"{ClassificacaoAPI.BASE_URL}/export", params, ClassificacaoAPI.EXPORT_COLUNAS, ClassificacaoAPI.TIMEOUT
+        ):
+            yield linha
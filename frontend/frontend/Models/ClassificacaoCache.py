@@ -0,0 +1,75 @@
+from __future__ import annotations
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional
+from .Classificacao import ClassificacaoAPI, ClassificacaoTime
+
+
+class ClassificacaoCache:
+    """Decoded standings tables of this process, keyed by `(ano, data)`.
+
+    Holds at most `max_entries` tables and evicts the least recently used.
+    Entries older than `FRESH_FOR` seconds are still returned by `peek`, so a
+    page can show them at once while `fetch` revalidates in the background.
+    Concurrent fetches of the same key share one request.
+    """
+
+    MAX_ENTRIES = 128
+    FRESH_FOR = 5.0
+
+    def __init__(self, max_entries: int = MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[int, str], tuple[float, list[ClassificacaoTime]]] = OrderedDict()
+        self._inflight: dict[tuple[int, str], asyncio.Task] = {}
+        self._geracao = 0
+
+    def peek(self, ano: int, data: str) -> tuple[Optional[list[ClassificacaoTime]], bool]:
+        """The cached table, if any, and whether it is still fresh"""
+        entry = self._entries.get((ano, data))
+        if entry is None:
+            return None, False
+
+        self._entries.move_to_end((ano, data))
+        fetched_at, classificacao = entry
+        return classificacao, time.monotonic() - fetched_at < self.FRESH_FOR
+
+    async def fetch(self, ano: int, data: str) -> list[ClassificacaoTime]:
+        key = (ano, data)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        # A caller leaving early must not cancel the request other callers wait on
+        return await asyncio.shield(task)
+
+    async def prefetch(self, ano: int, datas: Iterable[str]) -> None:
+        """Loads the tables of `datas` that are missing or stale"""
+        missing = [data for data in datas if not self.peek(ano, data)[1]]
+        await asyncio.gather(*(self.fetch(ano, data) for data in missing))
+
+    def _forget(self, key: tuple[int, str], task: asyncio.Task) -> None:
+        # After a `clear`, a newer fetch of the same key may have taken its place
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def clear(self) -> None:
+        """Forgets every table after a write, including ones still being fetched"""
+        self._entries.clear()
+        self._inflight.clear()
+        self._geracao += 1
+
+    async def _load(self, key: tuple[int, str]) -> list[ClassificacaoTime]:
+        geracao = self._geracao
+        classificacao = await ClassificacaoAPI.get_classificacao(*key)
+        # The client returns [] on errors; those are not worth keeping
+        if classificacao and geracao == self._geracao:
+            self._entries[key] = (time.monotonic(), classificacao)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return classificacao
+
+
+classificacao_cache = ClassificacaoCache()
@@ -0,0 +1,56 @@
+from __future__ import annotations
+import csv
+from typing import AsyncIterator, Callable, Optional
+from ..lazy import lazy_import
+
+httpx = lazy_import("httpx")
+
+# Column name -> parser of its CSV text, in the order the API writes them
+Colunas = dict[str, Callable[[str], object]]
+
+
+async def stream_csv(url: str, params: dict, colunas: Colunas, timeout: float) -> AsyncIterator[dict]:
+    """Rows of a CSV export endpoint, parsed while the response streams in.
+
+    Only the current chunk and one unfinished record are held at a time, so
+    memory does not depend on the size of the export. Empty fields come back
+    as None; a row with more or fewer fields than `colunas` raises ValueError.
+    """
+    async with httpx.AsyncClient(timeout=httpx.Timeout(timeout, read=None)) as client:
+        async with client.stream("GET", url, params=params) as response:
+            response.raise_for_status()
+
+            cabecalho: Optional[list[str]] = None
+            numero = 0
+            resto = ""
+            async for texto in response.aiter_text():
+                *linhas, resto = (resto + texto).split("\n")
+
+                registros, aberto = [], None
+                for linha in linhas:
+                    aberto = linha if aberto is None else f"{aberto}\n{linha}"
+                    # A quoted field may span lines; embedded quotes are doubled, so an odd count means it is still open
+                    if aberto.count('"') % 2 == 0:
+                        registros.append(aberto)
+                        aberto = None
+                if aberto is not None:
+                    resto = f"{aberto}\n{resto}"
+
+                for campos in csv.reader(registros):
+                    if cabecalho is None:
+                        cabecalho = campos
+                        if cabecalho != list(colunas):
+                            raise ValueError(f"Unexpected export columns: {cabecalho}")
+                    else:
+                        numero += 1
+                        yield _linha(colunas, campos, numero)
+
+            for campos in csv.reader([resto] if resto.strip() else []):
+                yield _linha(colunas, campos, numero + 1)
+
+
+def _linha(colunas: Colunas, campos: list[str], numero: int) -> dict:
+    # zip() would silently drop or pad the missing columns
+    if len(campos) != len(colunas):
+        raise ValueError(f"Export row {numero} has {len(campos)} fields, expected {len(colunas)}")
+    return {nome: (parse(valor) if valor != "" else None) for (nome, parse), valor in zip(colunas.items(), campos)}
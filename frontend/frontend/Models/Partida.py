@@ -1,10 +1,18 @@
 from __future__ import annotations
 from dataclasses import dataclass
 import copy
-from typing import Optional
-import httpx
+import json
+from typing import AsyncIterator, Optional
 from datetime import datetime, date
-from .Time import Time
+from ..lazy import lazy_import
+from ..settings import API_URL
+from .BatchClient import batch
+from .ClassificacaoCache import classificacao_cache
+from .CsvStream import Colunas, stream_csv
+from .SharedCache import cache
+from .Time import Time, TimeAPI
+
+httpx = lazy_import("httpx")
 
 
 @dataclass
@@ -48,9 +56,48 @@ class Partida:
         return f"{home_team} {self.gols_time_casa} x {self.gols_time_visitante} {away_team}"
 
 
+@dataclass
+class Confronto:
+    time_a: Time
+    time_b: Time
+    jogos: int
+    vitorias_a: int
+    empates: int
+    vitorias_b: int
+    gols_a: int
+    gols_b: int
+    partidas: list[Partida]
+
+
+@dataclass
+class Forma:
+    time: Time
+    sequencia: str
+    pontos: int
+    aproveitamento: float
+    partidas: list[Partida]
+
+
 class PartidaAPI:
-    BASE_URL = "http://host.docker.internal:80/api/partidas"
+    BASE_URL = f"{API_URL}/partidas"
+    BY_TEAM_URL = f"{API_URL}/partidas-by-team"
     TIMEOUT = 20.0
+    EXPORT_COLUNAS: Colunas = {
+        "id": int,
+        "data": date.fromisoformat,
+        "id_time_casa": int,
+        "time_casa": str,
+        "gols_time_casa": int,
+        "id_time_visitante": int,
+        "time_visitante": str,
+        "gols_time_visitante": int,
+        "estadio": str,
+    }
+
+    @staticmethod
+    async def _invalidate() -> None:
+        await cache.invalidate("partidas:", "classificacao:")
+        classificacao_cache.clear()
 
     @staticmethod
     def _transform_api_data(item: dict) -> dict:
@@ -81,53 +128,69 @@ class PartidaAPI:
 
         return transformed_data
 
+    @staticmethod
+    def _decode_compact(payload: dict) -> list[Partida]:
+        """Decode the columnar `formato=compacto` response, sharing one Time object per team"""
+        times = {int(id): Time(id=int(id), **fields) for id, fields in payload["times"].items()}
+        columns = payload["data"]
+        return [
+            Partida(
+                data=date.fromisoformat(data),
+                id_time_casa=id_time_casa,
+                gols_time_casa=gols_time_casa,
+                id_time_visitante=id_time_visitante,
+                gols_time_visitante=gols_time_visitante,
+                estadio=estadio,
+                id=id,
+                timeCasa=times.get(id_time_casa),
+                timeVisitante=times.get(id_time_visitante),
+            )
+            for id, data, id_time_casa, gols_time_casa, id_time_visitante, gols_time_visitante, estadio in zip(
+                columns["id"],
+                columns["data"],
+                columns["id_time_casa"],
+                columns["gols_time_casa"],
+                columns["id_time_visitante"],
+                columns["gols_time_visitante"],
+                columns["estadio"],
+            )
+        ]
+
     @staticmethod
     async def get_all(time: Time = None) -> list[Partida]:
+        cache_key = "partidas:all" if time is None else f"partidas:time:{time.id}"
+        cached, geracao = await cache.get(cache_key)
+        if cached is not None:
+            return PartidaAPI._decode_compact(json.loads(cached))
+
         if time is None:
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(PartidaAPI.TIMEOUT), headers={"Accept": "application/json"}
-            ) as client:
-                try:
-                    response = await client.get(PartidaAPI.BASE_URL)
-                    if response.status_code == 200:
-                        return [Partida(**PartidaAPI._transform_api_data(item)) for item in response.json()]
-                    else:
-                        print(f"API returned status code: {response.status_code}")
-                        print(f"Response content: {response.text}")
-                except httpx.TimeoutException:
-                    print("Request timed out")
-                except Exception as e:
-                    print(f"Error fetching partidas: {type(e).__name__} - {str(e)}")
-                return []
+            url, params = PartidaAPI.BASE_URL, {"formato": "compacto"}
         else:
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(PartidaAPI.TIMEOUT), headers={"Accept": "application/json"}
-            ) as client:
-                try:
-                    response = await client.get(
-                        f"http://host.docker.internal:80/api/partidas-by-team/?time_id={time.id}"
-                    )
-                    if response.status_code == 200:
-                        return [Partida(**PartidaAPI._transform_api_data(item)) for item in response.json()]
-                    else:
-                        print(f"API returned status code: {response.status_code}")
-                        print(f"Response content: {response.text}")
-                except httpx.TimeoutException:
-                    print("Request timed out")
-                except Exception as e:
-                    print(f"Error fetching partidas: {type(e).__name__} - {str(e)}")
-                return []
+            url, params = PartidaAPI.BY_TEAM_URL, {"time_id": time.id, "formato": "compacto"}
+
+        try:
+            response = await batch.get(url, params=params)
+            if response.status_code == 200:
+                await cache.set(cache_key, response.text, geracao)
+                return PartidaAPI._decode_compact(response.json())
+            else:
+                print(f"API returned status code: {response.status_code}")
+                print(f"Response content: {response.text}")
+        except httpx.TimeoutException:
+            print("Request timed out")
+        except Exception as e:
+            print(f"Error fetching partidas: {type(e).__name__} - {str(e)}")
+        return []
 
     @staticmethod
     async def get_one(id: int) -> Optional[Partida]:
-        async with httpx.AsyncClient(timeout=httpx.Timeout(PartidaAPI.TIMEOUT)) as client:
-            try:
-                response = await client.get(f"{PartidaAPI.BASE_URL}/{id}")
-                if response.status_code == 200:
-                    return Partida(**PartidaAPI._transform_api_data(response.json()))
-            except Exception as e:
-                print(f"Error fetching partida: {e}")
-            return None
+        try:
+            response = await batch.get(f"{PartidaAPI.BASE_URL}/{id}")
+            if response.status_code == 200:
+                return Partida(**PartidaAPI._transform_api_data(response.json()))
+        except Exception as e:
+            print(f"Error fetching partida: {e}")
+        return None
 
     @staticmethod
     async def get_by_date(data_inicio: str, data_fim: str) -> list[Partida]:
@@ -153,6 +216,75 @@ class PartidaAPI:
                 print(f"Error fetching partidas by team: {e}")
             return []
 
+    @staticmethod
+    async def get_confronto(time_a: int, time_b: int, limite: int = 10) -> Optional[Confronto]:
+        try:
+            response = await batch.get(
+                f"{PartidaAPI.BASE_URL}/confronto", params={"time_a": time_a, "time_b": time_b, "limite": limite}
+            )
+            if response.status_code == 200:
+                data = response.json()
+                return Confronto(
+                    time_a=Time(**data["time_a"]),
+                    time_b=Time(**data["time_b"]),
+                    jogos=data["jogos"],
+                    vitorias_a=data["vitorias_a"],
+                    empates=data["empates"],
+                    vitorias_b=data["vitorias_b"],
+                    gols_a=data["gols_a"],
+                    gols_b=data["gols_b"],
+                    partidas=[Partida(**PartidaAPI._transform_api_data(item)) for item in data["partidas"]],
+                )
+        except Exception as e:
+            print(f"Error fetching confronto: {e}")
+        return None
+
+    @staticmethod
+    async def get_forma(time_id: int, limite: int = 5) -> Optional[Forma]:
+        try:
+            response = await batch.get(f"{TimeAPI.BASE_URL}/{time_id}/forma", params={"limite": limite})
+            if response.status_code == 200:
+                data = response.json()
+                return Forma(
+                    time=Time(**data["time"]),
+                    sequencia=data["sequencia"],
+                    pontos=data["pontos"],
+                    aproveitamento=data["aproveitamento"],
+                    partidas=[Partida(**PartidaAPI._transform_api_data(item)) for item in data["partidas"]],
+                )
+        except Exception as e:
+            print(f"Error fetching forma: {e}")
+        return None
+
+    @staticmethod
+    async def get_datas(ano: int) -> list[date]:
+        """Distinct match dates of a season, in order"""
+        cache_key = f"partidas:datas:{ano}"
+        cached, geracao = await cache.get(cache_key)
+        if cached is not None:
+            return [date.fromisoformat(dia) for dia in json.loads(cached)["datas"]]
+
+        try:
+            response = await batch.get(f"{PartidaAPI.BASE_URL}/datas", params={"ano": ano})
+            if response.status_code == 200:
+                await cache.set(cache_key, response.text, geracao)
+                return [date.fromisoformat(dia) for dia in response.json()["datas"]]
+        except Exception as e:
+            print(f"Error fetching datas: {e}")
+        return []
+
+    @staticmethod
+    async def export(ano_inicio: int, ano_fim: Optional[int] = None) -> AsyncIterator[dict]:
+        """Every match of the seasons `ano_inicio` to `ano_fim`, one dict per row as it streams in.
+
+        Raises on errors, so a partial export never looks like a complete one.
+        """
+        params = {"ano_inicio": ano_inicio, "ano_fim": ano_fim or ano_inicio}
+        async for linha in stream_csv(
+            f"{PartidaAPI.BASE_URL}/export", params, PartidaAPI.EXPORT_COLUNAS, PartidaAPI.TIMEOUT
+        ):
+            yield linha
+
     @staticmethod
     async def create(partida: Partida) -> Optional[Partida]:
         async with httpx.AsyncClient(timeout=httpx.Timeout(PartidaAPI.TIMEOUT)) as client:
@@ -167,6 +299,7 @@ class PartidaAPI:
                 }
                 response = await client.post(PartidaAPI.BASE_URL, json=payload)
                 if response.status_code == 201:
+                    await PartidaAPI._invalidate()
                     return Partida(**PartidaAPI._transform_api_data(response.json()))
             except Exception as e:
                 print(f"Error creating partida: {e}")
@@ -189,6 +322,7 @@ class PartidaAPI:
                 }
                 response = await client.put(f"{PartidaAPI.BASE_URL}/{partida.id}", json=payload)
                 if response.status_code == 200:
+                    await PartidaAPI._invalidate()
                     return Partida(**PartidaAPI._transform_api_data(response.json()))
             except Exception as e:
                 print(f"Error updating partida: {e}")
@@ -199,7 +333,10 @@ class PartidaAPI:
         async with httpx.AsyncClient(timeout=httpx.Timeout(PartidaAPI.TIMEOUT)) as client:
             try:
                 response = await client.delete(f"{PartidaAPI.BASE_URL}/{id}")
-                return response.status_code == 204
+                if response.status_code == 204:
+                    await PartidaAPI._invalidate()
+                    return True
+                return False
             except Exception as e:
                 print(f"Error deleting partida: {e}")
                 return False
@@ -0,0 +1,86 @@
+from __future__ import annotations
+import bisect
+import unicodedata
+from typing import Callable, Generic, Hashable, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+class PrefixIndex(Generic[T]):
+    """Items looked up by a prefix of any word of their name, for type-ahead inputs.
+
+    Every name is stored once per word, from that word to the end ("são
+    paulo", "paulo"), case- and accent-folded, in one sorted list. The
+    entries starting with a prefix are then one contiguous run found by
+    binary search, so "pau" and "sao pa" both find "São Paulo" without
+    scanning every name. Matches on the first word rank first.
+    """
+
+    # Up to this many new keys are inserted one by one; more are merged in one pass
+    MAX_INSERCOES = 64
+
+    def __init__(
+        self,
+        items: Iterable[T] = (),
+        nome: Callable[[T], str] = lambda item: item.nome,
+        chave: Callable[[T], Hashable] = lambda item: item.id,
+    ) -> None:
+        self._nome = nome
+        self._chave = chave
+        self._conhecidos: set[Hashable] = set()
+        self._chaves: list[str] = []
+        self._entradas: list[tuple[int, T]] = []
+        self.add(items)
+
+    def __len__(self) -> int:
+        return len(self._conhecidos)
+
+    @staticmethod
+    def normalizar(texto: str) -> str:
+        decomposto = unicodedata.normalize("NFKD", texto.casefold())
+        # Punctuation separates words too, so "pr" finds "Athletico-PR"
+        return " ".join(
+            "".join(c if c.isalnum() else " " for c in decomposto if not unicodedata.combining(c)).split()
+        )
+
+    def add(self, items: Iterable[T]) -> None:
+        """Indexes the `items` not in the index yet"""
+        novas = []
+        for item in items:
+            if self._chave(item) in self._conhecidos:
+                continue
+            self._conhecidos.add(self._chave(item))
+            palavras = self.normalizar(self._nome(item)).split(" ")
+            novas.extend((" ".join(palavras[posicao:]), (posicao, item)) for posicao in range(len(palavras)))
+
+        # Only the new keys are sorted; the index already is
+        novas.sort(key=lambda par: par[0])
+        if len(novas) <= self.MAX_INSERCOES:
+            for chave, entrada in novas:
+                posicao = bisect.bisect_right(self._chaves, chave)
+                self._chaves.insert(posicao, chave)
+                self._entradas.insert(posicao, entrada)
+        else:
+            # Two sorted runs, which list.sort merges in one linear pass
+            pares = [*zip(self._chaves, self._entradas), *novas]
+            pares.sort(key=lambda par: par[0])
+            self._chaves = [chave for chave, _ in pares]
+            self._entradas = [entrada for _, entrada in pares]
+
+    def search(self, prefixo: str, limite: int = 10) -> list[T]:
+        prefixo = self.normalizar(prefixo)
+        if not prefixo:
+            return []
+
+        inicio = bisect.bisect_left(self._chaves, prefixo)
+        # Every key that starts with the prefix sorts before the prefix followed by the highest code point
+        fim = bisect.bisect_left(self._chaves, prefixo + "\U0010ffff", lo=inicio)
+
+        # Best (word position, key) per item, since several of its words may match
+        melhores: dict[Hashable, tuple[int, str, T]] = {}
+        for chave, (posicao, item) in zip(self._chaves[inicio:fim], self._entradas[inicio:fim]):
+            atual = melhores.get(self._chave(item))
+            if atual is None or (posicao, chave) < atual[:2]:
+                melhores[self._chave(item)] = (posicao, chave, item)
+
+        return [item for _, _, item in sorted(melhores.values(), key=lambda melhor: melhor[:2])[:limite]]
@@ -0,0 +1,159 @@
+from __future__ import annotations
+import asyncio
+import sqlite3
+import threading
+import time
+from typing import Optional
+from ..settings import CACHE_PATH
+
+# Generation of a key: the sum of the counters of every invalidated prefix it starts with
+_GERACAO_SQL = "SELECT COALESCE(SUM(geracao), 0) FROM geracoes WHERE substr(?, 1, length(prefixo)) = prefixo"
+
+
+class SharedCache:
+    """Short-lived cache of raw API response bodies.
+
+    With a `path`, entries live in one SQLite file that every Rio worker on
+    the machine opens, so a standings table fetched by one worker is reused by
+    the others instead of each process keeping its own copy. Without one, the
+    cache is a plain dict local to the process.
+
+    SQLite calls run in a worker thread, since a write lock held by another
+    process can make them wait up to the busy timeout and the event loop
+    must keep serving the session meanwhile.
+
+    Every `invalidate` bumps a generation counter per prefix. `get` returns
+    the key's generation along with its value, and `set` only stores a body
+    if that generation is still current, so a read that started before a
+    write (in this worker or another) cannot put the old body back. The
+    write also opens a `WRITE_BYPASS` window, shared by all workers, in which
+    their reads skip the nginx micro-cache (see `written_recently`).
+    """
+
+    # A TTL of 0 disables caching
+    TTL = 30.0
+    PRUNE_EVERY = 256
+    # Longer than nginx keeps an API response fresh (nginx/conf.d/app.conf)
+    WRITE_BYPASS = 10.0
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path
+        self._local: dict[str, tuple[float, str]] = {}
+        self._geracoes: dict[str, int] = {}
+        self._escrita_ate = 0.0
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def _db(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=OFF")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS geracoes (prefixo TEXT PRIMARY KEY, geracao INTEGER NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS escrita (id INTEGER PRIMARY KEY CHECK (id = 1), ate REAL NOT NULL)"
+            )
+            self._connection = connection
+        return self._connection
+
+    def _geracao_local(self, key: str) -> int:
+        return sum(geracao for prefixo, geracao in self._geracoes.items() if key.startswith(prefixo))
+
+    async def get(self, key: str) -> tuple[Optional[str], int]:
+        """The cached body of `key`, if any, and the generation to pass to `set` once it is fetched again"""
+        now = time.time()
+        if self.path is None:
+            entry = self._local.get(key)
+            return (entry[1] if entry and entry[0] > now else None), self._geracao_local(key)
+
+        return await asyncio.to_thread(self._get_db, key, now)
+
+    def _get_db(self, key: str, now: float) -> tuple[Optional[str], int]:
+        with self._lock:
+            # One statement, so the value and the generation come from the same snapshot
+            return self._db().execute(
+                f"SELECT (SELECT value FROM cache WHERE key = ? AND expires > ?), ({_GERACAO_SQL})",
+                (key, now, key),
+            ).fetchone()
+
+    async def set(self, key: str, value: str, geracao: int, ttl: Optional[float] = None) -> None:
+        """Stores `value` unless `key` was invalidated after the `get` that returned `geracao`"""
+        ttl = self.TTL if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        expires = time.time() + ttl
+        self._writes += 1
+        prune = self._writes % self.PRUNE_EVERY == 0
+
+        if self.path is None:
+            if self._geracao_local(key) != geracao:
+                return
+            self._local[key] = (expires, value)
+            if prune:
+                now = time.time()
+                self._local = {k: entry for k, entry in self._local.items() if entry[0] > now}
+            return
+
+        await asyncio.to_thread(self._set_db, key, value, geracao, expires, prune)
+
+    def _set_db(self, key: str, value: str, geracao: int, expires: float, prune: bool) -> None:
+        with self._lock:
+            db = self._db()
+            db.execute(
+                f"INSERT OR REPLACE INTO cache (key, value, expires) SELECT ?, ?, ? WHERE ({_GERACAO_SQL}) = ?",
+                (key, value, expires, key, geracao),
+            )
+            if prune:
+                db.execute("DELETE FROM cache WHERE expires <= ?", (time.time(),))
+
+    async def invalidate(self, *prefixes: str) -> None:
+        """Drops every entry whose key starts with one of `prefixes`, in all workers, after a write"""
+        ate = time.time() + self.WRITE_BYPASS
+        if self.path is None:
+            self._local = {k: entry for k, entry in self._local.items() if not k.startswith(prefixes)}
+            for prefix in prefixes:
+                self._geracoes[prefix] = self._geracoes.get(prefix, 0) + 1
+            self._escrita_ate = ate
+            return
+
+        await asyncio.to_thread(self._invalidate_db, prefixes, ate)
+
+    def _invalidate_db(self, prefixes: tuple[str, ...], ate: float) -> None:
+        with self._lock:
+            db = self._db()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                for prefix in prefixes:
+                    db.execute("DELETE FROM cache WHERE substr(key, 1, ?) = ?", (len(prefix), prefix))
+                    db.execute(
+                        "INSERT INTO geracoes (prefixo, geracao) VALUES (?, 1) "
+                        "ON CONFLICT (prefixo) DO UPDATE SET geracao = geracao + 1",
+                        (prefix,),
+                    )
+                db.execute("INSERT OR REPLACE INTO escrita (id, ate) VALUES (1, ?)", (ate,))
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+
+    async def written_recently(self) -> bool:
+        """Whether any worker wrote through the API in the last `WRITE_BYPASS` seconds"""
+        if self.path is None:
+            return time.time() < self._escrita_ate
+
+        return await asyncio.to_thread(self._written_recently_db)
+
+    def _written_recently_db(self) -> bool:
+        with self._lock:
+            row = self._db().execute("SELECT ate FROM escrita WHERE id = 1").fetchone()
+        return row is not None and time.time() < row[0]
+
+
+cache = SharedCache(CACHE_PATH)
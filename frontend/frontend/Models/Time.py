@@ -1,8 +1,15 @@
 # In Time.py
 from dataclasses import dataclass
 import copy
+import json
 from typing import Optional
-import httpx
+from ..lazy import lazy_import
+from ..settings import API_URL
+from .BatchClient import batch
+from .ClassificacaoCache import classificacao_cache
+from .SharedCache import cache
+
+httpx = lazy_import("httpx")
 
 
 @dataclass
@@ -27,37 +34,64 @@ class Time:
 
 
 class TimeAPI:
-    BASE_URL = "http://host.docker.internal:80/api/times"
+    BASE_URL = f"{API_URL}/times"
     TIMEOUT = 20.0  # Reduced timeout to 5 seconds
 
+    @staticmethod
+    async def _invalidate() -> None:
+        # Team names are embedded in match lists and standings too
+        await cache.invalidate("times:", "partidas:", "classificacao:")
+        classificacao_cache.clear()
+
     @staticmethod
     async def get_all() -> list[Time]:
-        async with httpx.AsyncClient(
-            timeout=httpx.Timeout(TimeAPI.TIMEOUT), headers={"Accept": "application/json"}
-        ) as client:
-            try:
-                response = await client.get(TimeAPI.BASE_URL)
-                if response.status_code == 200:
-                    return [Time(**item) for item in response.json()]
-                else:
-                    print(f"API returned status code: {response.status_code}")
-                    print(f"Response content: {response.text}")
-            except httpx.TimeoutException:
-                print("Request timed out")
-            except Exception as e:
-                print(f"Error fetching times: {type(e).__name__} - {str(e)}")
-            return []
+        cached, geracao = await cache.get("times:all")
+        if cached is not None:
+            return [Time(**item) for item in json.loads(cached)]
+
+        try:
+            response = await batch.get(TimeAPI.BASE_URL)
+            if response.status_code == 200:
+                await cache.set("times:all", response.text, geracao)
+                return [Time(**item) for item in response.json()]
+            else:
+                print(f"API returned status code: {response.status_code}")
+                print(f"Response content: {response.text}")
+        except httpx.TimeoutException:
+            print("Request timed out")
+        except Exception as e:
+            print(f"Error fetching times: {type(e).__name__} - {str(e)}")
+        return []
 
     @staticmethod
     async def get_one(id: int) -> Optional[Time]:
-        async with httpx.AsyncClient(timeout=httpx.Timeout(TimeAPI.TIMEOUT)) as client:
-            try:
-                response = await client.get(f"{TimeAPI.BASE_URL}/{id}")
-                if response.status_code == 200:
-                    return Time(**response.json())
-            except Exception as e:
-                print(f"Error fetching time: {e}")
-            return None
+        try:
+            response = await batch.get(f"{TimeAPI.BASE_URL}/{id}")
+            if response.status_code == 200:
+                return Time(**response.json())
+        except Exception as e:
+            print(f"Error fetching time: {e}")
+        return None
+
+    @staticmethod
+    async def search(q: str, limite: int = 10) -> list[Time]:
+        """Teams whose name contains `q` or resembles it, best matches first"""
+        cache_key = f"times:search:{limite}:{q.casefold()}"
+        cached, geracao = await cache.get(cache_key)
+        if cached is not None:
+            return [Time(**item) for item in json.loads(cached)]
+
+        try:
+            # A plain GET, so the nginx micro-cache serves the prefixes other users typed
+            response = await batch.get(
+                f"{TimeAPI.BASE_URL}/search", params={"q": q, "limite": limite}, coalesce=False
+            )
+            if response.status_code == 200:
+                await cache.set(cache_key, response.text, geracao)
+                return [Time(**item) for item in response.json()]
+        except Exception as e:
+            print(f"Error searching times: {e}")
+        return []
 
     @staticmethod
     async def create(time: Time) -> Optional[Time]:
@@ -67,6 +101,7 @@ class TimeAPI:
                     TimeAPI.BASE_URL, json={"nome": time.nome, "estadio": time.estadio, "cidade": time.cidade}
                 )
                 if response.status_code == 201:
+                    await TimeAPI._invalidate()
                     return Time(**response.json())
             except Exception as e:
                 print(f"Error creating time: {e}")
@@ -84,6 +119,7 @@ class TimeAPI:
                     json={"nome": time.nome, "estadio": time.estadio, "cidade": time.cidade},
                 )
                 if response.status_code == 200:
+                    await TimeAPI._invalidate()
                     return Time(**response.json())
             except Exception as e:
                 print(f"Error updating time: {e}")
@@ -94,7 +130,10 @@ class TimeAPI:
         async with httpx.AsyncClient(timeout=httpx.Timeout(TimeAPI.TIMEOUT)) as client:
             try:
                 response = await client.delete(f"{TimeAPI.BASE_URL}/{id}")
-                return response.status_code == 204
+                if response.status_code == 204:
+                    await TimeAPI._invalidate()
+                    return True
+                return False
             except Exception as e:
                 print(f"Error deleting time: {e}")
                 return False
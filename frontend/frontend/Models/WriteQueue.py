@@ -0,0 +1,48 @@
+from __future__ import annotations
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+
+
+class WriteQueue:
+    """Runs API writes one at a time, in the order they were submitted.
+
+    One queue is attached to each Rio session, so a user editing quickly never
+    has two writes for the same session in flight at once.
+    """
+
+    def __init__(self) -> None:
+        self._queue: asyncio.Queue[tuple[Callable[[], Awaitable[Any]], asyncio.Future]] = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def submit(self, write: Callable[[], Awaitable[Any]]) -> asyncio.Future:
+        """Schedule `write` after every previously submitted write and return a future with its result"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.put_nowait((write, future))
+
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+
+        return future
+
+    async def _run(self) -> None:
+        while not self._queue.empty():
+            write, future = self._queue.get_nowait()
+            try:
+                result = await write()
+            except Exception as e:
+                if not future.cancelled():
+                    future.set_exception(e)
+            except BaseException:
+                # The worker is going away (e.g. cancelled), so nothing behind this write will run either
+                future.cancel()
+                while not self._queue.empty():
+                    self._queue.get_nowait()[1].cancel()
+                raise
+            else:
+                if not future.cancelled():
+                    future.set_result(result)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+import asyncio
+from dataclasses import KW_ONLY, field
+import rio
+from ..Models.PrefixIndex import PrefixIndex
+from ..Models.Time import Time, TimeAPI
+
+
+class TimeSearch(rio.Component):
+    """Type-ahead team picker.
+
+    Suggestions come from `indice` on every keystroke. When it has fewer
+    than `limite` matches, the API search fills in the rest once typing
+    pauses, and the teams it returns are added to `indice` for the next
+    lookup. Picking a suggestion calls `on_change` with the team; clearing
+    the text calls it with None.
+    """
+
+    indice: PrefixIndex[Time]
+    _: KW_ONLY
+    selecionado: Time | None = None
+    label: str = ""
+    limite: int = 8
+    on_change: rio.EventHandler[Time | None] = None
+
+    texto: str = ""
+    sugestoes: list[Time] = field(default_factory=list)
+    # Bumped on every keystroke so a slow API answer cannot replace newer suggestions
+    _consulta: int = 0
+
+    PAUSA = 0.15
+    MIN_REMOTO = 2
+
+    def __post_init__(self) -> None:
+        if self.selecionado is not None:
+            self.texto = self.selecionado.nome
+
+    async def on_change_texto(self, event: rio.TextInputChangeEvent) -> None:
+        self.texto = event.text
+        self._consulta += 1
+
+        if not event.text.strip():
+            self.sugestoes = []
+            if self.selecionado is not None:
+                self.selecionado = None
+                await self.call_event_handler(self.on_change, None)
+            return
+
+        self.sugestoes = self.indice.search(event.text, self.limite)
+        if len(self.sugestoes) < self.limite and len(PrefixIndex.normalizar(event.text)) >= self.MIN_REMOTO:
+            self.session.create_task(self._buscar(event.text, self._consulta))
+
+    async def _buscar(self, texto: str, consulta: int) -> None:
+        await asyncio.sleep(self.PAUSA)
+        if consulta != self._consulta:
+            return
+
+        encontrados = await TimeAPI.search(texto, self.limite)
+        self.indice.add(encontrados)
+        if consulta != self._consulta:
+            return
+
+        ids = {time.id for time in self.sugestoes}
+        self.sugestoes = self.sugestoes + [time for time in encontrados if time.id not in ids][
+            : self.limite - len(self.sugestoes)
+        ]
+
+    async def on_select(self, time: Time) -> None:
+        self._consulta += 1
+        self.selecionado = time
+        self.texto = time.nome
+        self.sugestoes = []
+        await self.call_event_handler(self.on_change, time)
+
+    def build(self) -> rio.Component:
+        return rio.Column(
+            rio.TextInput(
+                self.texto,
+                label=self.label,
+                on_change=self.on_change_texto,
+            ),
+            *(
+                [
+                    rio.ListView(
+                        *(
+                            rio.SimpleListItem(
+                                text=time.nome,
+                                secondary_text=time.cidade or "",
+                                key=str(time.id),
+                                on_press=lambda time=time: self.on_select(time),
+                            )
+                            for time in self.sugestoes
+                        )
+                    )
+                ]
+                if self.sugestoes
+                else []
+            ),
+            spacing=0.5,
+        )
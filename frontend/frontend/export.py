@@ -0,0 +1,91 @@
+"""Exports matches or standings snapshots of a range of seasons to CSV or Parquet.
+
+Rows are written while the API streams them, in Parquet row groups of
+`--row-group` rows, so memory stays flat however many seasons are exported:
+
+    python -m frontend.export partidas --ano-inicio 1971 --ano-fim 2070 --output partidas.parquet
+    API_URL=http://localhost/api python -m frontend.export classificacoes --ano-inicio 2024 --output tabela.csv
+
+Parquet output needs `pyarrow`, which the app itself does not depend on.
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import csv
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from typing import AsyncIterator, Callable
+
+from .Models.Classificacao import ClassificacaoAPI
+from .Models.CsvStream import Colunas
+from .Models.Partida import PartidaAPI
+
+EXPORTS: dict[str, tuple[Callable[..., AsyncIterator[dict]], Colunas]] = {
+    "partidas": (PartidaAPI.export, PartidaAPI.EXPORT_COLUNAS),
+    "classificacoes": (ClassificacaoAPI.export, ClassificacaoAPI.EXPORT_COLUNAS),
+}
+
+
+async def write_csv(linhas: AsyncIterator[dict], colunas: Colunas, output: Path) -> int:
+    total = 0
+    with open(output, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(colunas))
+        writer.writeheader()
+        async for linha in linhas:
+            writer.writerow(linha)
+            total += 1
+    return total
+
+
+async def write_parquet(linhas: AsyncIterator[dict], colunas: Colunas, output: Path, row_group: int) -> int:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ModuleNotFoundError:
+        raise SystemExit("Parquet output needs pyarrow: pip install pyarrow") from None
+
+    tipos = {int: pa.int64(), str: pa.string(), date.fromisoformat: pa.date32()}
+    schema = pa.schema([(nome, tipos[parse]) for nome, parse in colunas.items()])
+
+    total = 0
+    with pq.ParquetWriter(output, schema) as writer:
+        buffer: dict[str, list] = {nome: [] for nome in colunas}
+        async for linha in linhas:
+            for nome, valor in linha.items():
+                buffer[nome].append(valor)
+            total += 1
+            if total % row_group == 0:
+                writer.write_table(pa.table(buffer, schema=schema))
+                buffer = {nome: [] for nome in colunas}
+        if total % row_group:
+            writer.write_table(pa.table(buffer, schema=schema))
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("tipo", choices=list(EXPORTS))
+    parser.add_argument("--ano-inicio", type=int, required=True)
+    parser.add_argument("--ano-fim", type=int, help="last season, defaults to --ano-inicio")
+    parser.add_argument("--output", type=Path, required=True)
+    parser.add_argument("--format", choices=["csv", "parquet"], help="defaults to the --output extension")
+    parser.add_argument("--row-group", type=int, default=50_000, help="rows per Parquet row group")
+    args = parser.parse_args()
+
+    formato = args.format or ("parquet" if args.output.suffix == ".parquet" else "csv")
+    export, colunas = EXPORTS[args.tipo]
+    linhas = export(args.ano_inicio, args.ano_fim)
+
+    inicio = time.perf_counter()
+    if formato == "parquet":
+        total = asyncio.run(write_parquet(linhas, colunas, args.output, args.row_group))
+    else:
+        total = asyncio.run(write_csv(linhas, colunas, args.output))
+    print(f"{total} rows written to {args.output} in {time.perf_counter() - inicio:.1f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
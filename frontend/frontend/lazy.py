@@ -0,0 +1,26 @@
+from __future__ import annotations
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Returns `name` as a module whose real import runs on first attribute access.
+
+    Pages and models are imported by Rio at startup whether or not a session
+    ever opens them, so heavy dependencies are bound through this instead of
+    a plain `import`.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -4,7 +4,10 @@ import typing as t
 from dataclasses import field
 import rio
 from ..Models.Partida import Partida, PartidaAPI
-from ..Models.Time import Time, TimeAPI
+from ..Models.PrefixIndex import PrefixIndex
+from ..Models.Time import Time
+from ..Models.WriteQueue import WriteQueue
+from ..components.time_search import TimeSearch
 
 
 @rio.page(
@@ -13,12 +16,13 @@ from ..Models.Time import Time, TimeAPI
 )
 class PartidasPage(rio.Component):
     partidas: list[Partida] = field(default_factory=list)
-    times: list[Time] = field(default_factory=list)
+    # Teams seen in the loaded matches; the team inputs search the API for the others
+    indice_times: PrefixIndex[Time] = field(default_factory=PrefixIndex)
     currently_selected_partida: Partida | None = None
     banner_text: str = ""
     banner_style: t.Literal["success", "danger", "info"] = "success"
     is_loading: bool = False
-    partida_filter: str | None = None
+    time_filtro: Time | None = None
 
     @rio.event.on_populate
     async def on_populate(self) -> None:
@@ -27,9 +31,8 @@ class PartidasPage(rio.Component):
         self.banner_style = "info"
 
         try:
-            # Load both partidas and times
             self.partidas = await PartidaAPI.get_all()
-            self.times = await TimeAPI.get_all()
+            self._indexar_times()
 
             if self.partidas:
                 self.banner_text = f"{len(self.partidas)} partidas carregadas"
@@ -58,18 +61,15 @@ class PartidasPage(rio.Component):
                 margin=3,
             )
 
-        # Add your filter dropdown
-        if self.times:
-            options = {"Todos": ""} | {time.nome: str(time.id) for time in self.times}
-            list_items.append(
-                rio.Dropdown(
-                    options=options,
-                    selected_value=self.partida_filter,
-                    on_change=self.on_filter_change,
-                    label="Filtrar por Time",
-                    key="time_filter",  # Add a key
-                )
+        list_items.append(
+            TimeSearch(
+                self.indice_times,
+                selecionado=self.time_filtro,
+                label="Filtrar por Time",
+                on_change=self.on_filter_change,
+                key="time_filter",
             )
+        )
 
         list_items.append(
             rio.SimpleListItem(
@@ -92,7 +92,7 @@ class PartidasPage(rio.Component):
                         min_width=8,
                         on_press=functools.partial(self.on_press_delete_item, i),
                     ),
-                    key=str(item.id),
+                    key=str(item.id) if item.id else f"pending-{id(item)}",
                     on_press=functools.partial(self.on_spawn_dialog_edit_partida, item, i),
                 )
             )
@@ -115,25 +115,49 @@ class PartidasPage(rio.Component):
             margin=3,
         )
 
-    async def on_filter_change(self, event: rio.DropdownChangeEvent) -> None:
-        if event.value:
-            # Convert the selected team ID to int and find the corresponding Time object
-            team_id = int(event.value)
-            selected_team = next((time for time in self.times if time.id == team_id), None)
-            if selected_team:
-                self.partidas = await PartidaAPI.get_all(selected_team)
-        else:
-            # If no team is selected, show all partidas
-            self.partidas = await PartidaAPI.get_all()
+    async def on_filter_change(self, time: Time | None) -> None:
+        self.time_filtro = time
+        # Without a team, show all partidas
+        self.partidas = await PartidaAPI.get_all(time)
+        self._indexar_times()
+
+    def _indexar_times(self) -> None:
+        self.indice_times.add(
+            time for partida in self.partidas for time in (partida.timeCasa, partida.timeVisitante) if time is not None
+        )
+
+    def _write_queue(self) -> WriteQueue:
+        """Returns the write queue of this session, creating it on first use"""
+        try:
+            return self.session[WriteQueue]
+        except KeyError:
+            queue = WriteQueue()
+            self.session.attach(queue)
+            return queue
+
+    def _replace_partida(self, old: Partida, new: Partida | None) -> None:
+        """Swaps `old` for `new` in the list, or drops it when `new` is None"""
+        self.partidas = [
+            new if item is old else item for item in self.partidas if item is not old or new is not None
+        ]
 
     async def on_press_delete_item(self, idx: int) -> None:
         partida = self.partidas[idx]
-        if partida.id and await PartidaAPI.delete(partida.id):
-            self.partidas.pop(idx)
-            self.banner_text = "Partida foi deletada"
-            self.banner_style = "danger"
-            self.currently_selected_partida = None
-        else:
+        self._replace_partida(partida, None)
+        self.banner_text = "Partida foi deletada"
+        self.banner_style = "danger"
+        self.currently_selected_partida = None
+        self.session.create_task(self._reconcile_delete(partida, idx))
+
+    async def _reconcile_delete(self, partida: Partida, idx: int) -> None:
+        async def write() -> bool:
+            # A match whose creation never reached the API has nothing to delete
+            return partida.id is None or await PartidaAPI.delete(partida.id)
+
+        if not await self._write_queue().submit(write):
+            partidas = list(self.partidas)
+            partidas.insert(min(idx, len(partidas)), partida)
+            self.partidas = partidas
             self.banner_text = "Erro ao deletar partida"
             self.banner_style = "danger"
 
@@ -154,9 +178,9 @@ class PartidasPage(rio.Component):
                     label="Data",
                     on_change=on_change_data,
                 ),
-                rio.Dropdown(
-                    options={time.nome: str(time.id) for time in self.times},
-                    selected_value=str(selected_partida_copied.id_time_casa),
+                TimeSearch(
+                    self.indice_times,
+                    selecionado=selected_partida_copied.timeCasa,
                     label="Time Casa",
                     on_change=on_change_time_casa,
                 ),
@@ -166,9 +190,9 @@ class PartidasPage(rio.Component):
                     on_change=on_change_gols_casa,
                     minimum=0,
                 ),
-                rio.Dropdown(
-                    options={time.nome: str(time.id) for time in self.times},
-                    selected_value=str(selected_partida_copied.id_time_visitante),
+                TimeSearch(
+                    self.indice_times,
+                    selecionado=selected_partida_copied.timeVisitante,
                     label="Time Visitante",
                     on_change=on_change_time_visitante,
                 ),
@@ -190,7 +214,7 @@ class PartidasPage(rio.Component):
                     ),
                     rio.Button(
                         "Cancelar",
-                        on_press=lambda: dialog.close(selected_partida),
+                        on_press=lambda: dialog.close(None),
                     ),
                     spacing=1,
                     align_x=1,
@@ -204,14 +228,17 @@ class PartidasPage(rio.Component):
         def on_change_data(ev: rio.DateChangeEvent) -> None:
             selected_partida_copied.data = ev.value
 
-        def on_change_time_casa(ev: rio.DropdownChangeEvent) -> None:
-            selected_partida_copied.id_time_casa = int(ev.value)
+        # The picked team objects travel with the match, so optimistic rows render like the ones from the API
+        def on_change_time_casa(time: Time | None) -> None:
+            selected_partida_copied.timeCasa = time
+            selected_partida_copied.id_time_casa = time.id if time else 0
 
         def on_change_gols_casa(ev: rio.NumberInputChangeEvent) -> None:
             selected_partida_copied.gols_time_casa = ev.value
 
-        def on_change_time_visitante(ev: rio.DropdownChangeEvent) -> None:
-            selected_partida_copied.id_time_visitante = int(ev.value)
+        def on_change_time_visitante(time: Time | None) -> None:
+            selected_partida_copied.timeVisitante = time
+            selected_partida_copied.id_time_visitante = time.id if time else 0
 
         def on_change_gols_visitante(ev: rio.NumberInputChangeEvent) -> None:
             selected_partida_copied.gols_time_visitante = ev.value
@@ -235,14 +262,25 @@ class PartidasPage(rio.Component):
             self.banner_text = "Partida não foi atualizada"
             self.banner_style = "danger"
         else:
-            updated_partida = await PartidaAPI.update(result)
-            if updated_partida:
-                self.partidas[idx] = updated_partida
-                self.banner_text = "Partida foi atualizada"
-                self.banner_style = "info"
-            else:
-                self.banner_text = "Erro ao atualizar partida"
-                self.banner_style = "danger"
+            self._replace_partida(selected_partida, result)
+            self.banner_text = "Partida foi atualizada"
+            self.banner_style = "info"
+            self.session.create_task(self._reconcile_update(selected_partida, result))
+
+    async def _reconcile_update(self, previous: Partida, edited: Partida) -> None:
+        async def write() -> Partida | None:
+            # The edit may have been made while the match was still being created
+            if edited.id is None:
+                edited.id = previous.id
+            return await PartidaAPI.update(edited)
+
+        updated_partida = await self._write_queue().submit(write)
+        if updated_partida:
+            self._replace_partida(edited, updated_partida)
+        else:
+            self._replace_partida(edited, previous if previous.id is not None else None)
+            self.banner_text = "Erro ao atualizar partida"
+            self.banner_style = "danger"
 
     async def on_spawn_dialog_add_new_partida(self) -> None:
         new_partida = Partida.new_empty()
@@ -252,11 +290,23 @@ class PartidasPage(rio.Component):
             self.banner_text = "Partida não foi adicionada"
             self.banner_style = "danger"
         else:
-            created_partida = await PartidaAPI.create(result)
-            if created_partida:
-                self.partidas.append(created_partida)
-                self.banner_text = "Partida foi adicionada"
-                self.banner_style = "success"
-            else:
-                self.banner_text = "Erro ao adicionar partida"
-                self.banner_style = "danger"
+            self.partidas = self.partidas + [result]
+            self.banner_text = "Partida foi adicionada"
+            self.banner_style = "success"
+            self.session.create_task(self._reconcile_create(result))
+
+    async def _reconcile_create(self, placeholder: Partida) -> None:
+        async def write() -> Partida | None:
+            created = await PartidaAPI.create(placeholder)
+            if created:
+                # Writes queued behind this one read the id from the placeholder
+                placeholder.id = created.id
+            return created
+
+        created_partida = await self._write_queue().submit(write)
+        if created_partida:
+            self._replace_partida(placeholder, created_partida)
+        else:
+            self._replace_partida(placeholder, None)
+            self.banner_text = "Erro ao adicionar partida"
+            self.banner_style = "danger"
@@ -1,9 +1,12 @@
 from __future__ import annotations
+import bisect
 from dataclasses import field
 import typing as t
-from datetime import datetime
+from datetime import date, datetime, timedelta
 import rio
-from ..Models.Classificacao import ClassificacaoTime, ClassificacaoAPI
+from ..Models.Classificacao import ClassificacaoTime
+from ..Models.ClassificacaoCache import classificacao_cache
+from ..Models.Partida import PartidaAPI
 
 
 @rio.page(
@@ -16,37 +19,93 @@ class ClassificacaoPage(rio.Component):
     selected_date: str = datetime.now().strftime("%Y-%m-%d")
     banner_text: str = ""
     banner_style: t.Literal["success", "danger", "info"] = "success"
+    datas: list[date] = field(default_factory=list)
     is_loading: bool = False
+    _carga: int = 0
 
     @rio.event.on_populate
     async def on_populate(self) -> None:
+        await self.load_datas()
         await self.load_classificacao()
 
+    async def load_datas(self) -> None:
+        self.datas = await PartidaAPI.get_datas(self.selected_year)
+
+    def _rodada(self) -> str:
+        """The latest match date at or before the picked date.
+
+        Standings only change on match days, so every date between two rounds
+        shares one table and one cache key.
+        """
+        if not self.datas:
+            return self.selected_date
+
+        indice = bisect.bisect_right(self.datas, date.fromisoformat(self.selected_date))
+        if indice == 0:
+            # Before the first match of the season every team is on zero
+            return date(self.selected_year, 1, 1).isoformat()
+        return self.datas[indice - 1].isoformat()
+
+    def _show(self, classificacao: list[ClassificacaoTime]) -> None:
+        self.classificacao = classificacao
+        if classificacao:
+            self.banner_text = f"Classificação do Campeonato {self.selected_year}"
+            self.banner_style = "success"
+        else:
+            self.banner_text = "Nenhum dado encontrado"
+            self.banner_style = "info"
+
     async def load_classificacao(self) -> None:
-        self.is_loading = True
-        self.banner_text = "Carregando classificação..."
-        self.banner_style = "info"
-
-        try:
-            self.classificacao = await ClassificacaoAPI.get_classificacao(self.selected_year, self.selected_date)
-            if self.classificacao:
-                self.banner_text = f"Classificação do Campeonato {self.selected_year}"
-                self.banner_style = "success"
-            else:
-                self.banner_text = "Nenhum dado encontrado"
+        ano, data = self.selected_year, self._rodada()
+        # Bumped on every call, so a slow load cannot overwrite a newer round or its spinner
+        self._carga += 1
+        carga = self._carga
+
+        cached, fresh = classificacao_cache.peek(ano, data)
+        if cached is not None:
+            self._show(cached)
+
+        # Whatever table is on screen stays there until the new one arrives
+        self.is_loading = not fresh
+        if not fresh:
+            if cached is None:
+                self.banner_text = "Carregando classificação..."
                 self.banner_style = "info"
-        except Exception as e:
-            self.banner_text = f"Erro ao carregar dados: {str(e)}"
-            self.banner_style = "danger"
-        finally:
-            self.is_loading = False
+
+            try:
+                classificacao = await classificacao_cache.fetch(ano, data)
+                if carga == self._carga:
+                    self._show(classificacao)
+            except Exception as e:
+                if carga == self._carga:
+                    self.banner_text = f"Erro ao carregar dados: {str(e)}"
+                    self.banner_style = "danger"
+            finally:
+                if carga == self._carga:
+                    self.is_loading = False
+
+        self.session.create_task(classificacao_cache.prefetch(ano, self._rodadas_vizinhas(data)))
+
+    def _rodadas_vizinhas(self, data: str) -> list[str]:
+        """The rounds users are most likely to step to next"""
+        dia = date.fromisoformat(data)
+        if not self.datas:
+            return [(dia + timedelta(days=delta)).isoformat() for delta in (1, -1, 2)]
+
+        indice = bisect.bisect_left(self.datas, dia)
+        if indice < len(self.datas) and self.datas[indice] != dia:
+            # Before the first round, the next one is the first match date itself
+            indice -= 1
+        vizinhas = [indice + 1, indice - 1, indice + 2]
+        return [self.datas[i].isoformat() for i in vizinhas if 0 <= i < len(self.datas)]
 
     async def on_date_change(self, event: rio.DateChangeEvent) -> None:
         self.selected_date = event.value.strftime("%Y-%m-%d")
         await self.load_classificacao()
 
     async def on_year_change(self, event: rio.NumberInputChangeEvent) -> None:
-        self.selected_year = event.value
+        self.selected_year = int(event.value)
+        await self.load_datas()
         await self.load_classificacao()
 
     def _create_table_data(self) -> dict[str, list[str | int]]:
@@ -64,18 +123,6 @@ class ClassificacaoPage(rio.Component):
         }
 
     def build(self) -> rio.Component:
-        if self.is_loading:
-            return rio.Column(
-                rio.Banner(
-                    self.banner_text,
-                    style=self.banner_style,
-                    margin_bottom=1,
-                ),
-                rio.ProgressCircle(),
-                align_y=0,
-                margin=3,
-            )
-
         # Filter controls
         controls = rio.Row(
             rio.NumberInput(
@@ -92,6 +139,12 @@ class ClassificacaoPage(rio.Component):
                 label="Data",
                 on_change=self.on_date_change,
             ),
+            rio.ProgressCircle(
+                min_size=1.5,
+                align_y=0.5,
+            )
+            if self.is_loading
+            else rio.Spacer(min_width=1.5, grow_x=False, grow_y=False),
             spacing=2,
             margin=2,
         )
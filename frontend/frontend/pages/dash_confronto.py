@@ -0,0 +1,152 @@
+from __future__ import annotations
+import asyncio
+import typing as t
+from dataclasses import field
+import rio
+from ..Models.Partida import Confronto, Forma, PartidaAPI
+from ..Models.Time import Time, TimeAPI
+
+
+@rio.page(
+    name="Confrontos",
+    url_segment="confrontos",
+)
+class ConfrontoPage(rio.Component):
+    times: list[Time] = field(default_factory=list)
+    time_a: int | None = None
+    time_b: int | None = None
+    confronto: Confronto | None = None
+    forma_a: Forma | None = None
+    forma_b: Forma | None = None
+    banner_text: str = ""
+    banner_style: t.Literal["success", "danger", "info"] = "success"
+    is_loading: bool = False
+
+    @rio.event.on_populate
+    async def on_populate(self) -> None:
+        self.times = await TimeAPI.get_all()
+        if self.times:
+            self.banner_text = "Escolha dois times"
+            self.banner_style = "info"
+        else:
+            self.banner_text = "Nenhum time encontrado"
+            self.banner_style = "danger"
+
+    async def load_confronto(self) -> None:
+        if self.time_a is None or self.time_b is None or self.time_a == self.time_b:
+            self.confronto = None
+            return
+
+        self.is_loading = True
+        self.banner_text = "Carregando confronto..."
+        self.banner_style = "info"
+
+        try:
+            # Only the aggregate and the latest matches are fetched, never the full histories
+            self.confronto, self.forma_a, self.forma_b = await asyncio.gather(
+                PartidaAPI.get_confronto(self.time_a, self.time_b),
+                PartidaAPI.get_forma(self.time_a),
+                PartidaAPI.get_forma(self.time_b),
+            )
+            if self.confronto:
+                self.banner_text = f"{self.confronto.jogos} jogos entre os times"
+                self.banner_style = "success"
+            else:
+                self.banner_text = "Erro ao carregar confronto"
+                self.banner_style = "danger"
+        finally:
+            self.is_loading = False
+
+    async def on_change_time_a(self, event: rio.DropdownChangeEvent) -> None:
+        self.time_a = int(event.value) if event.value else None
+        await self.load_confronto()
+
+    async def on_change_time_b(self, event: rio.DropdownChangeEvent) -> None:
+        self.time_b = int(event.value) if event.value else None
+        await self.load_confronto()
+
+    def _build_forma(self, forma: Forma | None) -> rio.Component:
+        if forma is None:
+            return rio.Text("-")
+
+        return rio.Column(
+            rio.Text(forma.time.nome, style="heading3"),
+            rio.Text(f"Últimos jogos: {' '.join(forma.sequencia) or '-'}"),
+            rio.Text(f"{forma.pontos} pontos ({forma.aproveitamento}%)"),
+            spacing=0.5,
+        )
+
+    def _build_resumo(self, confronto: Confronto) -> rio.Component:
+        return rio.Card(
+            rio.Column(
+                rio.Text(
+                    f"{confronto.time_a.nome} {confronto.vitorias_a} x {confronto.vitorias_b} {confronto.time_b.nome}",
+                    style="heading2",
+                ),
+                rio.Text(f"{confronto.jogos} jogos - {confronto.empates} empates"),
+                rio.Text(f"Gols: {confronto.gols_a} x {confronto.gols_b}"),
+                spacing=0.5,
+                margin=2,
+            ),
+            margin_bottom=1,
+        )
+
+    def build(self) -> rio.Component:
+        options = {"Selecione": ""} | {time.nome: str(time.id) for time in self.times}
+        controls = rio.Row(
+            rio.Dropdown(
+                options=options,
+                selected_value=str(self.time_a) if self.time_a else "",
+                label="Time A",
+                on_change=self.on_change_time_a,
+            ),
+            rio.Dropdown(
+                options=options,
+                selected_value=str(self.time_b) if self.time_b else "",
+                label="Time B",
+                on_change=self.on_change_time_b,
+            ),
+            spacing=2,
+            margin_bottom=1,
+        )
+
+        content: list[rio.Component] = []
+        if self.is_loading:
+            content.append(rio.ProgressCircle())
+        elif self.confronto is not None:
+            content.append(self._build_resumo(self.confronto))
+            content.append(
+                rio.Row(
+                    self._build_forma(self.forma_a),
+                    self._build_forma(self.forma_b),
+                    spacing=4,
+                    margin_bottom=1,
+                )
+            )
+            content.append(
+                rio.ListView(
+                    *(
+                        rio.SimpleListItem(
+                            text=partida.score_display,
+                            secondary_text=f"{partida.formatted_date} - {partida.estadio}",
+                            key=str(partida.id),
+                        )
+                        for partida in self.confronto.partidas
+                    ),
+                    align_y=0,
+                )
+                if self.confronto.partidas
+                else rio.Text("Os times ainda não se enfrentaram")
+            )
+
+        return rio.Column(
+            rio.Banner(
+                self.banner_text,
+                style=self.banner_style,
+                margin_bottom=1,
+            ),
+            controls,
+            *content,
+            align_y=0,
+            margin=3,
+        )
@@ -0,0 +1,144 @@
+from __future__ import annotations
+import typing as t
+from datetime import datetime
+import rio
+from ..Models.Classificacao import ClassificacaoAPI, EvolucaoClassificacao
+
+if t.TYPE_CHECKING:
+    import matplotlib.figure
+
+
+@rio.page(
+    name="Evolução",
+    url_segment="evolucao",
+)
+class EvolucaoPage(rio.Component):
+    evolucao: EvolucaoClassificacao | None = None
+    selected_year: int = datetime.now().year
+    destaque: int | None = None
+    banner_text: str = ""
+    banner_style: t.Literal["success", "danger", "info"] = "success"
+    is_loading: bool = False
+
+    @rio.event.on_populate
+    async def on_populate(self) -> None:
+        await self.load_evolucao()
+
+    async def load_evolucao(self) -> None:
+        self.is_loading = True
+        self.banner_text = "Carregando evolução..."
+        self.banner_style = "info"
+
+        try:
+            # One request for the whole league instead of one history per team
+            self.evolucao = await ClassificacaoAPI.get_evolucao(self.selected_year)
+            if self.evolucao and self.evolucao.datas:
+                self.banner_text = f"Posição por rodada - {self.selected_year}"
+                self.banner_style = "success"
+            else:
+                self.banner_text = "Nenhum dado encontrado"
+                self.banner_style = "info"
+        except Exception as e:
+            self.banner_text = f"Erro ao carregar dados: {str(e)}"
+            self.banner_style = "danger"
+        finally:
+            self.is_loading = False
+
+    async def on_year_change(self, event: rio.NumberInputChangeEvent) -> None:
+        self.selected_year = int(event.value)
+        await self.load_evolucao()
+
+    def on_destaque_change(self, event: rio.DropdownChangeEvent) -> None:
+        self.destaque = int(event.value) if event.value else None
+
+    def _build_figure(self, evolucao: EvolucaoClassificacao) -> matplotlib.figure.Figure:
+        # pyplot and numpy are only imported once a session actually opens this page
+        import matplotlib
+
+        # Figures are rendered to images on the server, never shown in a window
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        import numpy as np
+
+        figure, ax = plt.subplots(figsize=(10, 6))
+        datas = np.array(evolucao.datas, dtype="datetime64[D]")
+
+        for time_id, nome, posicoes in zip(evolucao.time_ids, evolucao.nomes, evolucao.posicoes):
+            # Dates without a snapshot are left as gaps
+            serie = np.where(posicoes > 0, posicoes, np.nan)
+            destacado = self.destaque is None or time_id == self.destaque
+            ax.plot(
+                datas,
+                serie,
+                label=nome if destacado else None,
+                linewidth=2 if destacado else 0.8,
+                alpha=1 if destacado else 0.25,
+            )
+
+        ax.invert_yaxis()
+        ax.set_yticks(range(1, len(evolucao.time_ids) + 1))
+        ax.set_ylabel("Posição")
+        ax.grid(alpha=0.3)
+        if self.destaque is not None:
+            ax.legend(loc="upper left")
+        figure.autofmt_xdate()
+        figure.tight_layout()
+        plt.close(figure)
+        return figure
+
+    def build(self) -> rio.Component:
+        if self.is_loading:
+            return rio.Column(
+                rio.Banner(
+                    self.banner_text,
+                    style=self.banner_style,
+                    margin_bottom=1,
+                ),
+                rio.ProgressCircle(),
+                align_y=0,
+                margin=3,
+            )
+
+        controls = [
+            rio.NumberInput(
+                value=self.selected_year,
+                label="Ano",
+                on_change=self.on_year_change,
+                minimum=2020,
+                maximum=datetime.now().year,
+                decimals=0,
+                thousands_separator=False,
+            )
+        ]
+        content: rio.Component = rio.Text("Nenhuma rodada registrada")
+
+        if self.evolucao and self.evolucao.datas:
+            controls.append(
+                rio.Dropdown(
+                    options={"Todos": ""}
+                    | {nome: str(time_id) for time_id, nome in zip(self.evolucao.time_ids, self.evolucao.nomes)},
+                    selected_value=str(self.destaque) if self.destaque else "",
+                    label="Destacar Time",
+                    on_change=self.on_destaque_change,
+                )
+            )
+            content = rio.Card(
+                rio.Plot(
+                    self._build_figure(self.evolucao),
+                    min_height=30,
+                    grow_x=True,
+                ),
+                margin=2,
+            )
+
+        return rio.Column(
+            rio.Banner(
+                self.banner_text,
+                style=self.banner_style,
+                margin_bottom=1,
+            ),
+            rio.Row(*controls, spacing=2, margin=2),
+            content,
+            align_y=0,
+            margin=3,
+        )
@@ -70,6 +70,42 @@ class MainPage(rio.Component):
                     ),
                     on_press=lambda: self.session.navigate_to("/classificacao"),
                 ),
+                # Confrontos Card
+                rio.Card(
+                    content=rio.Column(
+                        rio.Text(
+                            "Confrontos",
+                            style="heading2",
+                        ),
+                        rio.Text(
+                            "Ver Retrospecto",
+                            style="text",
+                        ),
+                        spacing=3,
+                        align_x=1,
+                        margin_left=1,
+                        margin_right=1,
+                    ),
+                    on_press=lambda: self.session.navigate_to("/confrontos"),
+                ),
+                # Evolução Card
+                rio.Card(
+                    content=rio.Column(
+                        rio.Text(
+                            "Evolução",
+                            style="heading2",
+                        ),
+                        rio.Text(
+                            "Posição por Rodada",
+                            style="text",
+                        ),
+                        spacing=3,
+                        align_x=1,
+                        margin_left=1,
+                        margin_right=1,
+                    ),
+                    on_press=lambda: self.session.navigate_to("/evolucao"),
+                ),
                 spacing=2,
                 align_x=0.5,
             ),
@@ -87,6 +123,14 @@ class MainPage(rio.Component):
                     "Classificação",
                     on_press=lambda: self.session.navigate_to("/classificacao"),
                 ),
+                rio.Button(
+                    "Confrontos",
+                    on_press=lambda: self.session.navigate_to("/confrontos"),
+                ),
+                rio.Button(
+                    "Evolução",
+                    on_press=lambda: self.session.navigate_to("/evolucao"),
+                ),
                 spacing=1,
                 align_x=0.5,
             ),
@@ -0,0 +1,78 @@
+"""Runs the app as several Rio worker processes on consecutive ports.
+
+Rio keeps every session in the memory of the process that served its page,
+so a single process puts all sessions on one event loop and one core. This
+starts `--workers` independent processes on `--base-port`, `--base-port + 1`,
+... and leaves spreading the sessions to a proxy with sticky routing (see
+`nginx/conf.d/frontend.conf`):
+
+    python -m frontend.serve --workers 4 --base-port 8001 --host 0.0.0.0
+
+Workers share cached API responses through the SQLite file in
+`FRONTEND_CACHE_PATH`, which defaults to a file in the temp directory.
+"""
+
+from __future__ import annotations
+import argparse
+import multiprocessing
+import os
+import signal
+import sys
+import tempfile
+import time
+from . import app
+
+
+def run_worker(host: str, port: int) -> None:
+    app.run_as_web_server(host=host, port=port, quiet=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--base-port", type=int, default=8001)
+    args = parser.parse_args()
+
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    # Set before spawning so every worker opens the same cache file
+    os.environ.setdefault("FRONTEND_CACHE_PATH", os.path.join(tempfile.gettempdir(), "frontend-cache.sqlite3"))
+
+    context = multiprocessing.get_context("spawn")
+    workers = {}
+    for index in range(args.workers):
+        port = args.base_port + index
+        worker = context.Process(target=run_worker, args=(args.host, port), name=f"rio-{port}")
+        worker.start()
+        workers[port] = worker
+    print(f"{args.workers} workers on {args.host}:{args.base_port}-{args.base_port + args.workers - 1}", flush=True)
+
+    stopping = False
+
+    def stop(signum, frame) -> None:
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    # A worker that dies takes its sessions with it; restart it so the port keeps answering
+    while not stopping:
+        time.sleep(1)
+        for port, worker in list(workers.items()):
+            if not worker.is_alive() and not stopping:
+                print(f"worker on port {port} exited with {worker.exitcode}, restarting", file=sys.stderr, flush=True)
+                worker = context.Process(target=run_worker, args=(args.host, port), name=f"rio-{port}")
+                worker.start()
+                workers[port] = worker
+
+    for worker in workers.values():
+        worker.terminate()
+    for worker in workers.values():
+        worker.join(timeout=10)
+
+
+if __name__ == "__main__":
+    main()
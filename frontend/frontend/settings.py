@@ -0,0 +1,9 @@
+from __future__ import annotations
+import os
+
+# Base URL of the Laravel API as seen from the frontend process
+API_URL = os.environ.get("API_URL", "http://host.docker.internal:80/api").rstrip("/")
+
+# SQLite file shared by every Rio worker for cached API responses. When unset,
+# each process keeps its own in-memory cache.
+CACHE_PATH = os.environ.get("FRONTEND_CACHE_PATH") or None
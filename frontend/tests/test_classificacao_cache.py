@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from frontend.Models.Classificacao import ClassificacaoAPI
+from frontend.Models.ClassificacaoCache import ClassificacaoCache, classificacao_cache
+from frontend.Models.Partida import PartidaAPI
+from frontend.Models.Time import TimeAPI
+
+
+@pytest.fixture
+def tabelas(monkeypatch) -> list[str]:
+    """Serves a standings table named after the number of requests so far"""
+    servidas: list[str] = []
+
+    async def get_classificacao(ano, data) -> list[str]:
+        await asyncio.sleep(0)
+        servidas.append(f"tabela {len(servidas) + 1}")
+        return [servidas[-1]]
+
+    monkeypatch.setattr(ClassificacaoAPI, "get_classificacao", staticmethod(get_classificacao))
+    return servidas
+
+
+@pytest.mark.parametrize("invalidate", [PartidaAPI._invalidate, TimeAPI._invalidate])
+def test_escrita_limpa_as_tabelas(tabelas, invalidate):
+    async def main() -> None:
+        classificacao_cache.clear()
+        assert await classificacao_cache.fetch(2024, "2024-05-01") == ["tabela 1"]
+        assert classificacao_cache.peek(2024, "2024-05-01")[0] == ["tabela 1"]
+
+        await invalidate()
+        assert classificacao_cache.peek(2024, "2024-05-01") == (None, False)
+        assert await classificacao_cache.fetch(2024, "2024-05-01") == ["tabela 2"]
+
+    asyncio.run(main())
+
+
+def test_clear_durante_fetch_nao_guarda_a_tabela_antiga(monkeypatch):
+    cache = ClassificacaoCache()
+    servidas = 0
+    liberar: asyncio.Event
+
+    async def get_classificacao(ano, data) -> list[str]:
+        nonlocal servidas
+        servidas += 1
+        numero = servidas
+        await liberar.wait()
+        return [f"tabela {numero}"]
+
+    monkeypatch.setattr(ClassificacaoAPI, "get_classificacao", staticmethod(get_classificacao))
+
+    async def main() -> None:
+        nonlocal liberar
+        liberar = asyncio.Event()
+        antiga = asyncio.create_task(cache.fetch(2024, "2024-05-01"))
+        while not servidas:
+            await asyncio.sleep(0)
+        cache.clear()
+        liberar.set()
+        assert await antiga == ["tabela 1"]
+        assert cache.peek(2024, "2024-05-01") == (None, False)
+        assert await cache.fetch(2024, "2024-05-01") == ["tabela 2"]
+
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+import asyncio
+from datetime import date
+
+import pytest
+import rio
+import rio.testing
+
+from frontend.Models.Partida import Partida, PartidaAPI
+from frontend.pages.crud_partida import PartidasPage
+
+
+@pytest.fixture
+def escritas(monkeypatch) -> list[str]:
+    """Serves one match to the page and records every write it sends instead of calling the API"""
+    chamadas: list[str] = []
+
+    async def get_all(time=None) -> list[Partida]:
+        return [
+            Partida(
+                id=7,
+                data=date(2024, 5, 1),
+                id_time_casa=1,
+                gols_time_casa=2,
+                id_time_visitante=2,
+                gols_time_visitante=0,
+                estadio="Arena",
+            )
+        ]
+
+    monkeypatch.setattr(PartidaAPI, "get_all", staticmethod(get_all))
+    for nome in ("create", "update", "delete"):
+
+        async def escrever(*args, nome=nome) -> None:
+            chamadas.append(nome)
+
+        monkeypatch.setattr(PartidaAPI, nome, staticmethod(escrever))
+    return chamadas
+
+
+def _cancelar_dialogo(abrir) -> PartidasPage:
+    """Opens the match dialog with `abrir` and presses its Cancelar button"""
+
+    async def main() -> PartidasPage:
+        async with rio.testing.TestClient(PartidasPage) as client:
+            await asyncio.sleep(0.05)
+            page = client.get_component(PartidasPage)
+            assert [partida.id for partida in page.partidas] == [7]
+
+            tarefa = asyncio.create_task(abrir(page))
+            await asyncio.sleep(0.05)
+            # Dialogs live outside the page's tree, so look through every component of the session
+            cancelar = next(
+                componente
+                for componente in list(client.session._weak_components_by_id.values())
+                if isinstance(componente, rio.Button) and componente.content == "Cancelar"
+            )
+            await cancelar.on_press()
+            await tarefa
+            # Gives any write the page queued the chance to run
+            await asyncio.sleep(0.05)
+            return page
+
+    return asyncio.run(main())
+
+
+def test_cancelar_nova_partida_nao_adiciona_nem_escreve(escritas):
+    page = _cancelar_dialogo(lambda page: page.on_spawn_dialog_add_new_partida())
+
+    assert [partida.id for partida in page.partidas] == [7]
+    assert page.banner_text == "Partida não foi adicionada"
+    assert escritas == []
+
+
+def test_cancelar_edicao_nao_escreve(escritas):
+    page = _cancelar_dialogo(lambda page: page.on_spawn_dialog_edit_partida(page.partidas[0], 0))
+
+    assert [partida.id for partida in page.partidas] == [7]
+    assert page.banner_text == "Partida não foi atualizada"
+    assert escritas == []
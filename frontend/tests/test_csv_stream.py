@@ -0,0 +1,51 @@
+import asyncio
+
+import httpx
+import pytest
+
+from frontend.Models.CsvStream import stream_csv
+
+COLUNAS = {"id": int, "nome": str, "pontos": int}
+
+
+@pytest.fixture
+def export(monkeypatch):
+    """Makes stream_csv read `corpo` in small chunks instead of calling the API"""
+    corpo: list[bytes] = []
+
+    async def enviar(request: httpx.Request) -> httpx.Response:
+        async def partes():
+            for inicio in range(0, len(corpo[0]), 7):
+                yield corpo[0][inicio : inicio + 7]
+
+        return httpx.Response(200, content=partes(), headers={"Content-Type": "text/csv"})
+
+    cliente = httpx.AsyncClient
+    monkeypatch.setattr(
+        httpx, "AsyncClient", lambda **kwargs: cliente(transport=httpx.MockTransport(enviar), **kwargs)
+    )
+
+    def ler(texto: str) -> list[dict]:
+        corpo[:] = [texto.encode()]
+
+        async def main() -> list[dict]:
+            return [linha async for linha in stream_csv("http://api/export", {}, COLUNAS, 5)]
+
+        return asyncio.run(main())
+
+    return ler
+
+
+def test_linhas_e_campos_com_aspas(export):
+    linhas = export('id,nome,pontos\n1,"Time, ""A""\nB",3\n2,,0\n3,C,1')
+    assert linhas == [
+        {"id": 1, "nome": 'Time, "A"\nB', "pontos": 3},
+        {"id": 2, "nome": None, "pontos": 0},
+        {"id": 3, "nome": "C", "pontos": 1},
+    ]
+
+
+@pytest.mark.parametrize("linha", ["2,B", "2,B,1,9"])
+def test_linha_com_numero_errado_de_campos(export, linha):
+    with pytest.raises(ValueError, match="Export row 2 has"):
+        export(f"id,nome,pontos\n1,A,3\n{linha}\n3,C,1\n")
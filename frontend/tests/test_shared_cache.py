@@ -0,0 +1,78 @@
+import asyncio
+import multiprocessing
+
+from frontend.Models.SharedCache import SharedCache
+
+CHAVE = "partidas:all"
+
+
+def _worker_leitor(path: str, lendo, escrito, resultado) -> None:
+    """Second Rio worker: starts a read, waits for the other worker's write, then finishes the read"""
+    # Imported here so the module-level cache of this process opens the shared file
+    from frontend.Models.BatchClient import BatchClient
+    from frontend.Models.SharedCache import cache
+
+    async def main() -> None:
+        assert cache.path == path
+        _, geracao = await cache.get(CHAVE)
+        lendo.set()
+        escrito.wait(10)
+        # The body this read got from the API predates the write
+        await cache.set(CHAVE, "antes da escrita", geracao)
+        headers = await BatchClient._headers()
+        resultado.put({"bypass": headers.get("X-Api-Escrita"), "valor": (await cache.get(CHAVE))[0]})
+
+    asyncio.run(main())
+
+
+def test_escrita_de_um_worker_vale_para_o_outro(tmp_path, monkeypatch):
+    path = str(tmp_path / "cache.sqlite3")
+    monkeypatch.setenv("FRONTEND_CACHE_PATH", path)
+    escritor = SharedCache(path)
+
+    async def preparar() -> None:
+        _, geracao = await escritor.get(CHAVE)
+        await escritor.set(CHAVE, "antes da escrita", geracao)
+        assert not await escritor.written_recently()
+
+    asyncio.run(preparar())
+
+    contexto = multiprocessing.get_context("spawn")
+    lendo, escrito, resultado = contexto.Event(), contexto.Event(), contexto.Queue()
+    leitor = contexto.Process(target=_worker_leitor, args=(path, lendo, escrito, resultado))
+    leitor.start()
+    try:
+        assert lendo.wait(30)
+        asyncio.run(escritor.invalidate("partidas:", "classificacao:"))
+        escrito.set()
+        visto_pelo_leitor = resultado.get(timeout=30)
+    finally:
+        leitor.join(30)
+
+    assert leitor.exitcode == 0
+    # The other worker skips the nginx micro-cache after this worker's write
+    assert visto_pelo_leitor["bypass"] == "1"
+    # and its read that started before the write does not put the old body back
+    assert visto_pelo_leitor["valor"] is None
+    assert asyncio.run(escritor.get(CHAVE))[0] is None
+
+
+def test_set_depois_de_invalidate_na_memoria():
+    cache = SharedCache()
+
+    async def main() -> None:
+        _, geracao = await cache.get(CHAVE)
+        await cache.invalidate("partidas:")
+        await cache.set(CHAVE, "antes da escrita", geracao)
+        assert (await cache.get(CHAVE))[0] is None
+        assert await cache.written_recently()
+
+        _, geracao = await cache.get(CHAVE)
+        await cache.set(CHAVE, "depois da escrita", geracao)
+        assert (await cache.get(CHAVE))[0] == "depois da escrita"
+        # Keys under other prefixes keep their generation
+        _, geracao = await cache.get("times:all")
+        await cache.set("times:all", "times", geracao)
+        assert (await cache.get("times:all"))[0] == "times"
+
+    asyncio.run(main())
@@ -0,0 +1,19 @@
+#!/bin/sh
+# Writes the servers of the rio_frontend upstream (nginx/conf.d/frontend.conf),
+# one per Rio worker started by `python -m frontend.serve --workers
+# $RIO_WORKERS`, on consecutive ports from 8001 like serve.py. Runs from the
+# image's entrypoint before nginx starts.
+set -eu
+
+workers="${RIO_WORKERS:-4}"
+base_port="${RIO_BASE_PORT:-8001}"
+output=/etc/nginx/rio/workers.conf
+
+mkdir -p "$(dirname "$output")"
+: > "$output"
+i=0
+while [ "$i" -lt "$workers" ]; do
+    echo "server frontend:$((base_port + i)) max_fails=1 fail_timeout=30s;" >> "$output"
+    i=$((i + 1))
+done
+echo "$0: $workers Rio workers from port $base_port"